@@ -12,6 +12,7 @@ from prettytable import PrettyTable
 
 from dbt_platform_helper.domain.versioning import PlatformHelperVersioning
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.click import ClickDocOptGroup
 
 YELLOW = "\033[93m"
@@ -30,8 +31,8 @@ def get_query_results(env, app, query_string, timeout):
         f"Showing status for app {app}",
         fg="green",
     )
-    logs_client = project_session.client("logs")
-    ecs_client = project_session.client("ecs")
+    logs_client = get_aws_client(project_session, "logs")
+    ecs_client = get_aws_client(project_session, "ecs")
 
     response = ecs_client.list_clusters()
 
@@ -5,6 +5,7 @@ from dbt_platform_helper.domain.versioning import PlatformHelperVersioning
 from dbt_platform_helper.platform_exception import PlatformException
 from dbt_platform_helper.providers.io import ClickIOProvider
 from dbt_platform_helper.providers.parameter_store import ParameterStore
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
 from dbt_platform_helper.utils.click import ClickDocOptGroup
 
@@ -19,7 +20,7 @@ def codebase():
 def prepare():
     """Sets up an application codebase for use within a DBT platform project."""
     try:
-        Codebase(ParameterStore(get_aws_session_or_abort().client("ssm"))).prepare()
+        Codebase(ParameterStore(get_aws_client(get_aws_session_or_abort(), "ssm"))).prepare()
     except PlatformException as err:
         ClickIOProvider().abort_with_error(str(err))
 
@@ -35,7 +36,9 @@ def prepare():
 def list(app, with_images):
     """List available codebases for the application."""
     try:
-        Codebase(ParameterStore(get_aws_session_or_abort().client("ssm"))).list(app, with_images)
+        Codebase(ParameterStore(get_aws_client(get_aws_session_or_abort(), "ssm"))).list(
+            app, with_images
+        )
     except PlatformException as err:
         ClickIOProvider().abort_with_error(str(err))
 
@@ -51,7 +54,7 @@ def list(app, with_images):
 def build(app, codebase, commit):
     """Trigger a CodePipeline pipeline based build."""
     try:
-        Codebase(ParameterStore(get_aws_session_or_abort().client("ssm"))).build(
+        Codebase(ParameterStore(get_aws_client(get_aws_session_or_abort(), "ssm"))).build(
             app, codebase, commit
         )
     except PlatformException as err:
@@ -86,7 +89,7 @@ def deploy(
 ):
 
     try:
-        Codebase(ParameterStore(get_aws_session_or_abort().client("ssm"))).deploy(
+        Codebase(ParameterStore(get_aws_client(get_aws_session_or_abort(), "ssm"))).deploy(
             app, env, codebase, commit, tag, branch
         )
     except PlatformException as err:
@@ -8,6 +8,7 @@ from dbt_platform_helper.providers.ecs import ECS
 from dbt_platform_helper.providers.io import ClickIOProvider
 from dbt_platform_helper.providers.secrets import Secrets
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.click import ClickDocOptCommand
 
 CONDUIT_ACCESS_OPTIONS = ["read", "write", "admin"]
@@ -23,28 +24,33 @@ CONDUIT_ACCESS_OPTIONS = ["read", "write", "admin"]
     type=click.Choice(CONDUIT_ACCESS_OPTIONS),
     help="Allow read, write or admin access to the database addons.",
 )
-def conduit(addon_name: str, app: str, env: str, access: str):
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Reload the application's environments and services from AWS instead of the local cache.",
+)
+def conduit(addon_name: str, app: str, env: str, access: str, refresh: bool):
     """Opens a shell for a given addon_name create a conduit connection to
     interact with postgres, opensearch or redis."""
     PlatformHelperVersioning().check_if_needs_update()
-    application = load_application(app=app, env=env)
+    application = load_application(app=app, env=env, use_topology_cache=True, refresh=refresh)
 
     try:
         secrets_provider: Secrets = Secrets(
-            application.environments[env].session.client("ssm"),
-            application.environments[env].session.client("secretsmanager"),
+            get_aws_client(application.environments[env].session, "ssm"),
+            get_aws_client(application.environments[env].session, "secretsmanager"),
             application.name,
             env,
         )
         cloudformation_provider: CloudFormation = CloudFormation(
-            application.environments[env].session.client("cloudformation"),
-            application.environments[env].session.client("iam"),
-            application.environments[env].session.client("ssm"),
+            get_aws_client(application.environments[env].session, "cloudformation"),
+            get_aws_client(application.environments[env].session, "iam"),
+            get_aws_client(application.environments[env].session, "ssm"),
         )
 
         ecs_provider: ECS = ECS(
-            application.environments[env].session.client("ecs"),
-            application.environments[env].session.client("ssm"),
+            get_aws_client(application.environments[env].session, "ecs"),
+            get_aws_client(application.environments[env].session, "ssm"),
             application.name,
             env,
         )
@@ -11,6 +11,7 @@ from dbt_platform_helper.providers.files import FileProvider
 from dbt_platform_helper.providers.io import ClickIOProvider
 from dbt_platform_helper.providers.kms import KMSProvider
 from dbt_platform_helper.providers.parameter_store import ParameterStore
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
 from dbt_platform_helper.utils.click import ClickDocOptGroup
 
@@ -25,7 +26,7 @@ def make_addons():
     """Generate addons CloudFormation for each environment."""
     try:
         session = get_aws_session_or_abort()
-        parameter_provider = ParameterStore(session.client("ssm"))
+        parameter_provider = ParameterStore(get_aws_client(session, "ssm"))
         config_provider = ConfigProvider(ConfigValidator())
         Copilot(
             config_provider,
@@ -0,0 +1,86 @@
+import click
+
+from dbt_platform_helper.providers.io import ClickIOProvider
+from dbt_platform_helper.utils.click import ClickDocOptGroup
+from dbt_platform_helper.utils.daemon import DEFAULT_IDLE_TIMEOUT_SECONDS
+from dbt_platform_helper.utils.daemon import get_daemon_socket_path
+from dbt_platform_helper.utils.daemon import get_daemon_status
+from dbt_platform_helper.utils.daemon import serve
+from dbt_platform_helper.utils.daemon import start_daemon
+from dbt_platform_helper.utils.daemon import stop_daemon
+
+
+@click.group(cls=ClickDocOptGroup)
+def daemon():
+    """
+    Manage a warm platform-helper process which other platform-helper commands
+    are handed to while it is running.
+
+    The socket it listens on can be set with the $PLATFORM_HELPER_DAEMON_SOCKET
+    environment variable. Set $PLATFORM_HELPER_NO_DAEMON to always run commands
+    in their own process.
+    """
+
+
+@daemon.command()
+@click.option(
+    "--idle-timeout",
+    type=int,
+    default=DEFAULT_IDLE_TIMEOUT_SECONDS,
+    show_default=True,
+    help="Stop the daemon after this many seconds without a command.",
+)
+@click.option(
+    "--foreground",
+    is_flag=True,
+    default=False,
+    help="Run the daemon in this process rather than in the background.",
+)
+def start(idle_timeout: int, foreground: bool):
+    """Start the daemon."""
+    io = ClickIOProvider()
+    socket_path = get_daemon_socket_path()
+
+    status = get_daemon_status(socket_path)
+    if status:
+        io.info(f"The daemon is already running with pid {status['pid']} on {socket_path}")
+        return
+
+    if foreground:
+        io.info(f"Starting the daemon on {socket_path}")
+        serve(str(socket_path), idle_timeout)
+        return
+
+    status = start_daemon(socket_path, idle_timeout)
+    if not status:
+        io.abort_with_error(f"The daemon did not start listening on {socket_path}")
+
+    io.info(f"Started the daemon with pid {status['pid']} on {socket_path}", fg="green")
+
+
+@daemon.command()
+def stop():
+    """Stop the daemon."""
+    io = ClickIOProvider()
+
+    if stop_daemon():
+        io.info("Stopped the daemon", fg="green")
+    else:
+        io.info("The daemon is not running")
+
+
+@daemon.command()
+def status():
+    """Show whether the daemon is running and what it has cached."""
+    io = ClickIOProvider()
+    status = get_daemon_status()
+
+    if not status:
+        io.info("The daemon is not running")
+        return
+
+    io.info(f"The daemon is running with pid {status['pid']} on {get_daemon_socket_path()}")
+    io.info(f"Uptime: {status['uptime']}s")
+    io.info(f"Commands run: {status['commands_run']}")
+    io.info(f"AWS profiles: {', '.join(status['aws_profiles']) or 'none'}")
+    io.info(f"Applications: {', '.join(status['applications']) or 'none'}")
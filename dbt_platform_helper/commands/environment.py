@@ -15,6 +15,7 @@ from dbt_platform_helper.providers.io import ClickIOProvider
 from dbt_platform_helper.providers.terraform_manifest import TerraformManifestProvider
 from dbt_platform_helper.providers.vpc import VpcProvider
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
 from dbt_platform_helper.utils.click import ClickDocOptGroup
 
@@ -77,7 +78,7 @@ def generate(name):
         session = get_aws_session_or_abort()
         config_provider = ConfigProvider(ConfigValidator())
         vpc_provider = VpcProvider(session)
-        cloudformation_provider = CloudFormation(session.client("cloudformation"))
+        cloudformation_provider = CloudFormation(get_aws_client(session, "cloudformation"))
 
         CopilotEnvironment(
             config_provider, vpc_provider, cloudformation_provider, session
@@ -4,6 +4,7 @@ from dbt_platform_helper.domain.migrate_job import NewScheduleProvider
 from dbt_platform_helper.domain.migrate_job import OldScheduleProvider
 from dbt_platform_helper.domain.migrate_job import ScheduleMigrator
 from dbt_platform_helper.domain.service import ServiceManager
+from dbt_platform_helper.domain.startup_profiler import StartupProfiler
 from dbt_platform_helper.domain.update_alb_rules import UpdateALBRules
 from dbt_platform_helper.domain.versioning import PlatformHelperVersioning
 from dbt_platform_helper.platform_exception import PlatformException
@@ -15,6 +16,7 @@ from dbt_platform_helper.providers.io import ClickIOProvider
 from dbt_platform_helper.providers.logs import LogsProvider
 from dbt_platform_helper.providers.s3 import S3Provider
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
 from dbt_platform_helper.utils.click import ClickDocOptGroup
 
@@ -51,8 +53,8 @@ def migrate_job(name, env, revert):
         application_name = config.get("application", "")
         application = load_application(app=application_name, env=env)
 
-        event_client = application.environments[env].session.client("events")
-        scheduler_client = application.environments[env].session.client("scheduler")
+        event_client = get_aws_client(application.environments[env].session, "events")
+        scheduler_client = get_aws_client(application.environments[env].session, "scheduler")
 
         migrator = ScheduleMigrator(
             application_name,
@@ -80,6 +82,27 @@ def migrate_service_manifests():
         click_io.abort_with_error(str(error))
 
 
+@internal.command(context_settings={"ignore_unknown_options": True})
+@click.option(
+    "--top",
+    type=int,
+    default=20,
+    show_default=True,
+    help="The number of entries to show in each section of the report.",
+)
+@click.argument("command", nargs=-1, type=click.UNPROCESSED, required=True)
+def profile_startup(top, command):
+    """Run a platform-helper command in a fresh interpreter and report module
+    import costs, provider construction costs and the latency of the first AWS
+    call."""
+    click_io = ClickIOProvider()
+
+    try:
+        StartupProfiler(io=click_io).profile(list(command), top=top)
+    except PlatformException as error:
+        click_io.abort_with_error(str(error))
+
+
 @internal.group(cls=ClickDocOptGroup)
 def service():
     """Subgroup for 'internal service' commands."""
@@ -108,11 +131,13 @@ def deploy(name, env, image_tag):
         application_name = config.get("application", "")
         application = load_application(app=application_name, env=env)
 
-        ecs_client = application.environments[env].session.client("ecs")
-        ssm_client = application.environments[env].session.client("ssm")
-        s3_client = application.environments[env].session.client("s3")
-        logs_client = application.environments[env].session.client("logs")
-        autoscaling_client = application.environments[env].session.client("application-autoscaling")
+        ecs_client = get_aws_client(application.environments[env].session, "ecs")
+        ssm_client = get_aws_client(application.environments[env].session, "ssm")
+        s3_client = get_aws_client(application.environments[env].session, "s3")
+        logs_client = get_aws_client(application.environments[env].session, "logs")
+        autoscaling_client = get_aws_client(
+            application.environments[env].session, "application-autoscaling"
+        )
 
         ecs_provider = ECS(
             ecs_client=ecs_client,
@@ -175,13 +200,54 @@ def alb():
 
 
 @alb.command()
-@click.option("--env", type=str, required=True)
-def update_rules(env: str):
-    """Update alb rules based on service-deployment-mode for a given
-    environment."""
+@click.option(
+    "--env",
+    type=str,
+    multiple=True,
+    help="Environment to update. Repeat to update several environments concurrently.",
+)
+@click.option(
+    "--all",
+    "all_environments",
+    is_flag=True,
+    default=False,
+    help="Update every environment in the platform config concurrently.",
+)
+@click.option(
+    "--plan",
+    is_flag=True,
+    default=False,
+    help="Show the rule changes and the number of ELB API calls they need without applying them.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Finish an update which was interrupted part way through.",
+)
+@click.option(
+    "--rollback",
+    is_flag=True,
+    default=False,
+    help="Undo the changes made by an update which was interrupted part way through.",
+)
+def update_rules(env: tuple[str], all_environments: bool, plan: bool, resume: bool, rollback: bool):
+    """Update alb rules based on service-deployment-mode for the given
+    environments."""
     try:
+        if plan + resume + rollback > 1:
+            raise PlatformException("Only one of --plan, --resume and --rollback can be used.")
+        if bool(env) == all_environments:
+            raise PlatformException("Use either --env or --all.")
         session = get_aws_session_or_abort()
         update_aws = UpdateALBRules(session)
-        update_aws.update_alb_rules(environment=env)
+        if len(env) == 1:
+            update_aws.update_alb_rules(
+                environment=env[0], plan=plan, resume=resume, rollback=rollback
+            )
+        else:
+            update_aws.update_alb_rules_for_environments(
+                list(env), plan=plan, resume=resume, rollback=rollback
+            )
     except PlatformException as err:
         ClickIOProvider().abort_with_error(str(err))
@@ -10,6 +10,7 @@ from dbt_platform_helper.utils.application import (
     ApplicationEnvironmentNotFoundException,
 )
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.click import ClickDocOptGroup
 
 
@@ -28,14 +29,19 @@ def job():
     help="Wait for the execution to finish and report it's final status",
     is_flag=True,
 )
-def run(app: str, env: str, name: str, follow: bool):
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Reload the application's environments and services from AWS instead of the local cache.",
+)
+def run(app: str, env: str, name: str, follow: bool, refresh: bool):
     """Runs a scheduled job on demand."""
 
     try:
-        application = load_application(app=app, env=env)
+        application = load_application(app=app, env=env, use_topology_cache=True, refresh=refresh)
 
         try:
-            sfn_client = application.environments[env].session.client("stepfunctions")
+            sfn_client = get_aws_client(application.environments[env].session, "stepfunctions")
             account_id = application.environments[env].account_id
         except KeyError:
             raise ApplicationEnvironmentNotFoundException(app, env)
@@ -50,15 +56,20 @@ def run(app: str, env: str, name: str, follow: bool):
 @job.command()
 @click.option("--app", "-a", help="Application name", required=True)
 @click.option("--env", "-e", help="Environment name", required=True)
-def ls(app: str, env: str):
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Reload the application's environments and services from AWS instead of the local cache.",
+)
+def ls(app: str, env: str, refresh: bool):
     """Lists deployed scheduled jobs."""
     io = ClickIOProvider()
 
     try:
-        application = load_application(app=app, env=env)
+        application = load_application(app=app, env=env, use_topology_cache=True, refresh=refresh)
 
         try:
-            ssm_client = application.environments[env].session.client("ssm")
+            ssm_client = get_aws_client(application.environments[env].session, "ssm")
         except KeyError:
             raise ApplicationEnvironmentNotFoundException(app, env)
 
@@ -51,5 +51,57 @@ def copy(app, source, target):
         ClickIOProvider().abort_with_error(str(err))
 
 
+@secrets.command()
+@click.option("--app", help="Application name.", required=True)
+@click.option(
+    "--envs",
+    help="Comma separated environments to compare, e.g. dev,staging,prod.",
+    required=True,
+)
+def diff(app, envs):
+    """Compare secrets across environments without showing their values."""
+
+    try:
+        Secrets().diff(app, [env.strip() for env in envs.split(",") if env.strip()])
+    except PlatformException as err:
+        ClickIOProvider().abort_with_error(str(err))
+
+
+@secrets.command()
+@click.option("--app", help="Application name.", required=True)
+@click.option("--env", help="Environment to export secrets from.", required=True)
+@click.option(
+    "--output",
+    help="Path of the encrypted bundle to write.",
+    required=True,
+    type=click.Path(dir_okay=False),
+)
+def export(app, env, output):
+    """Export an environment's secrets to a passphrase encrypted bundle."""
+
+    try:
+        Secrets().export_secrets(app, env, output)
+    except PlatformException as err:
+        ClickIOProvider().abort_with_error(str(err))
+
+
+@secrets.command(name="import")
+@click.option("--app", help="Application name.", required=True)
+@click.option("--env", help="Environment to import secrets into.", required=True)
+@click.option(
+    "--bundle",
+    help="Path of an encrypted bundle written by `secrets export`.",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+)
+def import_(app, env, bundle):
+    """Create the secrets from an exported bundle in an environment."""
+
+    try:
+        Secrets().import_secrets(app, env, bundle)
+    except PlatformException as err:
+        ClickIOProvider().abort_with_error(str(err))
+
+
 if __name__ == "__main__":
     secrets()
@@ -10,6 +10,7 @@ from dbt_platform_helper.utils.application import (
     ApplicationEnvironmentNotFoundException,
 )
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.click import ClickDocOptGroup
 
 
@@ -36,15 +37,20 @@ def service():
     required=False,
 )
 @click.option("--task-id", help="Optional. ID of the task you want to exec into.", required=False)
-def exec(app: str, env: str, name: str, command: str, container: str, task_id: str):
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Reload the application's environments and services from AWS instead of the local cache.",
+)
+def exec(app: str, env: str, name: str, command: str, container: str, task_id: str, refresh: bool):
     """Opens a shell for a given container."""
 
     try:
-        application = load_application(app=app, env=env)
+        application = load_application(app=app, env=env, use_topology_cache=True, refresh=refresh)
 
         # TODO This is a workaround until DBTP-2754 is fixed
         try:
-            ecs_client = application.environments[env].session.client("ecs")
+            ecs_client = get_aws_client(application.environments[env].session, "ecs")
         except KeyError:
             raise ApplicationEnvironmentNotFoundException(app, env)
 
@@ -65,15 +71,20 @@ def exec(app: str, env: str, name: str, command: str, container: str, task_id: s
 @service.command()
 @click.option("--app", "-a", help="Application name", required=True)
 @click.option("--env", "-e", help="Environment name", required=True)
-def ls(app: str, env: str):
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Reload the application's environments and services from AWS instead of the local cache.",
+)
+def ls(app: str, env: str, refresh: bool):
     """Lists deployed services for the applicaiton and environment."""
     io = ClickIOProvider()
     try:
-        application = load_application(app=app, env=env)
+        application = load_application(app=app, env=env, use_topology_cache=True, refresh=refresh)
 
         # TODO This is a workaround until DBTP-2754 is fixed
         try:
-            ssm_client = application.environments[env].session.client("ssm")
+            ssm_client = get_aws_client(application.environments[env].session, "ssm")
         except KeyError:
             raise ApplicationEnvironmentNotFoundException(app, env)
 
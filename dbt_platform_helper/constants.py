@@ -16,6 +16,8 @@ CODEBASE_PIPELINE_MODULE_PATH = (
 )
 EXTENSIONS_MODULE_PATH = f"{PLATFORM_TOOLS_REPO_SSH_SOURCE}/terraform/extensions?depth=1&ref="
 PLATFORM_HELPER_VERSION_OVERRIDE_KEY = "PLATFORM_HELPER_VERSION_OVERRIDE"
+PLATFORM_HELPER_DAEMON_SOCKET_ENV_VAR = "PLATFORM_HELPER_DAEMON_SOCKET"
+PLATFORM_HELPER_NO_DAEMON_ENV_VAR = "PLATFORM_HELPER_NO_DAEMON"
 TERRAFORM_EXTENSIONS_MODULE_SOURCE_OVERRIDE_ENV_VAR = "TERRAFORM_EXTENSIONS_MODULE_SOURCE_OVERRIDE"
 TERRAFORM_ENVIRONMENT_PIPELINES_MODULE_SOURCE_OVERRIDE_ENV_VAR = (
     "TERRAFORM_ENVIRONMENT_PIPELINES_MODULE_SOURCE_OVERRIDE"
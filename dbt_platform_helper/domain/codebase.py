@@ -18,6 +18,7 @@ from dbt_platform_helper.utils.application import (
     ApplicationEnvironmentNotFoundException,
 )
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
 from dbt_platform_helper.utils.aws import get_build_url_from_arn
 from dbt_platform_helper.utils.aws import get_build_url_from_pipeline_execution_id
@@ -33,10 +34,10 @@ class Codebase:
     def __init__(
         self,
         parameter_provider: ParameterStore,
-        io: ClickIOProvider = ClickIOProvider(),
+        io: ClickIOProvider = None,
         load_application: Callable[[str], Application] = load_application,
         get_aws_session_or_abort: Callable[[str], Session] = get_aws_session_or_abort,
-        ecr_provider: ECRProvider = ECRProvider(),
+        ecr_provider: ECRProvider = None,
         get_image_build_project: Callable[[str], str] = get_image_build_project,
         get_manual_release_pipeline: Callable[[str], str] = get_manual_release_pipeline,
         get_build_url_from_arn: Callable[[str], str] = get_build_url_from_arn,
@@ -51,10 +52,10 @@ class Codebase:
         run_subprocess: Callable[[str], str] = subprocess.run,
     ):
         self.parameter_provider = parameter_provider
-        self.io = io
+        self.io = io or ClickIOProvider()
         self.load_application = load_application
         self.get_aws_session_or_abort = get_aws_session_or_abort
-        self.ecr_provider = ecr_provider
+        self.ecr_provider = ecr_provider or ECRProvider()
         self.get_image_build_project = get_image_build_project
         self.get_manual_release_pipeline = get_manual_release_pipeline
         self.get_build_url_from_arn = get_build_url_from_arn
@@ -129,7 +130,7 @@ class Codebase:
         session = self.get_aws_session_or_abort()
         self.load_application(app, default_session=session)
 
-        codebuild_client = session.client("codebuild")
+        codebuild_client = get_aws_client(session, "codebuild")
         project_name = self.get_image_build_project(codebuild_client, app, codebase)
         build_url = self.__start_build_with_confirmation(
             codebuild_client,
@@ -177,7 +178,7 @@ class Codebase:
             application.name, codebase, image_ref
         )
 
-        codepipeline_client = session.client("codepipeline")
+        codepipeline_client = get_aws_client(session, "codepipeline")
         pipeline_name = self.get_manual_release_pipeline(codepipeline_client, app, codebase)
 
         corresponding_to = ""
@@ -233,8 +234,8 @@ class Codebase:
         """List available codebases for the application."""
         session = self.get_aws_session_or_abort()
         application = self.load_application(app, session)
-        ecr_client = session.client("ecr")
-        codebases = self.__get_codebases(application, session.client("ssm"))
+        ecr_client = get_aws_client(session, "ecr")
+        codebases = self.__get_codebases(application, get_aws_client(session, "ssm"))
 
         self.io.info("The following codebases are available:")
 
@@ -252,7 +253,7 @@ class Codebase:
 
     def __get_codebases(self, application, ssm_client):
         parameters = self.parameter_provider.get_ssm_parameters_by_path(
-            f"/copilot/applications/{application.name}/codebases"
+            f"/copilot/applications/{application.name}/codebases", with_decryption=False
         )
         codebases = [json.loads(p["Value"]) for p in parameters]
 
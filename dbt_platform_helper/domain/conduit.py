@@ -14,6 +14,7 @@ from dbt_platform_helper.providers.io import ClickIOProvider
 from dbt_platform_helper.providers.secrets import Secrets
 from dbt_platform_helper.providers.vpc import VpcProvider
 from dbt_platform_helper.utils.application import Application
+from dbt_platform_helper.utils.aws import get_aws_client
 
 
 class ConduitECSStrategy(ABC):
@@ -292,7 +293,7 @@ class Conduit:
         secrets_provider: Secrets,
         cloudformation_provider: CloudFormation,
         ecs_provider: ECS,
-        io: ClickIOProvider = ClickIOProvider(),
+        io: ClickIOProvider = None,
         vpc_provider=VpcProvider,
         strategy_factory: Optional[ConduitStrategyFactory] = None,
     ):
@@ -301,7 +302,7 @@ class Conduit:
         self.secrets_provider = secrets_provider
         self.cloudformation_provider = cloudformation_provider
         self.ecs_provider = ecs_provider
-        self.io = io
+        self.io = io or ClickIOProvider()
         self.vpc_provider = vpc_provider
         self.strategy_factory = strategy_factory or ConduitStrategyFactory()
 
@@ -372,7 +373,7 @@ class Conduit:
 
     def _initialise_clients(self, env):
         return {
-            "ecs": self.application.environments[env].session.client("ecs"),
-            "iam": self.application.environments[env].session.client("iam"),
-            "ssm": self.application.environments[env].session.client("ssm"),
+            "ecs": get_aws_client(self.application.environments[env].session, "ecs"),
+            "iam": get_aws_client(self.application.environments[env].session, "iam"),
+            "ssm": get_aws_client(self.application.environments[env].session, "ssm"),
         }
@@ -65,23 +65,23 @@ class NoPlatformConfigException(PlatformException):
 class Config:
     def __init__(
         self,
-        io: ClickIOProvider = ClickIOProvider(),
-        platform_helper_versioning: PlatformHelperVersioning = PlatformHelperVersioning(),
-        aws_versioning: AWSVersioning = AWSVersioning(),
-        copilot_versioning: CopilotVersioning = CopilotVersioning(),
+        io: ClickIOProvider = None,
+        platform_helper_versioning: PlatformHelperVersioning = None,
+        aws_versioning: AWSVersioning = None,
+        copilot_versioning: CopilotVersioning = None,
         sso: SSOAuthProvider = None,
-        config_provider: ConfigProvider = ConfigProvider(),
-        migrator: Migrator = Migrator(ALL_MIGRATIONS, io_provider=ClickIOProvider()),
+        config_provider: ConfigProvider = None,
+        migrator: Migrator = None,
     ):
         self.oidc_app = None
-        self.io = io
-        self.platform_helper_versioning = platform_helper_versioning
-        self.aws_versioning = aws_versioning
-        self.copilot_versioning = copilot_versioning
+        self.io = io or ClickIOProvider()
+        self.platform_helper_versioning = platform_helper_versioning or PlatformHelperVersioning()
+        self.aws_versioning = aws_versioning or AWSVersioning()
+        self.copilot_versioning = copilot_versioning or CopilotVersioning()
         self.sso = sso or SSOAuthProvider()
         self.SSO_START_URL = "https://uktrade.awsapps.com/start"
-        self.config_provider = config_provider
-        self.migrator = migrator
+        self.config_provider = config_provider or ConfigProvider()
+        self.migrator = migrator or Migrator(ALL_MIGRATIONS, io_provider=ClickIOProvider())
 
     def validate(self):
         if not Path("copilot").exists() and not Path("services").exists():
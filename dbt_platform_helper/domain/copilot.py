@@ -19,6 +19,7 @@ from dbt_platform_helper.providers.parameter_store import ParameterStore
 from dbt_platform_helper.providers.yaml_file import YamlFileProvider
 from dbt_platform_helper.utils.application import get_application_name
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.template import ADDON_TEMPLATE_MAP
 from dbt_platform_helper.utils.template import camel_case
 from dbt_platform_helper.utils.template import setup_templates
@@ -45,8 +46,8 @@ class Copilot:
         copilot_templating: CopilotTemplating,
         kms_provider: KMSProvider,
         session,
-        io: ClickIOProvider = ClickIOProvider(),
-        plan_manager: PlanLoader = PlanLoader(),
+        io: ClickIOProvider = None,
+        plan_manager: PlanLoader = None,
         yaml_file_provider: YamlFileProvider = YamlFileProvider,
     ):
         self.config_provider = config_provider
@@ -54,8 +55,8 @@ class Copilot:
         self.file_provider = file_provider
         self.copilot_templating = copilot_templating
         self.kms_provider = kms_provider
-        self.io = io
-        self.plan_manager = plan_manager
+        self.io = io or ClickIOProvider()
+        self.plan_manager = plan_manager or PlanLoader()
         self.yaml_file_provider = yaml_file_provider
         self.session = session
 
@@ -275,12 +276,12 @@ class Copilot:
         overrides_file.write_text(templates.get_template("svc/overrides/cfn.patches.yml").render())
 
     def _get_s3_kms_alias_arns(self, application_name, config):
-        application = load_application(application_name, self.session)
+        application = load_application(application_name, self.session, prewarm_sessions=True)
         arns = {}
 
         for environment_name in application.environments:
             kms_provider = self.kms_provider(
-                application.environments[environment_name].session.client("kms")
+                get_aws_client(application.environments[environment_name].session, "kms")
             )
 
             if environment_name not in config:
@@ -27,7 +27,7 @@ class CopilotEnvironment:
         cloudformation_provider: CloudFormation = None,
         session: Session = None,  # TODO: DBTP-1954: - this is a temporary fix, will fall away once _get_environment_vpc is updated.
         copilot_templating=None,
-        io: ClickIOProvider = ClickIOProvider(),
+        io: ClickIOProvider = None,
         load_balancer_provider: LoadBalancerProvider = LoadBalancerProvider,
     ):
         self.config_provider = config_provider
@@ -35,7 +35,7 @@ class CopilotEnvironment:
         self.copilot_templating = copilot_templating or CopilotTemplating(
             file_provider=FileProvider(),
         )
-        self.io = io
+        self.io = io or ClickIOProvider()
         self.session = session
         self.load_balancer = load_balancer_provider(session)
         self.cloudformation_provider = cloudformation_provider
@@ -132,14 +132,14 @@ class CopilotEnvironment:
 class CopilotTemplating:
     def __init__(
         self,
-        file_provider: FileProvider = FileProvider(),
-        io: ClickIOProvider = ClickIOProvider(),
+        file_provider: FileProvider = None,
+        io: ClickIOProvider = None,
         # TODO: DBTP-1958: file_provider can be moved up a layer.  File writing can be the responsibility of CopilotEnvironment generate
         # Or we align with PlatformTerraformManifestGenerator and rename from Templating to reflect the file writing responsibility
     ):
-        self.file_provider = file_provider
+        self.file_provider = file_provider or FileProvider()
         self.templates = setup_templates()
-        self.io = io
+        self.io = io or ClickIOProvider()
 
     def generate_copilot_environment_manifest(
         self, environment_name: str, vpc: Vpc, cert_arn: str
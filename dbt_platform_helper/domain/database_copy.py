@@ -17,6 +17,7 @@ from dbt_platform_helper.providers.vpc import VpcProviderException
 from dbt_platform_helper.utils.application import Application
 from dbt_platform_helper.utils.application import ApplicationNotFoundException
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_connection_string
 from dbt_platform_helper.utils.aws import wait_for_log_group_to_exist
 
@@ -34,16 +35,16 @@ class DatabaseCopy:
             [Session, str, str, str, Callable], str
         ] = get_connection_string,
         maintenance_page: Callable[[str, str, list[str], str, str], None] = MaintenancePage,
-        io: ClickIOProvider = ClickIOProvider(),
-        config_provider: ConfigProvider = ConfigProvider(ConfigValidator()),
+        io: ClickIOProvider = None,
+        config_provider: ConfigProvider = None,
     ):
         self.app = app
         self.database = database
         self.auto_approve = auto_approve
         self.vpc_provider = vpc_provider
         self.db_connection_string = db_connection_string
-        self.io = io
-        self.config_provider = config_provider
+        self.io = io or ClickIOProvider()
+        self.config_provider = config_provider or ConfigProvider(ConfigValidator())
 
         if not self.app:
             if not Path(PLATFORM_CONFIG_FILE).exists():
@@ -137,7 +138,7 @@ class DatabaseCopy:
         db_connection_string: str,
         filename: str,
     ) -> str:
-        client = session.client("ecs")
+        client = get_aws_client(session, "ecs")
         action = "dump" if is_dump else "load"
         dump_file_name = filename if filename else "data_dump"
         cluster_name = self.get_cluster_for_env(client, env)
@@ -215,7 +216,7 @@ class DatabaseCopy:
         log_group_arn = f"arn:aws:logs:eu-west-2:{self.account_id(env)}:log-group:{log_group_name}"
         self.io.warn(f"Tailing {log_group_name} logs")
         session = self.application.environments[env].session
-        log_client = session.client("logs")
+        log_client = get_aws_client(session, "logs")
         wait_for_log_group_to_exist(log_client, log_group_name)
         response = log_client.start_live_tail(logGroupIdentifiers=[log_group_arn])
 
@@ -18,11 +18,11 @@ class JobManager:
         self,
         job_runner,
         service_repository: ServiceRepository = None,
-        io: ClickIOProvider = ClickIOProvider(),
+        io: ClickIOProvider = None,
     ):
         self.job_runner = job_runner
         self.service_repository = service_repository
-        self.io = io
+        self.io = io or ClickIOProvider()
 
     def start_execution(self, app: str, env: str, name: str, follow: bool):
 
@@ -22,6 +22,7 @@ from dbt_platform_helper.utils.application import (
 from dbt_platform_helper.utils.application import ApplicationServiceNotFoundException
 from dbt_platform_helper.utils.application import Environment
 from dbt_platform_helper.utils.application import Service
+from dbt_platform_helper.utils.aws import get_aws_client
 
 
 class MaintenancePageException(PlatformException):
@@ -53,7 +54,7 @@ class FailedToActivateMaintenancePageException(MaintenancePageException):
 def get_env_ips(vpc: str, application_environment: Environment) -> list[str]:
     account_name = f"{application_environment.session.profile_name}-vpc"
     vpc_name = vpc if vpc else account_name
-    ssm_client = application_environment.session.client("ssm")
+    ssm_client = get_aws_client(application_environment.session, "ssm")
 
     try:
         param_value = ssm_client.get_parameter(Name=f"/{vpc_name}/EGRESS_IPS")["Parameter"]["Value"]
@@ -68,12 +69,12 @@ class MaintenancePage:
     def __init__(
         self,
         application: Application,
-        io: ClickIOProvider = ClickIOProvider(),
+        io: ClickIOProvider = None,
         load_balancer_provider: LoadBalancerProvider = LoadBalancerProvider,
         get_env_ips: Callable[[str, Environment], list[str]] = get_env_ips,
     ):
         self.application = application
-        self.io = io
+        self.io = io or ClickIOProvider()
         self.load_balancer_provider = load_balancer_provider  # TODO: DBTP-1962: requires session from environment in application object which is only known during method execution
         self.load_balancer: LoadBalancerProvider = None
         self.get_env_ips = get_env_ips
@@ -27,22 +27,26 @@ class Pipelines:
     def __init__(
         self,
         config_provider: ConfigProvider,
-        terraform_manifest_provider: TerraformManifestProvider = TerraformManifestProvider(),
-        ecr_provider: ECRProvider = ECRProvider(),
+        terraform_manifest_provider: TerraformManifestProvider = None,
+        ecr_provider: ECRProvider = None,
         get_git_remote: Callable[[], str] = git_remote,
-        io: ClickIOProvider = ClickIOProvider(),
-        file_provider: FileProvider = FileProvider(),
+        io: ClickIOProvider = None,
+        file_provider: FileProvider = None,
         platform_helper_versioning: PlatformHelperVersioning = None,
-        environment_variable_provider: EnvironmentVariableProvider = EnvironmentVariableProvider(),
+        environment_variable_provider: EnvironmentVariableProvider = None,
     ):
         self.config_provider = config_provider
         self.get_git_remote = get_git_remote
-        self.terraform_manifest_provider = terraform_manifest_provider
-        self.ecr_provider = ecr_provider
-        self.io = io
-        self.file_provider = file_provider
+        self.terraform_manifest_provider = (
+            terraform_manifest_provider or TerraformManifestProvider()
+        )
+        self.ecr_provider = ecr_provider or ECRProvider()
+        self.io = io or ClickIOProvider()
+        self.file_provider = file_provider or FileProvider()
         self.platform_helper_versioning = platform_helper_versioning
-        self.environment_variable_provider = environment_variable_provider
+        self.environment_variable_provider = (
+            environment_variable_provider or EnvironmentVariableProvider()
+        )
 
     def _map_environment_pipeline_accounts(self, platform_config) -> list[tuple[str, str]]:
         environment_pipelines_config = platform_config[ENVIRONMENT_PIPELINES_KEY]
@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 
 from dbt_platform_helper.providers.yaml_file import YamlFileProvider
@@ -39,3 +40,10 @@ class PlanLoader:
     def get_plan_names(self, extension):
         plans = self.load()
         return list(plans[extension].keys())
+
+
+@cache
+def get_plan_loader() -> PlanLoader:
+    """Return the PlanLoader shared by the config schemas, created on first use
+    so that importing them does no work."""
+    return PlanLoader()
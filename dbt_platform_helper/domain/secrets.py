@@ -1,12 +1,43 @@
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+
 import botocore
+from prettytable import PrettyTable
 
 from dbt_platform_helper.constants import MANAGED_BY_PLATFORM
 from dbt_platform_helper.constants import MANAGED_BY_PLATFORM_TERRAFORM
 from dbt_platform_helper.platform_exception import PlatformException
+from dbt_platform_helper.providers.encrypted_bundle import EncryptedBundleProvider
 from dbt_platform_helper.providers.io import ClickIOProvider
 from dbt_platform_helper.providers.parameter_store import Parameter
 from dbt_platform_helper.providers.parameter_store import ParameterStore
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_aws_client
+from dbt_platform_helper.utils.aws import simulate_principal_policy
+
+SECRETS_MAX_WORKERS = 8
+
+
+@dataclass
+class SecretsDiff:
+    """Secrets compared against what already exists in the target
+    environment."""
+
+    missing: list[Parameter] = field(default_factory=list)
+    changed: list[Parameter] = field(default_factory=list)
+    identical: list[Parameter] = field(default_factory=list)
+
+
+@dataclass
+class SecretsCopyResult:
+    copied: int
+    already_existed: int
+    identical: int
+    skipped: int
 
 
 class Secrets:
@@ -14,49 +45,25 @@ class Secrets:
     def __init__(
         self,
         load_application=load_application,
-        io: ClickIOProvider = ClickIOProvider(),
+        io: ClickIOProvider = None,
         parameter_store_provider: ParameterStore = ParameterStore,
+        bundle_provider: EncryptedBundleProvider = None,
     ):
         self.load_application_fn = load_application
         self.application = None
-        self.io = io
+        self.io = io or ClickIOProvider()
         self.parameter_store_provider: ParameterStore = parameter_store_provider
+        self.bundle_provider = bundle_provider or EncryptedBundleProvider()
 
     def _check_ssm_write_access(self, accounts):
         """Check access."""
-        no_access = []
-        for account, session in accounts.items():
-            sts = session.client("sts")
-            iam = session.client("iam")
-
-            sts_arn = sts.get_caller_identity()["Arn"]
-            role_name = sts_arn.split("/")[1]
-
-            role_arn = (
-                f"arn:aws:iam::{account}:role/aws-reserved/sso.amazonaws.com/eu-west-2/{role_name}"
+        with ThreadPoolExecutor(
+            max_workers=min(SECRETS_MAX_WORKERS, len(accounts)) or 1
+        ) as executor:
+            has_access = executor.map(
+                self._has_ssm_write_access, accounts.keys(), accounts.values()
             )
-            response = iam.simulate_principal_policy(
-                PolicySourceArn=role_arn,
-                ActionNames=[
-                    "ssm:PutParameter",
-                ],
-                ContextEntries=[
-                    {
-                        "ContextKeyName": "aws:RequestedRegion",
-                        "ContextKeyValues": [
-                            "eu-west-2",
-                        ],
-                        "ContextKeyType": "string",
-                    }
-                ],
-            )["EvaluationResults"]
-
-            has_access = [
-                account for eval_result in response if eval_result["EvalDecision"] == "allowed"
-            ]
-
-            if not has_access:
-                no_access.append(account)
+            no_access = [account for account, allowed in zip(accounts, has_access) if not allowed]
 
         if no_access:
             account_ids = "', '".join(no_access)
@@ -64,27 +71,55 @@ class Secrets:
                 f"You do not have AWS Parameter Store write access to the following AWS accounts: '{account_ids}'"
             )
 
+    def _has_ssm_write_access(self, account, session):
+        return self._is_allowed(session, account, ["ssm:PutParameter"])
+
+    @staticmethod
+    def _is_allowed(session, account_id, actions):
+        sts_arn = get_aws_client(session, "sts").get_caller_identity()["Arn"]
+        role_name = sts_arn.split("/")[1]
+
+        role_arn = (
+            f"arn:aws:iam::{account_id}:role/aws-reserved/sso.amazonaws.com/eu-west-2/{role_name}"
+        )
+        response = simulate_principal_policy(session, role_arn, actions)
+
+        return any(eval_result["EvalDecision"] == "allowed" for eval_result in response)
+
     def _check_for_existing_params(self, get_secret_name):
-        found_params = []
+        environments_by_account = {}
         for _, environment in self.application.environments.items():
+            environments_by_account.setdefault(environment.account_id, []).append(environment)
+
+        def find_existing(environments):
             parameter_store: ParameterStore = self.parameter_store_provider(
-                environment.session.client("ssm")
+                get_aws_client(environments[0].session, "ssm")
             )
             try:
-                param = parameter_store.get_ssm_parameter_by_name(get_secret_name(environment.name))
-                if param:
-                    found_params.append(environment.name)
+                return parameter_store.get_ssm_parameters_by_names(
+                    [get_secret_name(environment.name) for environment in environments]
+                ).found
             except botocore.exceptions.ClientError as error:
-                if error.response["Error"]["Code"] == "ParameterNotFound":
-                    pass
-                else:
-                    raise PlatformException(error)
-
-        return found_params
+                raise PlatformException(error)
+
+        existing_names = set()
+        with ThreadPoolExecutor(
+            max_workers=min(SECRETS_MAX_WORKERS, len(environments_by_account)) or 1
+        ) as executor:
+            for found in executor.map(find_existing, environments_by_account.values()):
+                existing_names.update(found)
+
+        return [
+            environment.name
+            for environment in self.application.environments.values()
+            if get_secret_name(environment.name) in existing_names
+        ]
 
     def create(self, app_name, name, overwrite):
         self.application = (
-            self.load_application_fn(app_name) if not self.application else self.application
+            self.load_application_fn(app_name, prewarm_sessions=True)
+            if not self.application
+            else self.application
         )
 
         accounts = {}
@@ -111,11 +146,12 @@ class Secrets:
             )
             values[environment.name] = value
 
+        writes = []
         for environment_name, secret_value in values.items():
 
             environment = self.application.environments[environment_name]
             parameter_store: ParameterStore = self.parameter_store_provider(
-                environment.session.client("ssm")
+                get_aws_client(environment.session, "ssm")
             )
 
             data_dict = dict(
@@ -136,13 +172,18 @@ class Secrets:
                 del data_dict["Tags"]
             else:
                 data_dict["Overwrite"] = False
-            self.io.debug(
-                f"Creating AWS Parameter Store secret {get_secret_name(environment.name)} ..."
-            )
+            self.io.debug(f"Creating AWS Parameter Store secret {data_dict['Name']} ...")
+            writes.append((parameter_store, data_dict))
+
+        def put(write):
+            parameter_store, data_dict = write
             parameter_store.put_parameter(data_dict)
-            self.io.debug(
-                f"Successfully created AWS Parameter Store secret {get_secret_name(environment.name)}"
-            )
+            return data_dict["Name"]
+
+        # Every value has been collected, so write to all environments at once
+        with ThreadPoolExecutor(max_workers=min(SECRETS_MAX_WORKERS, len(writes)) or 1) as executor:
+            for secret_name in executor.map(put, writes):
+                self.io.debug(f"Successfully created AWS Parameter Store secret {secret_name}")
 
         self.io.info(
             "\nTo check or update your secrets, log into your AWS account via the Console and visit the Parameter Store https://eu-west-2.console.aws.amazon.com/systems-manager/parameters/\n"
@@ -156,28 +197,7 @@ class Secrets:
         )
 
     def __has_access(self, env, actions=["ssm:PutParameter"], access_type="write"):
-        sts_arn = env.session.client("sts").get_caller_identity()["Arn"]
-        role_name = sts_arn.split("/")[1]
-
-        role_arn = f"arn:aws:iam::{env.account_id}:role/aws-reserved/sso.amazonaws.com/eu-west-2/{role_name}"
-        response = env.session.client("iam").simulate_principal_policy(
-            PolicySourceArn=role_arn,
-            ActionNames=actions,
-            ContextEntries=[
-                {
-                    "ContextKeyName": "aws:RequestedRegion",
-                    "ContextKeyValues": [
-                        "eu-west-2",
-                    ],
-                    "ContextKeyType": "string",
-                }
-            ],
-        )["EvaluationResults"]
-        has_access = [
-            env.account_id for eval_result in response if eval_result["EvalDecision"] == "allowed"
-        ]
-
-        if not has_access:
+        if not self._is_allowed(env.session, env.account_id, actions):
             raise PlatformException(
                 f"You do not have AWS Parameter Store {access_type} access to the following AWS accounts: '{env.account_id}'"
             )
@@ -202,14 +222,160 @@ class Secrets:
         source_env = self.application.environments.get(source)
         target_env = self.application.environments.get(target)
 
-        self.__has_access(source_env, actions=["ssm:GetParameter"], access_type="read")
-        self.__has_access(target_env)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            access_checks = [
+                executor.submit(
+                    self.__has_access, source_env, actions=["ssm:GetParameter"], access_type="read"
+                ),
+                executor.submit(self.__has_access, target_env),
+            ]
+        for access_check in access_checks:
+            access_check.result()
+
+        self._check_prod_transfer(source_env.account_id, source, target)
+
+        parameter_store: ParameterStore = self.parameter_store_provider(
+            get_aws_client(source_env.session, "ssm"), with_model=True
+        )
+
+        target_parameter_store: ParameterStore = self.parameter_store_provider(
+            get_aws_client(target_env.session, "ssm"), with_model=True
+        )
+
+        secrets = self._get_environment_secrets(parameter_store, app_name, source)
+
+        result = self._copy_secrets(
+            app_name,
+            source,
+            target,
+            secrets,
+            target_parameter_store,
+            description=f"Copied from {source} environment.",
+        )
+
+        self.io.info(
+            f"Copied {result.copied} secrets from '{source}' to '{target}'; {result.already_existed} already existed, "
+            f"{result.identical} were already up to date and {result.skipped} were skipped."
+        )
+
+    def export_secrets(self, app_name: str, env: str, output: str):
+        """
+        Write an environment's secrets to a passphrase encrypted bundle.
+
+        Secrets in the prod account are never written out of AWS.
+        """
+
+        self.application = (
+            self.load_application_fn(app_name) if not self.application else self.application
+        )
+
+        environment = self.application.environments.get(env, "")
+        if not environment:
+            raise PlatformException(f"Environment '{env}' not found for application '{app_name}'.")
 
+        prod_env = self.application.environments.get("prod")
+        if prod_env and environment.account_id == prod_env.account_id:
+            raise PlatformException(
+                f"Cannot export secrets from '{env}' in the prod account '{prod_env.account_id}'"
+            )
+
+        self.__has_access(environment, actions=["ssm:GetParameter"], access_type="read")
+
+        parameter_store: ParameterStore = self.parameter_store_provider(
+            get_aws_client(environment.session, "ssm"), with_model=True
+        )
+        # Secrets which would never be copied are left out of the bundle altogether
+        secrets = [
+            secret
+            for secret in self._get_environment_secrets(parameter_store, app_name, env)
+            if not self._is_managed_elsewhere(secret)
+        ]
+
+        passphrase = self.io.input(
+            "Please enter a passphrase to encrypt the secrets bundle",
+            hide_input=True,
+            confirmation_prompt=True,
+        )
+        self.bundle_provider.write(
+            output,
+            {
+                "application": app_name,
+                "environment": env,
+                "account_id": environment.account_id,
+                "secrets": [
+                    {
+                        "name": secret.name,
+                        "value": secret.value,
+                        "type": secret.type,
+                        "tags": secret.tags,
+                    }
+                    for secret in secrets
+                ],
+            },
+            passphrase,
+        )
+
+        self.io.info(f"Exported {len(secrets)} secrets from '{env}' to {output}")
+
+    def import_secrets(self, app_name: str, env: str, bundle: str):
+        """Create the secrets held in an exported bundle in an environment."""
+
+        self.application = (
+            self.load_application_fn(app_name) if not self.application else self.application
+        )
+
+        environment = self.application.environments.get(env, "")
+        if not environment:
+            raise PlatformException(f"Environment '{env}' not found for application '{app_name}'.")
+
+        self.__has_access(environment)
+
+        passphrase = self.io.input(
+            "Please enter the passphrase for the secrets bundle", hide_input=True
+        )
+        contents = self.bundle_provider.read(bundle, passphrase)
+
+        if contents["application"] != app_name:
+            raise PlatformException(
+                f"The bundle {bundle} holds secrets for application '{contents['application']}', not '{app_name}'."
+            )
+
+        source = contents["environment"]
+        self._check_prod_transfer(contents["account_id"], source, env)
+
+        secrets = [
+            Parameter(
+                name=secret["name"],
+                value=secret["value"],
+                type=secret["type"],
+                tags=secret["tags"],
+            )
+            for secret in contents["secrets"]
+        ]
+
+        target_parameter_store: ParameterStore = self.parameter_store_provider(
+            get_aws_client(environment.session, "ssm"), with_model=True
+        )
+        result = self._copy_secrets(
+            app_name,
+            source,
+            env,
+            secrets,
+            target_parameter_store,
+            description=f"Imported from {source} environment.",
+        )
+
+        self.io.info(
+            f"Imported {result.copied} secrets from {bundle} into '{env}'; {result.already_existed} already existed, "
+            f"{result.identical} were already up to date and {result.skipped} were skipped."
+        )
+
+    def _check_prod_transfer(self, source_account_id: str, source: str, target: str):
         prod_env = self.application.environments.get("prod")
         if prod_env:
             prod_account_id = prod_env.account_id
             if (
-                self.application.environments[source].account_id == prod_account_id
+                source_account_id == prod_account_id
                 and self.application.environments[target].account_id != prod_account_id
             ):
                 raise PlatformException(
@@ -217,32 +383,35 @@ class Secrets:
                     f" to '{target}' in '{self.application.environments[target].account_id}'"
                 )
 
-        parameter_store: ParameterStore = self.parameter_store_provider(
-            source_env.session.client("ssm"), with_model=True
-        )
-
-        target_parameter_store: ParameterStore = self.parameter_store_provider(
-            target_env.session.client("ssm"), with_model=True
-        )
-
+    @staticmethod
+    def _get_environment_secrets(
+        parameter_store: ParameterStore, app_name: str, env: str
+    ) -> list[Parameter]:
         copilot_secrets: list[Parameter] = parameter_store.get_ssm_parameters_by_path(
-            f"/copilot/{app_name}/{source}/secrets", add_tags=True
+            f"/copilot/{app_name}/{env}/secrets", add_tags=True
         )
         platform_secrets: list[Parameter] = parameter_store.get_ssm_parameters_by_path(
-            f"/platform/{app_name}/{source}/secrets", add_tags=True
+            f"/platform/{app_name}/{env}/secrets", add_tags=True
         )
 
-        secrets = copilot_secrets + platform_secrets
+        return copilot_secrets + platform_secrets
 
+    def _copy_secrets(
+        self,
+        app_name: str,
+        source: str,
+        target: str,
+        secrets: list[Parameter],
+        target_parameter_store: ParameterStore,
+        description: str,
+    ) -> SecretsCopyResult:
+        """Write the source environment's secrets into the target environment,
+        skipping those managed elsewhere and any which already exist."""
+        to_copy = []
         for secret in secrets:
             secret.name = secret.name.replace(f"/{source}/", f"/{target}/")
 
-            if (
-                "AWS_" in secret.name
-                or secret.tags.get("managed-by", "") == MANAGED_BY_PLATFORM_TERRAFORM
-                or secret.tags.get("managed-by", "")
-                == "Terraform"  # SSM params POSTGRES_APPLICATION_USER and POSTGRES_READ_ONLY_USER are tagged differently from the rest
-            ):
+            if self._is_managed_elsewhere(secret):
                 message = f"Skipping AWS Parameter Store secret {secret.name}"
                 if secret.tags.get("managed-by", ""):
                     managed_by = secret.tags["managed-by"]
@@ -250,6 +419,23 @@ class Secrets:
                 self.io.debug(message)
                 continue
 
+            to_copy.append(secret)
+
+        diff = self._diff_secrets(
+            to_copy,
+            target_parameter_store.get_ssm_parameters_by_names(
+                [secret.name for secret in to_copy]
+            ).found,
+        )
+
+        for secret in diff.changed:
+            self._warn_secret_exists(secret, target)
+        for secret in diff.identical:
+            self.io.debug(
+                f"AWS Parameter Store secret {secret.name} is already up to date in '{target}'"
+            )
+
+        for secret in diff.missing:
             secret.tags["application"] = app_name
             secret.tags["environment"] = target
             secret.tags["managed-by"] = MANAGED_BY_PLATFORM
@@ -258,26 +444,154 @@ class Secrets:
             if secret.name.startswith("/copilot/"):
                 secret.tags["copilot-environment"] = target
 
-            data_dict = dict(
-                Name=secret.name,
-                Value=secret.value,
-                Overwrite=False,
-                Type=secret.type,
-                Description=f"Copied from {source} environment.",
-                Tags=secret.tags_to_list(),
-            )
             self.io.debug(f"Creating AWS Parameter Store secret {secret.name} ...")
 
+        def put_secret(secret: Parameter):
             try:
-                target_parameter_store.put_parameter(data_dict)
-                secret_name = secret.name.split("/")[-1]
-                self.io.info(
-                    f"Secret {secret_name} was successfully copied from the '{source} environment to '{target}'"
+                target_parameter_store.put_parameter(
+                    dict(
+                        Name=secret.name,
+                        Value=secret.value,
+                        Overwrite=False,
+                        Type=secret.type,
+                        Description=description,
+                        Tags=secret.tags_to_list(),
+                    )
                 )
+                return True
             except botocore.exceptions.ClientError as e:
+                # The secret may have been created since the target was read
                 if e.response["Error"]["Code"] == "ParameterAlreadyExists":
-                    self.io.warn(
-                        f"""The "{secret.name.split("/")[-1]}" parameter already exists for the "{target}" environment.""",
+                    return False
+                raise PlatformException(e)
+
+        copied = 0
+        if diff.missing:
+            with ThreadPoolExecutor(
+                max_workers=min(SECRETS_MAX_WORKERS, len(diff.missing))
+            ) as executor:
+                for secret, created in zip(diff.missing, executor.map(put_secret, diff.missing)):
+                    if created:
+                        copied += 1
+                        self.io.info(
+                            f"Secret {secret.name.split('/')[-1]} was successfully copied from the '{source} environment to '{target}'"
+                        )
+                    else:
+                        self._warn_secret_exists(secret, target)
+
+        return SecretsCopyResult(
+            copied=copied,
+            already_existed=len(diff.changed) + len(diff.missing) - copied,
+            identical=len(diff.identical),
+            skipped=len(secrets) - len(to_copy),
+        )
+
+    @staticmethod
+    def _is_managed_elsewhere(secret: Parameter) -> bool:
+        return (
+            "AWS_" in secret.name
+            or secret.tags.get("managed-by", "") == MANAGED_BY_PLATFORM_TERRAFORM
+            or secret.tags.get("managed-by", "")
+            == "Terraform"  # SSM params POSTGRES_APPLICATION_USER and POSTGRES_READ_ONLY_USER are tagged differently from the rest
+        )
+
+    @staticmethod
+    def _diff_secrets(secrets: list[Parameter], existing: dict[str, Parameter]) -> SecretsDiff:
+        diff = SecretsDiff()
+        for secret in secrets:
+            if secret.name not in existing:
+                diff.missing.append(secret)
+            elif existing[secret.name].value == secret.value:
+                diff.identical.append(secret)
+            else:
+                diff.changed.append(secret)
+
+        return diff
+
+    def _warn_secret_exists(self, secret: Parameter, target: str):
+        self.io.warn(
+            f"""The "{secret.name.split("/")[-1]}" parameter already exists for the "{target}" environment.""",
+        )
+
+    def diff(self, app_name: str, envs: list[str]):
+        """Compare the secrets of several environments, showing where each
+        secret is missing or has a different value without revealing any
+        values."""
+
+        self.application = (
+            self.load_application_fn(app_name, prewarm_sessions=True)
+            if not self.application
+            else self.application
+        )
+
+        envs = list(dict.fromkeys(envs))
+        for env in envs:
+            if not self.application.environments.get(env, ""):
+                raise PlatformException(
+                    f"Environment '{env}' not found for application '{app_name}'."
+                )
+        if len(envs) < 2:
+            raise PlatformException("At least two environments are needed to compare secrets.")
+
+        parameter_stores = {
+            env: self.parameter_store_provider(
+                get_aws_client(self.application.environments[env].session, "ssm"),
+                with_model=True,
+            )
+            for env in envs
+        }
+        trees = [(env, tree) for env in envs for tree in ["copilot", "platform"]]
+
+        def fetch_tree(env_tree):
+            env, tree = env_tree
+            return parameter_stores[env].get_ssm_parameters_by_path(
+                f"/{tree}/{app_name}/{env}/secrets"
+            )
+
+        secrets_by_env = {env: {} for env in envs}
+        with ThreadPoolExecutor(max_workers=min(SECRETS_MAX_WORKERS, len(trees))) as executor:
+            for (env, _), secrets in zip(trees, executor.map(fetch_tree, trees)):
+                for secret in secrets:
+                    name = secret.name.replace(
+                        f"/{app_name}/{env}/secrets/", f"/{app_name}/*/secrets/", 1
                     )
-                else:
-                    raise PlatformException(e)
+                    secrets_by_env[env][name] = secret
+
+        # Values are hashed with a key made for this report, so hashes can be
+        # compared between environments but not matched against guessed values
+        hash_key = os.urandom(32)
+        fingerprint = lambda secret: hmac.new(
+            hash_key, secret.value.encode(), hashlib.sha256
+        ).hexdigest()[:12]
+
+        table = PrettyTable()
+        table.field_names = ["Secret"] + envs + ["Status"]
+        table.align["Secret"] = "l"
+
+        names = sorted({name for secrets in secrets_by_env.values() for name in secrets})
+        differences = 0
+        for name in names:
+            present = [secrets_by_env[env].get(name) for env in envs]
+            fingerprints = [fingerprint(secret) if secret else None for secret in present]
+
+            if not all(present):
+                status = "missing"
+            elif len(set(fingerprints)) > 1:
+                status = "differs"
+            else:
+                status = "same"
+            if status != "same":
+                differences += 1
+
+            table.add_row(
+                [name]
+                + [
+                    f"v{secret.version} {hashed}" if secret else "-"
+                    for secret, hashed in zip(present, fingerprints)
+                ]
+                + [status]
+            )
+
+        self.io.info(table)
+        env_names = "', '".join(envs)
+        self.io.info(f"{differences} of {len(names)} secrets differ between '{env_names}'.")
@@ -83,13 +83,13 @@ class ManagedPlatformClusterNotFoundException(ServiceExecException):
 class ServiceManager:
     def __init__(
         self,
-        config_provider=ConfigProvider(ConfigValidator()),
-        io: ClickIOProvider = ClickIOProvider(),
+        config_provider=None,
+        io: ClickIOProvider = None,
         file_provider=YamlFileProvider,
         manifest_provider: TerraformManifestProvider = None,
         platform_helper_version_override: str = None,
         load_application=load_application,
-        installed_version_provider: InstalledVersionProvider = InstalledVersionProvider(),
+        installed_version_provider: InstalledVersionProvider = None,
         ecs_provider: ECS = None,
         s3_provider: S3Provider = None,
         logs_provider: LogsProvider = None,
@@ -98,15 +98,15 @@ class ServiceManager:
     ):
 
         self.file_provider = file_provider
-        self.config_provider = config_provider
-        self.io = io
+        self.config_provider = config_provider or ConfigProvider(ConfigValidator())
+        self.io = io or ClickIOProvider()
         self.manifest_provider = manifest_provider or TerraformManifestProvider()
         self.platform_helper_version_override = (
             platform_helper_version_override
             or EnvironmentVariableProvider.get(PLATFORM_HELPER_VERSION_OVERRIDE_KEY)
         )
         self.load_application = load_application
-        self.installed_version_provider = installed_version_provider
+        self.installed_version_provider = installed_version_provider or InstalledVersionProvider()
         self.ecs_provider = ecs_provider
         self.s3_provider = s3_provider
         self.logs_provider = logs_provider
@@ -0,0 +1,300 @@
+import ast
+import json
+import pstats
+import re
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+from typing import Optional
+
+from prettytable import PrettyTable
+
+from dbt_platform_helper.platform_exception import PlatformException
+from dbt_platform_helper.providers.io import ClickIOProvider
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)\s*$")
+
+# Executed with `python -X importtime -c` so that the target command runs in a
+# fresh interpreter with nothing pre-imported, exactly as it would in a pipeline.
+PROFILE_BOOTSTRAP = """
+import cProfile
+import importlib.abc
+import importlib.util
+import json
+import sys
+import time
+
+started = time.perf_counter()
+profile_path, aws_call_path, *args = sys.argv[1:]
+first_aws_call = {}
+
+
+def time_first_aws_call(client_module):
+    make_api_call = client_module.BaseClient._make_api_call
+
+    def timed_make_api_call(self, operation_name, api_params):
+        if first_aws_call:
+            return make_api_call(self, operation_name, api_params)
+
+        called = time.perf_counter()
+        try:
+            return make_api_call(self, operation_name, api_params)
+        finally:
+            first_aws_call.update(
+                service=self.meta.service_model.service_name,
+                operation=operation_name,
+                started_after=called - started,
+                duration=time.perf_counter() - called,
+            )
+
+    client_module.BaseClient._make_api_call = timed_make_api_call
+
+
+class BotocoreClientFinder(importlib.abc.MetaPathFinder):
+    # Patches botocore only if the command imports it, so its import cost is not
+    # counted against commands which never use it
+    def find_spec(self, name, path, target=None):
+        if name != "botocore.client":
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            return None
+        exec_module = spec.loader.exec_module
+
+        def exec_and_patch_module(module):
+            exec_module(module)
+            time_first_aws_call(module)
+
+        spec.loader.exec_module = exec_and_patch_module
+        return spec
+
+
+sys.meta_path.insert(0, BotocoreClientFinder())
+
+profiler = cProfile.Profile()
+profiler.enable()
+
+exit_code = 0
+try:
+    from platform_helper import platform_helper
+
+    platform_helper(args=args, prog_name="platform-helper")
+except SystemExit as system_exit:
+    exit_code = system_exit.code if isinstance(system_exit.code, int) else 1
+finally:
+    profiler.disable()
+    profiler.dump_stats(profile_path)
+    with open(aws_call_path, "w") as aws_call_file:
+        json.dump({"total": time.perf_counter() - started, "first_aws_call": first_aws_call}, aws_call_file)
+
+sys.exit(exit_code)
+"""
+
+
+@dataclass
+class ImportCost:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class ProviderCost:
+    provider: str
+    calls: int
+    cumulative_seconds: float
+
+
+@dataclass
+class AWSCallLatency:
+    service: str
+    operation: str
+    started_after_seconds: float
+    duration_seconds: float
+
+
+@dataclass
+class StartupProfile:
+    exit_code: int
+    total_seconds: float
+    import_costs: list[ImportCost]
+    provider_costs: list[ProviderCost]
+    first_aws_call: Optional[AWSCallLatency]
+
+
+class StartupProfilerException(PlatformException):
+    pass
+
+
+class StartupProfiler:
+    def __init__(
+        self,
+        io: ClickIOProvider = None,
+        run_subprocess: Callable = subprocess.run,
+        python_executable: str = sys.executable,
+    ):
+        self.io = io or ClickIOProvider()
+        self.run_subprocess = run_subprocess
+        self.python_executable = python_executable
+
+    def profile(self, command: list[str], top: int = 20) -> StartupProfile:
+        with tempfile.TemporaryDirectory() as output_dir:
+            profile_path = Path(output_dir, "startup.prof")
+            aws_call_path = Path(output_dir, "aws_call.json")
+
+            result = self.run_subprocess(
+                [
+                    self.python_executable,
+                    "-X",
+                    "importtime",
+                    "-c",
+                    PROFILE_BOOTSTRAP,
+                    str(profile_path),
+                    str(aws_call_path),
+                    *command,
+                ],
+                capture_output=True,
+                text=True,
+            )
+
+            if not profile_path.exists() or not aws_call_path.exists():
+                raise StartupProfilerException(
+                    f"Profiling 'platform-helper {' '.join(command)}' failed:\n{result.stderr}"
+                )
+
+            timings = json.loads(aws_call_path.read_text())
+            stats = pstats.Stats(str(profile_path))
+
+        import_costs, command_errors = parse_import_times(result.stderr)
+
+        if result.stdout:
+            self.io.info(result.stdout.rstrip())
+        if command_errors:
+            self.io.info("\n".join(command_errors), err=True)
+
+        first_aws_call = timings.get("first_aws_call")
+        startup_profile = StartupProfile(
+            exit_code=result.returncode,
+            total_seconds=timings["total"],
+            import_costs=sorted(import_costs, key=lambda cost: cost.cumulative_us, reverse=True),
+            provider_costs=provider_construction_costs(stats),
+            first_aws_call=(
+                AWSCallLatency(
+                    service=first_aws_call["service"],
+                    operation=first_aws_call["operation"],
+                    started_after_seconds=first_aws_call["started_after"],
+                    duration_seconds=first_aws_call["duration"],
+                )
+                if first_aws_call
+                else None
+            ),
+        )
+
+        self._report(command, startup_profile, top)
+
+        return startup_profile
+
+    def _report(self, command: list[str], startup_profile: StartupProfile, top: int):
+        self.io.info(
+            f"\nStartup profile for 'platform-helper {' '.join(command)}' "
+            f"(exit code {startup_profile.exit_code}, "
+            f"{startup_profile.total_seconds * 1000:.1f}ms in total)\n",
+            bold=True,
+        )
+
+        imports_table = PrettyTable()
+        imports_table.field_names = ["Module", "Self (ms)", "Cumulative (ms)"]
+        imports_table.align["Module"] = "l"
+        for cost in startup_profile.import_costs[:top]:
+            imports_table.add_row(
+                [cost.module, f"{cost.self_us / 1000:.1f}", f"{cost.cumulative_us / 1000:.1f}"]
+            )
+        self.io.info(f"Module import costs (top {top}):")
+        self.io.info(imports_table)
+
+        if startup_profile.provider_costs:
+            providers_table = PrettyTable()
+            providers_table.field_names = ["Provider", "Calls", "Cumulative (ms)"]
+            providers_table.align["Provider"] = "l"
+            for cost in startup_profile.provider_costs[:top]:
+                providers_table.add_row(
+                    [cost.provider, cost.calls, f"{cost.cumulative_seconds * 1000:.1f}"]
+                )
+            self.io.info(f"\nProvider construction costs (top {top}):")
+            self.io.info(providers_table)
+        else:
+            self.io.info("\nNo providers were constructed.")
+
+        first_aws_call = startup_profile.first_aws_call
+        if first_aws_call:
+            self.io.info(
+                f"\nFirst AWS call: {first_aws_call.service}.{first_aws_call.operation} "
+                f"started after {first_aws_call.started_after_seconds * 1000:.1f}ms "
+                f"and took {first_aws_call.duration_seconds * 1000:.1f}ms"
+            )
+        else:
+            self.io.info("\nNo AWS calls were made.")
+
+
+def parse_import_times(stderr: str) -> tuple[list[ImportCost], list[str]]:
+    """Split the output of `python -X importtime` into import costs and any
+    other lines written to stderr by the profiled command."""
+
+    import_costs = []
+    other_lines = []
+
+    for line in stderr.splitlines():
+        if line.startswith("import time: self [us]"):
+            continue
+        matched = IMPORT_TIME_LINE.match(line)
+        if matched:
+            import_costs.append(
+                ImportCost(
+                    module=matched.group(4),
+                    self_us=int(matched.group(1)),
+                    cumulative_us=int(matched.group(2)),
+                )
+            )
+        else:
+            other_lines.append(line)
+
+    return import_costs, other_lines
+
+
+def provider_construction_costs(stats: pstats.Stats) -> list[ProviderCost]:
+    costs = []
+
+    for (filename, lineno, function), (_, calls, _, cumulative, _) in stats.stats.items():
+        path = Path(filename)
+        if function != "__init__" or "dbt_platform_helper" not in path.parts:
+            continue
+        if "providers" not in path.parts:
+            continue
+        costs.append(
+            ProviderCost(
+                provider=f"{path.stem}.{_class_defined_at(path, lineno) or function}",
+                calls=calls,
+                cumulative_seconds=cumulative,
+            )
+        )
+
+    return sorted(costs, key=lambda cost: cost.cumulative_seconds, reverse=True)
+
+
+def _class_defined_at(path: Path, lineno: int) -> Optional[str]:
+    try:
+        tree = ast.parse(path.read_text())
+    except (OSError, SyntaxError):
+        return None
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            for child in node.body:
+                if isinstance(child, ast.FunctionDef) and child.lineno == lineno:
+                    return node.name
+
+    return None
@@ -17,10 +17,10 @@ class TerraformEnvironment:
         self,
         config_provider,
         manifest_provider: TerraformManifestProvider = None,
-        io: ClickIOProvider = ClickIOProvider(),
+        io: ClickIOProvider = None,
         platform_helper_versioning: PlatformHelperVersioning = None,
     ):
-        self.io = io
+        self.io = io or ClickIOProvider()
         self.config_provider = config_provider
         self.manifest_provider = manifest_provider or TerraformManifestProvider()
         self.platform_helper_versioning = platform_helper_versioning
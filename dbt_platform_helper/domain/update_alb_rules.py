@@ -1,7 +1,9 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
+from math import ceil
 
 from botocore.exceptions import ClientError
 
@@ -18,9 +20,19 @@ from dbt_platform_helper.platform_exception import PlatformException
 from dbt_platform_helper.providers.config import ConfigProvider
 from dbt_platform_helper.providers.config_validator import ConfigValidator
 from dbt_platform_helper.providers.io import ClickIOProvider
+from dbt_platform_helper.providers.io import PrefixedIOProvider
 from dbt_platform_helper.providers.load_balancers import LoadBalancerProvider
+from dbt_platform_helper.providers.rule_journal import RuleJournalProvider
+from dbt_platform_helper.utils.application import Application
+from dbt_platform_helper.utils.application import Environment
 from dbt_platform_helper.utils.application import load_application
 
+ALB_ROLLBACK_MAX_WORKERS = 4
+
+ALB_UPDATE_MAX_ENVIRONMENTS = 4
+# AWS allows a maximum of 5 condition values per rule, this includes host and path values
+MAX_RULE_CONDITION_VALUES = 5
+
 
 class RollbackException(PlatformException):
     pass
@@ -47,7 +59,125 @@ class OperationState:
     created_rules: list[object] = field(default_factory=list)
     deleted_rules: list[object] = field(default_factory=list)
     updated_rules: list[object] = field(default_factory=list)
+    reprioritised_rules: list[object] = field(default_factory=list)
+    # Rules as they were before being modified or reprioritised, keyed by ARN
+    rule_snapshots: dict[str, dict] = field(default_factory=dict)
     listener_arn: str = ""
+    journal: RuleJournalProvider = None
+
+    def has_changes(self) -> bool:
+        return bool(
+            self.created_rules
+            or self.deleted_rules
+            or self.updated_rules
+            or self.reprioritised_rules
+        )
+
+    def start_journal(self, listener_arn: str):
+        if self.journal and not self.journal.exists():
+            self.journal.start(listener_arn)
+
+    def record_pending(self, operation: str, **details):
+        if self.journal:
+            return self.journal.pending(operation, **details)
+
+    def record_done(self, entry_id, operation: str, **details):
+        if self.journal:
+            self.journal.done(entry_id, operation, **details)
+
+    def record_rolled_back(self, operation: str, rule_arns: list[str]):
+        if self.journal:
+            self.journal.rolled_back(operation, rule_arns)
+
+    def close_journal(self):
+        if self.journal:
+            self.journal.remove()
+
+
+@dataclass
+class PlatformRule:
+    service: str
+    priority: int
+    aliases: list[str]
+    path_pattern: list[str]
+    target_group_arn: str
+    tags: dict[str, str]
+
+    @property
+    def conditions(self) -> list[dict]:
+        return [
+            {"Field": "host-header", "HostHeaderConfig": {"Values": self.aliases}},
+            {
+                "Field": "path-pattern",
+                "PathPatternConfig": {"Values": self.path_pattern},
+            },
+        ]
+
+    @property
+    def actions(self) -> list[dict]:
+        return [{"Type": "forward", "TargetGroupArn": self.target_group_arn}]
+
+    @property
+    def tag_list(self) -> list[dict]:
+        return [{"Key": key, "Value": value} for key, value in self.tags.items()]
+
+    def routes_like(self, rule: dict) -> bool:
+        """Whether an existing, normalised, rule has the same conditions and
+        actions."""
+        conditions = {field: sorted(values) for field, values in rule["Conditions"].items()}
+        actions = [(action["Type"], action.get("TargetGroupArn")) for action in rule["Actions"]]
+        return conditions == {
+            "host-header": sorted(self.aliases),
+            "path-pattern": sorted(self.path_pattern),
+        } and actions == [("forward", self.target_group_arn)]
+
+    def tagged_like(self, rule: dict) -> bool:
+        return all(rule["Tags"].get(key) == value for key, value in self.tags.items())
+
+    def to_rule(self, rule_arn: str) -> dict:
+        return {"RuleArn": rule_arn, "Priority": self.priority, "Conditions": self.conditions}
+
+
+@dataclass
+class RulePlan:
+    listener_arn: str = ""
+    rules_to_create: list[PlatformRule] = field(default_factory=list)
+    # Existing rules paired with the desired rule they will be changed to match
+    rules_to_modify: list[tuple[PlatformRule, dict]] = field(default_factory=list)
+    rules_to_reprioritise: list[tuple[dict, int]] = field(default_factory=list)
+    # Deleted before anything else so that their priorities can be reused
+    rules_to_free: list[dict] = field(default_factory=list)
+    rules_to_delete: list[dict] = field(default_factory=list)
+    # Platform rules removed when traffic moves back to copilot, which needs confirmation
+    rules_to_delete_on_confirm: list[dict] = field(default_factory=list)
+    # How many platform rules the service routing needs with and without condition packing
+    unpacked_rule_count: int = None
+    packed_rule_count: int = None
+
+    def has_changes(self) -> bool:
+        return bool(
+            self.rules_to_create
+            or self.rules_to_modify
+            or self.rules_to_reprioritise
+            or self.rules_to_free
+            or self.rules_to_delete
+            or self.rules_to_delete_on_confirm
+        )
+
+    def api_call_count(self) -> int:
+        """The number of ELB API calls needed to apply the plan."""
+        modify_calls = sum(
+            (not desired.routes_like(rule)) + (not desired.tagged_like(rule))
+            for desired, rule in self.rules_to_modify
+        )
+        return (
+            len(self.rules_to_create)
+            + modify_calls
+            + (1 if self.rules_to_reprioritise else 0)
+            + len(self.rules_to_free)
+            + len(self.rules_to_delete)
+            + len(self.rules_to_delete_on_confirm)
+        )
 
 
 class UpdateALBRules:
@@ -55,55 +185,311 @@ class UpdateALBRules:
     def __init__(
         self,
         session,
-        config_provider: ConfigProvider = ConfigProvider(ConfigValidator()),
-        io: ClickIOProvider = ClickIOProvider(),
+        config_provider: ConfigProvider = None,
+        io: ClickIOProvider = None,
         load_application=load_application,
         load_balancer_p: LoadBalancerProvider = LoadBalancerProvider,
+        rule_journal_p: RuleJournalProvider = RuleJournalProvider,
     ):
-        self.config_provider = config_provider
-        self.io = io
+        self.config_provider = config_provider or ConfigProvider(ConfigValidator())
+        self.io = io or ClickIOProvider()
         self.load_application = load_application
         self.load_balancer: LoadBalancerProvider = load_balancer_p(session, io=self.io)
+        self.load_balancer_p = load_balancer_p
+        self.rule_journal_p = rule_journal_p
+        self._platform_config = None
+        self._application = None
 
-    def update_alb_rules(
+    def update_alb_rules_for_environments(
         self,
-        environment: str,
+        environments: list[str] = None,
+        plan: bool = False,
+        resume: bool = False,
+        rollback: bool = False,
+    ) -> dict[str, BaseException]:
+        """
+        Change ALB rules for several environments at once, or for every
+        environment in the platform config if none are given.
+
+        The config and application are loaded once and environments in the same
+        account share a session. Each environment is updated, and rolled back on
+        failure, on its own, so one failing does not stop or undo the others.
+        Returns the error for each environment, or None if it succeeded, and
+        raises once all of them have finished if any failed.
+        """
+
+        platform_config = self._get_platform_config()
+        if not environments:
+            environments = [name for name in platform_config.get("environments", {}) if name != "*"]
+
+        application = self._get_application(
+            platform_config.get("application", ""), prewarm_sessions=True
+        )
+        unknown_environments = [env for env in environments if env not in application.environments]
+        if unknown_environments:
+            raise PlatformException(
+                f"The environments {', '.join(unknown_environments)} were not found in the application {application.name}."
+            )
+
+        # Sessions are created one at a time, as Environment.session is not thread safe
+        updaters = {
+            env: self._for_environment(application.environments[env]) for env in environments
+        }
+
+        def update(env: str):
+            try:
+                updaters[env].update_alb_rules(env, plan=plan, resume=resume, rollback=rollback)
+            # A worker which exits is not rolled back, and must not hide the other results
+            except BaseException as e:
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=min(ALB_UPDATE_MAX_ENVIRONMENTS, len(environments)) or 1
+        ) as executor:
+            results = dict(zip(environments, executor.map(update, environments)))
+
+        self.io.info("ALB rule update results:")
+        for env, error in results.items():
+            if isinstance(error, Exception):
+                self.io.error(f"{env}: {error}")
+            elif error:
+                reason = (
+                    f"exited with code {error.code}"
+                    if isinstance(error, SystemExit)
+                    else type(error).__name__
+                )
+                self.io.error(
+                    f"{env}: the update was interrupted ({reason}). Run again with --resume to finish it or --rollback to undo it."
+                )
+            else:
+                self.io.info(f"{env}: succeeded")
+
+        failed_environments = [env for env, error in results.items() if error]
+        if failed_environments:
+            raise PlatformException(
+                f"ALB rule updates failed for {len(failed_environments)} of {len(environments)} environments: {', '.join(failed_environments)}"
+            )
+
+        return results
+
+    def _for_environment(self, environment: Environment) -> "UpdateALBRules":
+        """An updater for one environment which shares this one's config and
+        application, and labels its output with the environment name."""
+        updater = UpdateALBRules(
+            environment.session,
+            config_provider=self.config_provider,
+            io=PrefixedIOProvider(environment.name, self.io),
+            load_application=self.load_application,
+            load_balancer_p=self.load_balancer_p,
+            rule_journal_p=self.rule_journal_p,
+        )
+        updater._platform_config = self._platform_config
+        updater._application = self._application
+        return updater
+
+    def _get_platform_config(self) -> dict:
+        if self._platform_config is None:
+            self._platform_config = self.config_provider.get_enriched_config()
+        return self._platform_config
+
+    def _get_application(self, application_name: str, **kwargs) -> Application:
+        if self._application is None:
+            self._application = self.load_application(app=application_name, **kwargs)
+        return self._application
+
+    def update_alb_rules(
+        self, environment: str, plan: bool = False, resume: bool = False, rollback: bool = False
     ):
         """
         Change ALB rules for a given environment.
 
-        Attempt to rollback the rules created/deleted if a failure occurs.
+        Attempt to rollback the rules created/deleted if a failure occurs. Every
+        change is journaled on disk so that an update which was killed part way
+        through can be finished with resume or undone with rollback.
+
+        With plan set, only output the changes that would be made and the number
+        of ELB API calls needed to make them.
         """
 
-        operation_state = OperationState()
+        if plan:
+            self._output_plan(self._plan_rule_updates(environment))
+            return
+
+        application_name = self._get_platform_config().get("application", "")
+        journal = self.rule_journal_p(application_name, environment)
+
+        if rollback:
+            self._rollback_interrupted_update(environment, journal)
+            return
+
+        if journal.exists() and not resume:
+            raise PlatformException(
+                f"An interrupted ALB rule update was found for environment {environment}. Run again with --resume to finish it or --rollback to undo it."
+            )
+
+        if resume and journal.exists():
+            operation_state = self._load_operation_state(journal)
+        else:
+            operation_state = OperationState(journal=journal)
 
         try:
-            self._execute_rule_updates(environment, operation_state)
+            rule_plan = self._execute_rule_updates(environment, operation_state)
             if operation_state.created_rules:
                 self.io.info(f"Created rules: {len(operation_state.created_rules)}")
                 self._output_rule_changes(operation_state.created_rules)
+            if operation_state.updated_rules:
+                self.io.info(f"Modified rules: {len(operation_state.updated_rules)}")
+                self._output_rule_changes(operation_state.updated_rules)
+            if operation_state.reprioritised_rules:
+                self.io.info(f"Reprioritised rules: {len(operation_state.reprioritised_rules)}")
+                self._output_rule_changes(operation_state.reprioritised_rules)
             if operation_state.deleted_rules:
                 self.io.info(f"Deleted rules: {len(operation_state.deleted_rules)}")
                 self._output_rule_changes(operation_state.deleted_rules)
-            if not operation_state.created_rules and not operation_state.deleted_rules:
+            if not operation_state.has_changes():
                 self.io.info("No rule updates required")
+            self._output_packing_report(rule_plan)
+            operation_state.close_journal()
         except Exception as e:
-            if operation_state.created_rules or operation_state.deleted_rules:
+            if operation_state.has_changes():
                 self.io.error(f"Error during rule update: {str(e)}")
                 self.io.info("Attempting to rollback changes ...")
                 try:
                     self._rollback_changes(operation_state)
+                    operation_state.close_journal()
                     raise PlatformException(f"Rule update failed and rolled back")
                 except RollbackException as rollback_error:
                     raise PlatformException(f"Rollback failed: \n{str(rollback_error)}")
             else:
+                operation_state.close_journal()
                 raise
 
+    def _rollback_interrupted_update(self, environment: str, journal: RuleJournalProvider):
+        if not journal.exists():
+            self.io.info(f"No interrupted ALB rule update found for environment {environment}")
+            return
+
+        operation_state = self._load_operation_state(journal)
+        if operation_state.has_changes():
+            self.io.info("Attempting to rollback changes ...")
+            try:
+                self._rollback_changes(operation_state)
+            except RollbackException as rollback_error:
+                raise PlatformException(f"Rollback failed: \n{str(rollback_error)}")
+        else:
+            self.io.info("No rule changes to roll back")
+
+        operation_state.close_journal()
+
+    def _load_operation_state(self, journal: RuleJournalProvider) -> OperationState:
+        """
+        Rebuild the changes made by an interrupted update from its journal.
+
+        A change recorded as pending but never as done may or may not have
+        happened, so creations and deletions are checked against the listener.
+        Modifications and reprioritisations are assumed to have happened, as
+        restoring them is harmless either way.
+        """
+        operation_state = OperationState(journal=journal)
+        pending_entries = {}
+        rolled_back = set()
+
+        for entry in journal.entries():
+            if entry["event"] == "started":
+                operation_state.listener_arn = entry["listener_arn"]
+            elif entry["event"] == "pending":
+                pending_entries[entry["id"]] = entry
+            elif entry["event"] == "done" and entry["id"] in pending_entries:
+                self._restore_journal_entry(
+                    operation_state, pending_entries.pop(entry["id"]), entry
+                )
+            elif entry["event"] == "rolled_back":
+                rolled_back.update((entry["operation"], arn) for arn in entry["rule_arns"])
+
+        unresolved = [
+            entry
+            for entry in pending_entries.values()
+            if entry["operation"] in ["create", "delete"]
+        ]
+        current_rules = (
+            self.load_balancer.get_rules_with_tags_by_listener_arn(operation_state.listener_arn)
+            if unresolved
+            else []
+        )
+        for entry in pending_entries.values():
+            if entry["operation"] == "create":
+                created_rule = next(
+                    (
+                        rule
+                        for rule in current_rules
+                        if rule["Priority"] == str(entry["priority"])
+                        and rule["Tags"] == entry["tags"]
+                    ),
+                    None,
+                )
+                if created_rule:
+                    self._restore_journal_entry(operation_state, entry, {"rule": created_rule})
+            elif entry["operation"] == "delete":
+                if entry["rule"]["RuleArn"] not in [rule["RuleArn"] for rule in current_rules]:
+                    self._restore_journal_entry(operation_state, entry, {})
+            else:
+                self._restore_journal_entry(operation_state, entry, entry)
+
+        operation_state.created_rules = [
+            rule
+            for rule in operation_state.created_rules
+            if ("create", rule["RuleArn"]) not in rolled_back
+        ]
+        operation_state.deleted_rules = [
+            rule
+            for rule in operation_state.deleted_rules
+            if ("delete", rule["RuleArn"]) not in rolled_back
+        ]
+        operation_state.updated_rules = [
+            rule
+            for rule in operation_state.updated_rules
+            if ("modify", rule["RuleArn"]) not in rolled_back
+        ]
+        operation_state.reprioritised_rules = [
+            rule
+            for rule in operation_state.reprioritised_rules
+            if ("reprioritise", rule["RuleArn"]) not in rolled_back
+        ]
+
+        return operation_state
+
+    @staticmethod
+    def _restore_journal_entry(operation_state: OperationState, pending: dict, done: dict):
+        operation = pending["operation"]
+        if operation == "create":
+            operation_state.created_rules.append(done["rule"])
+        elif operation == "delete":
+            operation_state.deleted_rules.append(pending["rule"])
+        elif operation == "modify":
+            operation_state.rule_snapshots.setdefault(pending["rule"]["RuleArn"], pending["rule"])
+            operation_state.updated_rules.append(done["rule"])
+        elif operation == "reprioritise":
+            for rule in pending["rules"]:
+                operation_state.rule_snapshots.setdefault(rule["RuleArn"], rule)
+            operation_state.reprioritised_rules.extend(done["rules"])
+
     def _execute_rule_updates(self, environment: str, operation_state: OperationState):
-        platform_config = self.config_provider.get_enriched_config()
+        rule_plan = self._plan_rule_updates(environment)
+        operation_state.listener_arn = rule_plan.listener_arn
+        if rule_plan.has_changes():
+            operation_state.start_journal(rule_plan.listener_arn)
+        self._apply_rule_plan(rule_plan, operation_state)
+        return rule_plan
+
+    def _plan_rule_updates(self, environment: str) -> RulePlan:
+        """Work out the rule changes from one read of the listener's rules and
+        the environment's target groups, without changing anything."""
+        rule_plan = RulePlan()
+
+        platform_config = self._get_platform_config()
 
         application_name = platform_config.get("application", "")
-        application = self.load_application(app=application_name)
+        application = self._get_application(application_name)
 
         service_deployment_mode = (
             platform_config.get("environments")
@@ -117,7 +503,7 @@ class UpdateALBRules:
             application.name, environment
         )
 
-        operation_state.listener_arn = listener_arn
+        rule_plan.listener_arn = listener_arn
 
         self.io.debug(f"Listener ARN: {listener_arn}")
 
@@ -157,148 +543,306 @@ class UpdateALBRules:
 
                 grouped[(service.name, service.http.path)].extend(service.http.alias)
 
-            rules = []
-            for (name, path), aliases in grouped.items():
-                path_pattern = ["/*"] if path == "/" else [path, f"{path}/*"]
-                condition_length = len(aliases) + len(path_pattern)
-
-                # AWS allows a maximum of 5 condition values per rule, this includes host and path values
-                max_conditions = 5
-                if condition_length > max_conditions:
-                    i = 0
-                    while i < condition_length:
-                        remaining_slots = max_conditions - len(path_pattern)
-                        alias_split = aliases[i : i + remaining_slots] if aliases else []
-                        if not alias_split:
-                            break
-
-                        rules.append(
-                            {
-                                "service": name,
-                                "path": path,
-                                "path_pattern": path_pattern,
-                                "aliases": sorted(set(alias_split)),
-                            }
-                        )
-                        i += remaining_slots
-                else:
-                    rules.append(
-                        {
-                            "service": name,
-                            "path": path,
-                            "path_pattern": path_pattern,
-                            "aliases": sorted(set(aliases)),
-                        }
-                    )
-
-            rules.sort(
-                key=lambda r: (len([s for s in r["path"].split("/") if s]), r["aliases"]),
-                reverse=True,
-            )
-
-            platform_rules = mapped_rules.get(RuleType.PLATFORM.value, [])
+            rules = self._pack_platform_rules(grouped)
+            rule_plan.unpacked_rule_count = self._count_unpacked_platform_rules(grouped)
+            rule_plan.packed_rule_count = len(rules)
 
+            desired_rules = []
             rule_priority = PLATFORM_RULE_STARTING_PRIORITY
             for rule in rules:
-                actions = [
-                    {"Type": "forward", "TargetGroupArn": service_mapped_tgs[rule["service"]]}
-                ]
-                conditions = [
-                    {"Field": "host-header", "HostHeaderConfig": {"Values": rule["aliases"]}},
-                    {
-                        "Field": "path-pattern",
-                        "PathPatternConfig": {"Values": rule["path_pattern"]},
-                    },
-                ]
-                tags = [
-                    {"Key": "application", "Value": application_name},
-                    {"Key": "environment", "Value": environment},
-                    {"Key": "service", "Value": rule["service"]},
-                    {"Key": "reason", "Value": "service"},
-                    {"Key": "managed-by", "Value": MANAGED_BY_PLATFORM},
-                ]
-
-                try:
-                    rule = self.load_balancer.create_rule(
-                        listener_arn,
-                        actions,
-                        conditions,
-                        rule_priority,
-                        tags,
-                    )["Rules"][0]
-                    rule_arn = rule["RuleArn"]
-
-                    if rule_arn in [rule["RuleArn"] for rule in platform_rules]:
-                        operation_state.updated_rules.append(rule)
-                    else:
-                        operation_state.created_rules.append(rule)
-
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "PriorityInUse":
-                        existing_rule = [
-                            r for r in platform_rules if r["Priority"] == str(rule_priority)
-                        ]
-                        if not existing_rule:
-                            raise PlatformException(
-                                f"Priority {rule_priority} in use but no matching platform rule found."
-                            )
-
-                        self._delete_rules(existing_rule, operation_state)
-
-                        rule = self.load_balancer.create_rule(
-                            listener_arn,
-                            actions,
-                            conditions,
-                            rule_priority,
-                            tags,
-                        )["Rules"][0]
-
-                        operation_state.created_rules.append(rule)
-                    else:
-                        raise
-
+                desired_rules.append(
+                    PlatformRule(
+                        service=rule["service"],
+                        priority=rule_priority,
+                        aliases=rule["aliases"],
+                        path_pattern=rule["path_pattern"],
+                        target_group_arn=service_mapped_tgs[rule["service"]],
+                        tags={
+                            "application": application_name,
+                            "environment": environment,
+                            "service": rule["service"],
+                            "reason": "service",
+                            "managed-by": MANAGED_BY_PLATFORM,
+                        },
+                    )
+                )
                 rule_priority += RULE_PRIORITY_INCREMENT
 
-            # Remove dangling rules
-            managed_rules = [
-                rule["RuleArn"]
-                for rules in [
-                    operation_state.created_rules,
-                    operation_state.updated_rules,
-                    operation_state.deleted_rules,
-                ]
-                for rule in rules
-            ]
-
-            for rule in platform_rules:
-                if rule["RuleArn"] not in managed_rules:
-                    self._delete_rules([rule], operation_state)
+            self._plan_platform_rules(
+                rule_plan, desired_rules, mapped_rules.get(RuleType.PLATFORM.value, [])
+            )
 
         # Remove dummy rules
         if service_deployment_mode == Deployment.PLATFORM.value:
-            self._delete_rules(mapped_rules.get(RuleType.DUMMY.value, []), operation_state)
+            rule_plan.rules_to_delete.extend(mapped_rules.get(RuleType.DUMMY.value, []))
 
         if (
             service_deployment_mode == Deployment.COPILOT.value
             or service_deployment_mode == Deployment.DUAL_DEPLOY_COPILOT.value
         ):
-            rules_to_delete = mapped_rules.get(RuleType.PLATFORM.value, [])
-            if not rules_to_delete:
-                return
+            rule_plan.rules_to_delete_on_confirm = mapped_rules.get(RuleType.PLATFORM.value, [])
+
+        return rule_plan
+
+    def _plan_platform_rules(
+        self,
+        rule_plan: RulePlan,
+        desired_rules: list[PlatformRule],
+        platform_rules: list[dict],
+    ):
+        """
+        Plan the changes that make the listener's platform rules match the
+        desired rules with as few API calls as possible.
+
+        Existing rules are reused wherever they can be. They are moved with a
+        single set_rule_priorities call and changed in place with modify_rule,
+        so a service's rules are only created or deleted when it needs more or
+        fewer of them.
+        """
+        pairs, rules_to_create, rules_to_delete = self._match_platform_rules(
+            desired_rules, platform_rules
+        )
+
+        rule_plan.rules_to_create = rules_to_create
+        rule_plan.rules_to_modify = [
+            (desired, rule)
+            for desired, rule in pairs
+            if not desired.routes_like(rule) or not desired.tagged_like(rule)
+        ]
+        rule_plan.rules_to_reprioritise = [
+            (rule, desired.priority)
+            for desired, rule in pairs
+            if int(rule["Priority"]) != desired.priority
+        ]
+
+        needed_priorities = {priority for _, priority in rule_plan.rules_to_reprioritise} | {
+            desired.priority for desired in rules_to_create
+        }
+        rule_plan.rules_to_free = [
+            rule for rule in rules_to_delete if int(rule["Priority"]) in needed_priorities
+        ]
+        rule_plan.rules_to_delete = [
+            rule for rule in rules_to_delete if int(rule["Priority"]) not in needed_priorities
+        ]
+
+    def _apply_rule_plan(self, rule_plan: RulePlan, operation_state: OperationState):
+        self._delete_rules(rule_plan.rules_to_free, operation_state)
+
+        # Rules are rewritten before they move, and each modify_rule changes a rule's
+        # conditions and actions together, so a rule never serves its new priority
+        # with the routing it had at its old one.
+        for desired, rule in rule_plan.rules_to_modify:
+            rule_arn = rule["RuleArn"]
+            operation_state.rule_snapshots.setdefault(rule_arn, rule)
+            entry_id = operation_state.record_pending("modify", rule=rule)
+            updated_rule = rule
+            if not desired.routes_like(rule):
+                updated_rule = self.load_balancer.modify_rule(
+                    rule_arn, desired.actions, desired.conditions
+                )["Rules"][0]
+            if not desired.tagged_like(rule):
+                self.load_balancer.add_tags(rule_arn, desired.tag_list)
+            operation_state.updated_rules = [
+                rule for rule in operation_state.updated_rules if rule["RuleArn"] != rule_arn
+            ] + [updated_rule]
+            operation_state.record_done(entry_id, "modify", rule=updated_rule)
+            self.io.debug(f"Modified existing rule: {rule_arn}")
+
+        if rule_plan.rules_to_reprioritise:
+            new_priorities = {}
+            for rule, priority in rule_plan.rules_to_reprioritise:
+                operation_state.rule_snapshots.setdefault(rule["RuleArn"], rule)
+                new_priorities[rule["RuleArn"]] = priority
+            entry_id = operation_state.record_pending(
+                "reprioritise",
+                rules=[rule for rule, _ in rule_plan.rules_to_reprioritise],
+                priorities=new_priorities,
+            )
+            reprioritised_rules = self.load_balancer.set_rule_priorities(new_priorities)["Rules"]
+            # A resumed update may move rules which the interrupted one had already moved
+            operation_state.reprioritised_rules = [
+                rule
+                for rule in operation_state.reprioritised_rules
+                if rule["RuleArn"] not in new_priorities
+            ] + reprioritised_rules
+            operation_state.record_done(entry_id, "reprioritise", rules=reprioritised_rules)
+            self.io.debug(f"Reprioritised existing rules: {list(new_priorities)}")
 
+        for desired in rule_plan.rules_to_create:
+            entry_id = operation_state.record_pending(
+                "create", priority=desired.priority, tags=desired.tags
+            )
+            created_rule = self.load_balancer.create_rule(
+                rule_plan.listener_arn,
+                desired.actions,
+                desired.conditions,
+                desired.priority,
+                desired.tag_list,
+            )["Rules"][0]
+            operation_state.created_rules.append(created_rule)
+            operation_state.record_done(entry_id, "create", rule=created_rule)
+
+        self._delete_rules(rule_plan.rules_to_delete, operation_state)
+
+        if rule_plan.rules_to_delete_on_confirm:
             self.io.warn("Platform rules will be deleted")
-            self._output_rule_changes(rules_to_delete)
+            self._output_rule_changes(rule_plan.rules_to_delete_on_confirm)
             if self.io.confirm(
                 f"This command is destructive and will remove load balancer listener rules created by the platform, you may lose access to your services. Are you sure you want to continue?"
             ):
-                self._delete_rules(rules_to_delete, operation_state)
+                self._delete_rules(rule_plan.rules_to_delete_on_confirm, operation_state)
+
+    def _output_plan(self, rule_plan: RulePlan):
+        self._output_packing_report(rule_plan)
+        if not rule_plan.has_changes():
+            self.io.info("No rule updates required")
+            return
+
+        if rule_plan.rules_to_create:
+            self.io.info(f"Rules to create: {len(rule_plan.rules_to_create)}")
+            self._output_rule_changes(
+                [desired.to_rule("(new rule)") for desired in rule_plan.rules_to_create]
+            )
+        if rule_plan.rules_to_modify:
+            self.io.info(f"Rules to modify: {len(rule_plan.rules_to_modify)}")
+            self._output_rule_changes(
+                [desired.to_rule(rule["RuleArn"]) for desired, rule in rule_plan.rules_to_modify]
+            )
+        if rule_plan.rules_to_reprioritise:
+            self.io.info(f"Rules to reprioritise: {len(rule_plan.rules_to_reprioritise)}")
+            for rule, priority in rule_plan.rules_to_reprioritise:
+                self.io.info(f"ARN: {rule['RuleArn']}")
+                self.io.info(f"Priority: {rule['Priority']} -> {priority}\n")
+        rules_to_delete = (
+            rule_plan.rules_to_free
+            + rule_plan.rules_to_delete
+            + rule_plan.rules_to_delete_on_confirm
+        )
+        if rules_to_delete:
+            self.io.info(f"Rules to delete: {len(rules_to_delete)}")
+            self._output_rule_changes(rules_to_delete)
+
+        self.io.info(f"Applying this plan would make {rule_plan.api_call_count()} ELB API calls.")
+
+    def _output_packing_report(self, rule_plan: RulePlan):
+        if rule_plan.packed_rule_count is None:
+            return
+        self.io.info(
+            f"Platform listener rules: {rule_plan.packed_rule_count} after condition packing, {rule_plan.unpacked_rule_count} before"
+        )
+
+    @staticmethod
+    def _pack_platform_rules(grouped: dict[tuple[str, str], list[str]]) -> list[dict]:
+        """
+        Pack each service's host and path values into as few listener rules as
+        possible, ordered most specific path first.
+
+        A service's paths which are at the same depth and served on the same
+        hosts never match the same request, so they can share rules without
+        changing which service a request reaches or the order rules are
+        evaluated in.
+        """
+        paths_by_route = defaultdict(list)
+        for (service, path), aliases in grouped.items():
+            depth = len([s for s in path.split("/") if s])
+            paths_by_route[(service, depth, tuple(sorted(set(aliases))))].append(path)
+
+        rules = []
+        for (service, depth, aliases), paths in paths_by_route.items():
+            path_patterns = [
+                pattern
+                for path in paths
+                for pattern in (["/*"] if path == "/" else [path, f"{path}/*"])
+            ]
+            alias_count = max(len(aliases), 1)
+            path_slots = min(
+                range(1, min(len(path_patterns), MAX_RULE_CONDITION_VALUES - 1) + 1),
+                key=lambda slots: (
+                    ceil(alias_count / (MAX_RULE_CONDITION_VALUES - slots))
+                    * ceil(len(path_patterns) / slots),
+                    -slots,
+                ),
+            )
+            alias_slots = MAX_RULE_CONDITION_VALUES - path_slots
+
+            for i in range(0, len(path_patterns), path_slots):
+                for j in range(0, alias_count, alias_slots):
+                    rules.append(
+                        {
+                            "service": service,
+                            "depth": depth,
+                            "path_pattern": path_patterns[i : i + path_slots],
+                            "aliases": list(aliases[j : j + alias_slots]),
+                        }
+                    )
+
+        rules.sort(key=lambda r: (r["depth"], r["aliases"]), reverse=True)
+
+        return rules
+
+    @staticmethod
+    def _count_unpacked_platform_rules(grouped: dict[tuple[str, str], list[str]]) -> int:
+        """The number of rules needed with one rule per chunk of each (service,
+        path)'s aliases, as before condition packing."""
+        rule_count = 0
+        for (_, path), aliases in grouped.items():
+            path_values = 1 if path == "/" else 2
+            if len(aliases) + path_values <= MAX_RULE_CONDITION_VALUES:
+                rule_count += 1
+            else:
+                rule_count += ceil(len(aliases) / (MAX_RULE_CONDITION_VALUES - path_values))
+        return rule_count
+
+    @staticmethod
+    def _match_platform_rules(
+        desired_rules: list[PlatformRule], platform_rules: list[dict]
+    ) -> tuple[list[tuple[PlatformRule, dict]], list[PlatformRule], list[dict]]:
+        """
+        Pair each desired rule with the existing rule of the same service
+        needing the least change.
+
+        A rule is never reused for another service, since it would briefly route
+        that service's traffic while it is being changed.
+
+        Returns the pairs, the desired rules left over to create and the
+        existing rules left over to delete.
+        """
+        matchers = [
+            lambda desired, rule: desired.routes_like(rule)
+            and desired.tagged_like(rule)
+            and desired.priority == int(rule["Priority"]),
+            lambda desired, rule: desired.routes_like(rule) and desired.tagged_like(rule),
+            lambda desired, rule: desired.service == rule["Tags"].get("service")
+            and desired.priority == int(rule["Priority"]),
+            lambda desired, rule: desired.service == rule["Tags"].get("service"),
+        ]
+
+        remaining_rules = sorted(platform_rules, key=lambda rule: int(rule["Priority"]))
+        matched = {}
+        for matches in matchers:
+            for index, desired in enumerate(desired_rules):
+                if index in matched:
+                    continue
+                rule = next((rule for rule in remaining_rules if matches(desired, rule)), None)
+                if rule:
+                    matched[index] = rule
+                    remaining_rules.remove(rule)
+
+        pairs = [(desired_rules[index], matched[index]) for index in sorted(matched)]
+        rules_to_create = [
+            desired for index, desired in enumerate(desired_rules) if index not in matched
+        ]
+
+        return pairs, rules_to_create, remaining_rules
 
     def _delete_rules(self, rules: list[dict], operation_state: OperationState):
         for rule in rules:
             rule_arn = rule["RuleArn"]
             try:
+                entry_id = operation_state.record_pending("delete", rule=rule)
                 self.load_balancer.delete_listener_rule_by_resource_arn(rule_arn)
                 operation_state.deleted_rules.append(rule)
+                operation_state.record_done(entry_id, "delete")
                 self.io.debug(f"Deleted existing rule: {rule_arn}")
             except Exception as e:
                 self.io.error(f"Failed to delete existing rule {rule_arn}: {str(e)}")
@@ -323,7 +867,9 @@ class UpdateALBRules:
     def _get_tg_arns_for_platform_services(
         self, application: str, environment: str, managed_by: str = MANAGED_BY_SERVICE_TERRAFORM
     ) -> dict:
-        tgs = self.load_balancer.get_target_groups_with_tags([])
+        tgs = self.load_balancer.get_target_groups_by_tags(
+            {"application": application, "environment": environment, "managed-by": managed_by}
+        )
         service_mapped_tgs = {}
         for tg in tgs:
             if (
@@ -339,42 +885,96 @@ class UpdateALBRules:
         return service_mapped_tgs
 
     def _rollback_changes(self, operation_state: OperationState):
+        """
+        Undo the changes in operation_state, running up to
+        ALB_ROLLBACK_MAX_WORKERS API calls at a time.
+
+        Created rules are removed and priorities restored before deleted rules
+        are recreated, so the priorities they need are free again.
+        """
         rollback_errors = []
-        delete_rollbacks = []
-        create_rollbacks = []
-        for rule in operation_state.created_rules:
+
+        def delete_created_rule(rule):
             rule_arn = rule["RuleArn"]
+            self.io.debug(f"Rolling back: Deleting created rule {rule_arn}")
             try:
-                self.io.debug(f"Rolling back: Deleting created rule {rule_arn}")
                 self.load_balancer.delete_listener_rule_by_resource_arn(rule_arn)
-                delete_rollbacks.append(rule_arn)
-            except Exception as e:
-                error_msg = f"Failed to delete rule {rule_arn} during rollback: {str(e)}"
-                rollback_errors.append(error_msg)
+            except ClientError as e:
+                # An earlier, interrupted, rollback may already have deleted it
+                if e.response["Error"]["Code"] != "RuleNotFound":
+                    raise
+            operation_state.record_rolled_back("create", [rule_arn])
+            return rule_arn
 
-        for rule_snapshot in operation_state.deleted_rules:
-            rule_arn = rule_snapshot["RuleArn"]
+        delete_rollbacks = self._run_rollback_operations(
+            delete_created_rule,
+            operation_state.created_rules,
+            lambda rule: f"Failed to delete rule {rule['RuleArn']} during rollback",
+            rollback_errors,
+        )
+
+        original_priorities = {
+            rule["RuleArn"]: int(operation_state.rule_snapshots[rule["RuleArn"]]["Priority"])
+            for rule in operation_state.reprioritised_rules
+        }
+        if original_priorities:
             try:
-                self.io.debug(f"Rolling back: Recreating deleted rule {rule_arn}")
-                create_rollbacks.append(
-                    self.load_balancer.create_rule(
-                        operation_state.listener_arn,
-                        actions=rule_snapshot["Actions"],
-                        conditions=[
-                            {"Field": key, "Values": value}
-                            for key, value in rule_snapshot["Conditions"].items()
-                        ],
-                        priority=int(rule_snapshot["Priority"]),
-                        tags=[
-                            {"Key": key, "Value": value}
-                            for key, value in rule_snapshot["Tags"].items()
-                        ],
-                    )["Rules"][0]["RuleArn"]
-                )
+                self.io.debug(f"Rolling back: Restoring priorities of {list(original_priorities)}")
+                self.load_balancer.set_rule_priorities(original_priorities)
+                operation_state.record_rolled_back("reprioritise", list(original_priorities))
             except Exception as e:
-                error_msg = f"Failed to recreate rule {rule_arn} during rollback: {str(e)}"
+                error_msg = f"Failed to restore rule priorities during rollback: {str(e)}"
                 rollback_errors.append(error_msg)
 
+        def restore_modified_rule(rule):
+            rule_snapshot = operation_state.rule_snapshots[rule["RuleArn"]]
+            rule_arn = rule_snapshot["RuleArn"]
+            self.io.debug(f"Rolling back: Restoring modified rule {rule_arn}")
+            self.load_balancer.modify_rule(
+                rule_arn,
+                actions=rule_snapshot["Actions"],
+                conditions=[
+                    {"Field": key, "Values": value}
+                    for key, value in rule_snapshot["Conditions"].items()
+                ],
+            )
+            self.load_balancer.add_tags(
+                rule_arn,
+                [{"Key": key, "Value": value} for key, value in rule_snapshot["Tags"].items()],
+            )
+            operation_state.record_rolled_back("modify", [rule_arn])
+            return rule_arn
+
+        self._run_rollback_operations(
+            restore_modified_rule,
+            operation_state.updated_rules,
+            lambda rule: f"Failed to restore rule {rule['RuleArn']} during rollback",
+            rollback_errors,
+        )
+
+        def recreate_deleted_rule(rule_snapshot):
+            rule_arn = rule_snapshot["RuleArn"]
+            self.io.debug(f"Rolling back: Recreating deleted rule {rule_arn}")
+            recreated_arn = self.load_balancer.create_rule(
+                operation_state.listener_arn,
+                actions=rule_snapshot["Actions"],
+                conditions=[
+                    {"Field": key, "Values": value}
+                    for key, value in rule_snapshot["Conditions"].items()
+                ],
+                priority=int(rule_snapshot["Priority"]),
+                tags=[{"Key": key, "Value": value} for key, value in rule_snapshot["Tags"].items()],
+            )["Rules"][0]["RuleArn"]
+            operation_state.record_rolled_back("delete", [rule_arn])
+            return recreated_arn
+
+        create_rollbacks = self._run_rollback_operations(
+            recreate_deleted_rule,
+            operation_state.deleted_rules,
+            lambda rule: f"Failed to recreate rule {rule['RuleArn']} during rollback",
+            rollback_errors,
+        )
+
         if rollback_errors:
             self.io.warn("Some rollback operations failed. Manual intervention may be required.")
             errors = "\n".join(rollback_errors)
@@ -385,6 +985,23 @@ class UpdateALBRules:
                 f"Rolled back rules by creating: {create_rollbacks} \n and deleting {delete_rollbacks}"
             )
 
+    @staticmethod
+    def _run_rollback_operations(operation, rules: list[dict], describe_failure, errors: list):
+        """Run operation for every rule concurrently, adding failures to errors
+        and returning the results of those which succeeded in order."""
+
+        def run(rule):
+            try:
+                return operation(rule), None
+            except Exception as e:
+                return None, f"{describe_failure(rule)}: {str(e)}"
+
+        with ThreadPoolExecutor(max_workers=ALB_ROLLBACK_MAX_WORKERS) as executor:
+            results = list(executor.map(run, rules))
+
+        errors.extend(error for _, error in results if error)
+        return [result for result, error in results if not error]
+
     def _output_rule_changes(self, rules):
         for rule in rules:
             hosts = []
@@ -54,24 +54,26 @@ class PlatformHelperVersionNotFoundException(PlatformException):
 class PlatformHelperVersioning:
     def __init__(
         self,
-        io: ClickIOProvider = ClickIOProvider(),
-        config_provider: ConfigProvider = ConfigProvider(),
-        environment_variable_provider: EnvironmentVariableProvider = EnvironmentVariableProvider(),
+        io: ClickIOProvider = None,
+        config_provider: ConfigProvider = None,
+        environment_variable_provider: EnvironmentVariableProvider = None,
         latest_version_provider: VersionProvider = PyPiLatestVersionProvider,
-        installed_version_provider: InstalledVersionProvider = InstalledVersionProvider(),
+        installed_version_provider: InstalledVersionProvider = None,
         allow_override_of_versioning_checks: bool = None,
         platform_helper_version_override: str = None,
     ):
-        self.io = io
-        self.config_provider = config_provider
+        self.io = io or ClickIOProvider()
+        self.config_provider = config_provider or ConfigProvider()
         self.latest_version_provider = latest_version_provider
-        self.installed_version_provider = installed_version_provider
+        self.installed_version_provider = installed_version_provider or InstalledVersionProvider()
         self.allow_override_of_versioning_checks = (
             allow_override_of_versioning_checks
             if allow_override_of_versioning_checks is not None
             else allow_override_of_versioning_checks_fn()
         )
-        self.environment_variable_provider = environment_variable_provider
+        self.environment_variable_provider = (
+            environment_variable_provider or EnvironmentVariableProvider()
+        )
         self.platform_helper_version_override = platform_helper_version_override
 
     def is_auto(self):
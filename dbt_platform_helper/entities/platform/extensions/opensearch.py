@@ -8,10 +8,7 @@ from pydantic import field_validator
 from pydantic import model_validator
 from schema import SchemaError
 
-from dbt_platform_helper.domain.plans import PlanLoader
-
-plan_manager = PlanLoader()
-plan_manager.load()
+from dbt_platform_helper.domain.plans import get_plan_loader
 
 OPENSEARCH_MAX_VOLUME_SIZE: dict[str, int] = {
     "tiny": 100,
@@ -71,7 +68,7 @@ class OpenSearch(BaseModel):
         default=None, description="DEPRECATED"
     )
     plan: Optional[str] = (
-        Field(  # TODO once python 3.10 is out of support - change str to Literal[*plan_manager.get_plan_names("opensearch")
+        Field(  # TODO once python 3.10 is out of support - change str to Literal[*get_plan_loader().get_plan_names("opensearch")
             default=None,
             description="""For convenience, can be used to apply sensible settings for volume size, number of instances etc.""",
         )
@@ -131,7 +128,7 @@ class OpenSearch(BaseModel):
     def validate_plan_name(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        allowed_plans = plan_manager.get_plan_names("opensearch")
+        allowed_plans = get_plan_loader().get_plan_names("opensearch")
         if v not in allowed_plans:
             raise ValueError(f"Plan must be one of {allowed_plans}")
         return v
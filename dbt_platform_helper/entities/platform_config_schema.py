@@ -9,7 +9,7 @@ from schema import Schema
 from schema import SchemaError
 
 from dbt_platform_helper.constants import PLATFORM_CONFIG_SCHEMA_VERSION
-from dbt_platform_helper.domain.plans import PlanLoader
+from dbt_platform_helper.domain.plans import get_plan_loader
 from dbt_platform_helper.entities.platform.extensions.opensearch import (
     OpensearchExtensionSchema,
 )
@@ -17,9 +17,6 @@ from dbt_platform_helper.entities.platform.extensions.opensearch import (
     external_user_access_validator,
 )
 
-plan_manager = PlanLoader()
-plan_manager.load()
-
 
 class PlatformConfigSchema:
     @staticmethod
@@ -300,7 +297,7 @@ class PlatformConfigSchema:
     @staticmethod
     def __opensearch_schema() -> dict:
         # TODO: DBTP-1943: Move to OpenSearch provider?
-        _valid_opensearch_plans = Or(*plan_manager.get_plan_names("opensearch"))
+        _valid_opensearch_plans = Or(*get_plan_loader().get_plan_names("opensearch"))
 
         return {
             "type": "opensearch",
@@ -328,7 +325,7 @@ class PlatformConfigSchema:
 
     @staticmethod
     def __postgres_schema() -> dict:
-        _valid_postgres_plans = Or(*plan_manager.get_plan_names("postgres"))
+        _valid_postgres_plans = Or(*get_plan_loader().get_plan_names("postgres"))
         _valid_postgres_version = Or(int, float)
 
         # TODO: DBTP-1943: Move to Postgres provider?
@@ -384,7 +381,7 @@ class PlatformConfigSchema:
 
     @staticmethod
     def __redis_schema() -> dict:
-        _valid_redis_plans = Or(*plan_manager.get_plan_names("redis"))
+        _valid_redis_plans = Or(*get_plan_loader().get_plan_names("redis"))
 
         return {
             "type": "redis",
@@ -6,6 +6,7 @@ from dbt_platform_helper.providers.aws.exceptions import UnableToRetrieveSSOAcco
 from dbt_platform_helper.providers.aws.exceptions import (
     UnableToRetrieveSSOAccountRolesList,
 )
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
 
 
@@ -72,4 +73,4 @@ class SSOAuthProvider:
     def _get_client(self, client: str):
         if not self.session:
             self.session = get_aws_session_or_abort()
-        return self.session.client(client)
+        return get_aws_client(self.session, client)
@@ -26,8 +26,8 @@ Then upgrade platform-helper to version {installed_platform_helper_version} and
 
 
 class ConfigLoader:
-    def __init__(self, file_provider=YamlFileProvider, io: ClickIOProvider = ClickIOProvider()):
-        self.io = io
+    def __init__(self, file_provider=YamlFileProvider, io: ClickIOProvider = None):
+        self.io = io or ClickIOProvider()
         self.file_provider = file_provider
 
     def load(self, path):
@@ -45,15 +45,15 @@ class ConfigLoader:
 class ConfigProvider:
     def __init__(
         self,
-        config_validator: ConfigValidator = ConfigValidator(),
+        config_validator: ConfigValidator = None,
         file_provider: YamlFileProvider = YamlFileProvider,
-        io: ClickIOProvider = ClickIOProvider(),
+        io: ClickIOProvider = None,
         schema_version_for_installed_platform_helper: int = PLATFORM_CONFIG_SCHEMA_VERSION,
         installed_version_provider: InstalledVersionProvider = InstalledVersionProvider,
     ):
         self.config = {}
-        self.validator = config_validator
-        self.io = io
+        self.validator = config_validator or ConfigValidator()
+        self.io = io or ClickIOProvider()
         self.file_provider = file_provider
         self.schema_version_for_installed_platform_helper = (
             schema_version_for_installed_platform_helper
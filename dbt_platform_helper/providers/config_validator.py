@@ -8,6 +8,7 @@ from dbt_platform_helper.providers.aws.redis import Redis
 from dbt_platform_helper.providers.cache import Cache
 from dbt_platform_helper.providers.cache import GetAWSVersionStrategy
 from dbt_platform_helper.providers.io import ClickIOProvider
+from dbt_platform_helper.utils.aws import get_aws_client
 
 
 class ConfigValidatorError(PlatformException):
@@ -19,7 +20,7 @@ class ConfigValidator:
     def __init__(
         self,
         validations: Callable[[dict], None] = None,
-        io: ClickIOProvider = ClickIOProvider(),
+        io: ClickIOProvider = None,
         session: boto3.Session = None,
     ):
         self.validations = validations or [
@@ -34,7 +35,7 @@ class ConfigValidator:
             self.validate_alb_extension,
             self.validate_s3_extension,
         ]
-        self.io = io
+        self.io = io or ClickIOProvider()
         self.session = session
 
     def run_validations(self, config: dict):
@@ -85,9 +86,7 @@ class ConfigValidator:
             )
 
     def _get_client(self, service_name: str):
-        if self.session:
-            return self.session.client(service_name)
-        return boto3.client(service_name)
+        return get_aws_client(self.session, service_name)
 
     def validate_supported_redis_versions(self, config):
         return self._validate_extension_supported_versions(
@@ -6,8 +6,11 @@ from botocore.exceptions import ClientError
 
 from dbt_platform_helper.constants import CONDUIT_DOCKER_IMAGE_LOCATION
 from dbt_platform_helper.providers.aws.exceptions import CreateTaskTimeoutException
+from dbt_platform_helper.providers.parameter_store import ParametersNotFoundException
+from dbt_platform_helper.providers.parameter_store import ParameterStore
 from dbt_platform_helper.providers.secrets import Secrets
 from dbt_platform_helper.utils.application import Application
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.messages import abort_with_error
 
 
@@ -77,12 +80,17 @@ def get_postgres_admin_connection_string(
     master_secret_name = (
         f"/copilot/{app.name}/{env}/secrets/{_normalise_secret_name(addon_name)}_RDS_MASTER_ARN"
     )
-    master_secret_arn = ssm_client.get_parameter(Name=master_secret_name, WithDecryption=True)[
-        "Parameter"
-    ]["Value"]
+    parameters = ParameterStore(ssm_client).get_ssm_parameters_by_names(
+        [master_secret_name, read_only_secret_name]
+    )
+    if master_secret_name in parameters.missing:
+        raise ParametersNotFoundException([master_secret_name])
+    master_secret_arn = parameters.found[master_secret_name]["Value"]
+    read_only_secret = parameters.found.get(read_only_secret_name, {}).get("Value")
+
     connection_string = json.dumps(
         _get_secrets_provider(app, env).get_postgres_connection_data_updated_with_master_secret(
-            read_only_secret_name, master_secret_arn
+            read_only_secret_name, master_secret_arn, parameter_value=read_only_secret
         )
     )
 
@@ -164,8 +172,8 @@ def _normalise_secret_name(addon_name: str) -> str:
 def _get_secrets_provider(application: Application, env: str) -> Secrets:
     # TODO: DBTP-1946: We instantiate the secrets provider here to avoid rabbit holing, but something better probably possible when we are refactoring this area
     return Secrets(
-        application.environments[env].session.client("ssm"),
-        application.environments[env].session.client("secretsmanager"),
+        get_aws_client(application.environments[env].session, "ssm"),
+        get_aws_client(application.environments[env].session, "secretsmanager"),
         application.name,
         env,
     )
@@ -8,6 +8,7 @@ from dbt_platform_helper.providers.aws.exceptions import ImageNotFoundException
 from dbt_platform_helper.providers.aws.exceptions import MultipleImagesFoundException
 from dbt_platform_helper.providers.aws.exceptions import RepositoryNotFoundException
 from dbt_platform_helper.providers.io import ClickIOProvider
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
 
 NOT_A_UNIQUE_TAG_INFO = 'INFO: The tag "{image_ref}" is not a unique, commit-specific tag. Deploying the corresponding commit tag "{commit_tag}" instead.'
@@ -15,9 +16,9 @@ NO_ASSOCIATED_COMMIT_TAG_WARNING = 'WARNING: The AWS ECR image "{image_ref}" has
 
 
 class ECRProvider:
-    def __init__(self, session: Session = None, click_io: ClickIOProvider = ClickIOProvider()):
+    def __init__(self, session: Session = None, click_io: ClickIOProvider = None):
         self.session = session
-        self.click_io = click_io
+        self.click_io = click_io or ClickIOProvider()
 
     def get_ecr_repo_names(self) -> list[str]:
         out = []
@@ -99,4 +100,4 @@ class ECRProvider:
     def _get_client(self):
         if not self.session:
             self.session = get_aws_session_or_abort()
-        return self.session.client("ecr")
+        return get_aws_client(self.session, "ecr")
@@ -0,0 +1,86 @@
+import base64
+import json
+import os
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+from cryptography.fernet import InvalidToken
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+from dbt_platform_helper.platform_exception import PlatformException
+
+BUNDLE_FORMAT_VERSION = 1
+SCRYPT_COST = 2**15
+SCRYPT_BLOCK_SIZE = 8
+SCRYPT_PARALLELISM = 1
+
+
+class EncryptedBundleProvider:
+    """Reads and writes JSON documents encrypted with a key derived from a
+    passphrase."""
+
+    @staticmethod
+    def write(path: str, contents: dict, passphrase: str):
+        salt = os.urandom(16)
+        bundle = {
+            "version": BUNDLE_FORMAT_VERSION,
+            "kdf": {
+                "name": "scrypt",
+                "salt": base64.b64encode(salt).decode(),
+                "n": SCRYPT_COST,
+                "r": SCRYPT_BLOCK_SIZE,
+                "p": SCRYPT_PARALLELISM,
+            },
+            "ciphertext": Fernet(
+                EncryptedBundleProvider._derive_key(
+                    passphrase, salt, SCRYPT_COST, SCRYPT_BLOCK_SIZE, SCRYPT_PARALLELISM
+                )
+            )
+            .encrypt(json.dumps(contents).encode())
+            .decode(),
+        }
+
+        bundle_file = Path(path)
+        bundle_file.parent.mkdir(parents=True, exist_ok=True)
+        # Create the file readable by its owner only before anything is written to it
+        bundle_file.touch(mode=0o600)
+        bundle_file.chmod(0o600)
+        bundle_file.write_text(json.dumps(bundle, indent=2))
+
+    @staticmethod
+    def read(path: str, passphrase: str) -> dict:
+        """
+        Raises:
+            BundleNotFoundException: file is not there
+            InvalidBundleException: file is not an encrypted bundle, or the passphrase is wrong
+        """
+        bundle_file = Path(path)
+        if not bundle_file.exists():
+            raise BundleNotFoundException(path)
+
+        try:
+            bundle = json.loads(bundle_file.read_text())
+            kdf = bundle["kdf"]
+            key = EncryptedBundleProvider._derive_key(
+                passphrase, base64.b64decode(kdf["salt"]), kdf["n"], kdf["r"], kdf["p"]
+            )
+            return json.loads(Fernet(key).decrypt(bundle["ciphertext"].encode()))
+        except (ValueError, KeyError, TypeError, InvalidToken):
+            raise InvalidBundleException(path)
+
+    @staticmethod
+    def _derive_key(passphrase: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        key = Scrypt(salt=salt, length=32, n=n, r=r, p=p).derive(passphrase.encode())
+        return base64.urlsafe_b64encode(key)
+
+
+class BundleNotFoundException(PlatformException):
+    def __init__(self, path: str):
+        super().__init__(f"""Bundle file '{path}' does not exist.""")
+
+
+class InvalidBundleException(PlatformException):
+    def __init__(self, path: str):
+        super().__init__(
+            f"""Could not decrypt '{path}'. Check the passphrase and that the file is an exported secrets bundle."""
+        )
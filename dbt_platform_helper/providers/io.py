@@ -1,3 +1,5 @@
+import threading
+
 import click
 
 from dbt_platform_helper.platform_exception import PlatformException
@@ -7,8 +9,8 @@ from dbt_platform_helper.providers.environment_variable import (
 
 
 class ClickIOProvider:
-    def __init__(self, env_var_provider=EnvironmentVariableProvider()):
-        self.env_var_provider = env_var_provider
+    def __init__(self, env_var_provider=None):
+        self.env_var_provider = env_var_provider or EnvironmentVariableProvider()
         self.debug_flag = self.env_var_provider.get("DEBUG")
 
     def warn(self, message: str):
@@ -59,5 +61,53 @@ class ClickIOProvider:
             self.info("\n".join(messages["info"]))
 
 
+class PrefixedIOProvider:
+    """
+    Prefixes every message with a label, such as an environment name, so the
+    output of work running concurrently can be told apart.
+
+    Prompts from all instances are asked one at a time.
+    """
+
+    _prompt_lock = threading.Lock()
+
+    def __init__(self, prefix: str, io: ClickIOProvider = None):
+        self.prefix = prefix
+        self.io = io or ClickIOProvider()
+
+    def warn(self, message: str):
+        self.io.warn(self._prefixed(message))
+
+    def debug(self, message: str):
+        self.io.debug(self._prefixed(message))
+
+    def error(self, message: str):
+        self.io.error(self._prefixed(message))
+
+    def info(self, message: str, **kwargs):
+        self.io.info(self._prefixed(message), **kwargs)
+
+    def input(
+        self, message: str, hide_input=False, confirmation_prompt=False, input_type=str
+    ) -> str:
+        with self._prompt_lock:
+            return self.io.input(
+                self._prefixed(message),
+                hide_input=hide_input,
+                confirmation_prompt=confirmation_prompt,
+                input_type=input_type,
+            )
+
+    def confirm(self, message: str) -> bool:
+        with self._prompt_lock:
+            return self.io.confirm(self._prefixed(message))
+
+    def abort_with_error(self, message: str):
+        self.io.abort_with_error(self._prefixed(message))
+
+    def _prefixed(self, message: str) -> str:
+        return f"[{self.prefix}] {message}"
+
+
 class ClickIOProviderException(PlatformException):
     pass
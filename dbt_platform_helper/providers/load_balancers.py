@@ -1,13 +1,22 @@
 import json
+import threading
+from pathlib import Path
 
 from boto3 import Session
+from botocore.exceptions import ClientError
 
 from dbt_platform_helper.constants import MANAGED_BY_PLATFORM_TERRAFORM
 from dbt_platform_helper.constants import ROUTED_TO_PLATFORM_MODES
 from dbt_platform_helper.platform_exception import PlatformException
 from dbt_platform_helper.providers.io import ClickIOProvider
 from dbt_platform_helper.providers.parameter_store import ParameterStore
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
+from dbt_platform_helper.utils.aws import read_cache_file
+from dbt_platform_helper.utils.aws import write_cache_file
+
+LOAD_BALANCER_CACHE_FILE = Path.home() / ".platform-helper" / "load-balancer-cache.json"
+_LOAD_BALANCER_CACHE_LOCK = threading.Lock()
 
 
 def normalise_to_cidr(ip: str):
@@ -30,17 +39,17 @@ class ALBDataNormaliser:
 
 class LoadBalancerProvider:
 
-    def __init__(self, session: Session = None, io: ClickIOProvider = ClickIOProvider()):
+    def __init__(self, session: Session = None, io: ClickIOProvider = None):
         self.session = session
         self.evlb_client = self._get_client("elbv2")
         self.rg_tagging_client = self._get_client("resourcegroupstaggingapi")
         self.parameter_store_provider = ParameterStore(self._get_client("ssm"))
-        self.io = io
+        self.io = io or ClickIOProvider()
 
     def _get_client(self, client: str):
         if not self.session:
             self.session = get_aws_session_or_abort()
-        return self.session.client(client)
+        return get_aws_client(self.session, client)
 
     def find_target_group(self, app: str, env: str, svc: str) -> str:
 
@@ -132,6 +141,57 @@ class LoadBalancerProvider:
                 tg["Tags"] = ALBDataNormaliser.tags_to_dict(tg["Tags"])
         return tgs_with_tags
 
+    def get_target_groups_by_tags(self, tags: dict[str, str], normalise: bool = True) -> list[dict]:
+        """
+        Return the target groups carrying all of the given tags.
+
+        The tag filtering happens server side in the Resource Groups Tagging
+        API, so only the matching target groups are described.
+        """
+        paginator = self.rg_tagging_client.get_paginator("get_resources")
+        page_iterator = paginator.paginate(
+            TagFilters=[{"Key": key, "Values": [value]} for key, value in tags.items()],
+            ResourceTypeFilters=[
+                "elasticloadbalancing:targetgroup",
+            ],
+        )
+
+        tags_by_arn = {}
+        for page in page_iterator:
+            for resource in page["ResourceTagMappingList"]:
+                tags_by_arn[resource["ResourceARN"]] = resource["Tags"]
+
+        target_groups = []
+        arns = list(tags_by_arn)
+        chunk_size = 20
+        for i in range(0, len(arns), chunk_size):
+            target_groups.extend(self._describe_existing_target_groups(arns[i : i + chunk_size]))
+
+        for tg in target_groups:
+            tg["Tags"] = tags_by_arn.get(tg["TargetGroupArn"], [])
+            if normalise:
+                tg["Tags"] = ALBDataNormaliser.tags_to_dict(tg["Tags"])
+
+        return target_groups
+
+    def _describe_existing_target_groups(self, target_group_arns: list[str]) -> list[dict]:
+        try:
+            return self.get_target_groups(target_group_arns)
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "TargetGroupNotFound":
+                raise
+
+        # The tagging API can briefly return target groups which have just been deleted
+        target_groups = []
+        for target_group_arn in target_group_arns:
+            try:
+                target_groups.extend(self.get_target_groups([target_group_arn]))
+            except ClientError as error:
+                if error.response["Error"]["Code"] != "TargetGroupNotFound":
+                    raise
+
+        return target_groups
+
     def get_https_certificate_for_listener(self, listener_arn: str, env: str):
         certificates = []
         paginator = self.evlb_client.get_paginator("describe_listener_certificates")
@@ -186,26 +246,104 @@ class LoadBalancerProvider:
         return load_balancers
 
     def get_load_balancer_for_application(self, app: str, env: str) -> str:
-        load_balancers = self.get_load_balancers()
-        tag_descriptions = []
-        for i in range(0, len(load_balancers), 20):
-            chunk = load_balancers[i : i + 20]
-            tag_descriptions.extend(
-                self.evlb_client.describe_tags(ResourceArns=chunk)["TagDescriptions"]
-            )  # describe_tags cannot be paginated - 04/04/2025
+        """
+        Return the ARN of the platform managed load balancer for the
+        environment.
+
+        The ARN is cached on disk per AWS profile, application and environment,
+        and is only reused once a single describe_tags call confirms the load
+        balancer still exists and is still tagged for the environment.
+        """
+        cache_key = self._load_balancer_cache_key(app, env)
+        cached_arn = read_cache_file(LOAD_BALANCER_CACHE_FILE).get(cache_key) if cache_key else None
+        if cached_arn:
+            if self._load_balancer_is_tagged_for(cached_arn, app, env):
+                return cached_arn
+            self._forget_load_balancer(cache_key)
+
+        # TODO: DBTP-1967: copilot hangover, creates coupling to specific tags could update to check application and environment
+        paginator = self.rg_tagging_client.get_paginator("get_resources")
+        page_iterator = paginator.paginate(
+            TagFilters=[
+                {"Key": "copilot-application", "Values": [app]},
+                {"Key": "copilot-environment", "Values": [env]},
+                {"Key": "managed-by", "Values": [MANAGED_BY_PLATFORM_TERRAFORM]},
+            ],
+            ResourceTypeFilters=[
+                "elasticloadbalancing:loadbalancer",
+            ],
+        )
 
-        for lb in tag_descriptions:
-            tags = {t["Key"]: t["Value"] for t in lb["Tags"]}
-            # TODO: DBTP-1967: copilot hangover, creates coupling to specific tags could update to check application and environment
-            if (
-                tags.get("copilot-application") == app
-                and tags.get("copilot-environment") == env
-                and tags.get("managed-by", "") == MANAGED_BY_PLATFORM_TERRAFORM
-            ):
-                return lb["ResourceArn"]
+        for page in page_iterator:
+            for resource in page["ResourceTagMappingList"]:
+                load_balancer_arn = resource["ResourceARN"]
+                # The tagging API can briefly return load balancers which have just been deleted
+                if self._load_balancer_is_active(load_balancer_arn):
+                    if cache_key:
+                        self._cache_load_balancer(cache_key, load_balancer_arn)
+                    return load_balancer_arn
 
         raise LoadBalancerNotFoundException(app, env)
 
+    def _load_balancer_cache_key(self, app: str, env: str):
+        if not isinstance(self.session, Session):
+            return None
+        return json.dumps([self.session.profile_name, self.session.region_name, app, env])
+
+    def _load_balancer_is_active(self, load_balancer_arn: str) -> bool:
+        try:
+            load_balancers = self.evlb_client.describe_load_balancers(
+                LoadBalancerArns=[load_balancer_arn]
+            )["LoadBalancers"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] in ["LoadBalancerNotFound", "ValidationError"]:
+                return False
+            raise
+
+        return any(lb.get("State", {}).get("Code") != "failed" for lb in load_balancers)
+
+    def _load_balancer_is_tagged_for(self, load_balancer_arn: str, app: str, env: str) -> bool:
+        try:
+            tag_descriptions = self.evlb_client.describe_tags(ResourceArns=[load_balancer_arn])[
+                "TagDescriptions"
+            ]
+        except ClientError as error:
+            if error.response["Error"]["Code"] in ["LoadBalancerNotFound", "ValidationError"]:
+                return False
+            raise
+
+        expected_tags = {
+            "copilot-application": app,
+            "copilot-environment": env,
+            "managed-by": MANAGED_BY_PLATFORM_TERRAFORM,
+        }
+        return any(
+            expected_tags.items()
+            <= {tag["Key"]: tag["Value"] for tag in description["Tags"]}.items()
+            for description in tag_descriptions
+        )
+
+    @staticmethod
+    def _forget_load_balancer(cache_key: str):
+        with _LOAD_BALANCER_CACHE_LOCK:
+            load_balancers = read_cache_file(LOAD_BALANCER_CACHE_FILE)
+            if load_balancers.pop(cache_key, None):
+                try:
+                    write_cache_file(LOAD_BALANCER_CACHE_FILE, load_balancers)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _cache_load_balancer(cache_key: str, load_balancer_arn: str):
+        with _LOAD_BALANCER_CACHE_LOCK:
+            load_balancers = read_cache_file(LOAD_BALANCER_CACHE_FILE)
+            load_balancers[cache_key] = load_balancer_arn
+            try:
+                write_cache_file(LOAD_BALANCER_CACHE_FILE, load_balancers)
+            except OSError:
+                # The cache only saves time, so failing to write it is not an error
+                pass
+
     def get_host_header_conditions(self, listener_arn: str, target_group_arn: str) -> list:
         rules = []
         paginator = self.evlb_client.get_paginator("describe_rules")
@@ -314,6 +452,24 @@ class LoadBalancerProvider:
             Tags=tags,
         )
 
+    def modify_rule(self, rule_arn: str, actions: list, conditions: list):
+        return self.evlb_client.modify_rule(
+            RuleArn=rule_arn,
+            Conditions=conditions,
+            Actions=actions,
+        )
+
+    def set_rule_priorities(self, priorities: dict[str, int]):
+        return self.evlb_client.set_rule_priorities(
+            RulePriorities=[
+                {"RuleArn": rule_arn, "Priority": priority}
+                for rule_arn, priority in priorities.items()
+            ]
+        )
+
+    def add_tags(self, resource_arn: str, tags: list):
+        return self.evlb_client.add_tags(ResourceArns=[resource_arn], Tags=tags)
+
     def create_forward_rule(
         self,
         listener_arn: str,
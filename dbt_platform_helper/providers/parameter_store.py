@@ -1,3 +1,6 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Literal
@@ -5,11 +8,18 @@ from typing import Optional
 from typing import Union
 
 import boto3
+import botocore.exceptions
 
 from dbt_platform_helper.platform_exception import PlatformException
 
+TAG_FETCH_MAX_WORKERS = 8
+THROTTLING_ERROR_CODES = ["ThrottlingException", "TooManyRequestsException", "Throttling"]
+THROTTLING_MAX_ATTEMPTS = 5
+THROTTLING_BASE_DELAY_SECONDS = 0.2
+SSM_GET_PARAMETERS_MAX_NAMES = 10
 
-@dataclass
+
+@dataclass(slots=True)
 class Parameter:
 
     name: str
@@ -34,14 +44,36 @@ class Parameter:
         return str(self.name) == str(other.name)
 
 
+@dataclass
+class ParametersByNames:
+
+    found: dict[str, Union[dict, Parameter]] = field(default_factory=dict)
+    missing: set[str] = field(default_factory=set)
+
+
 class ParameterStore:
     def __init__(self, ssm_client: boto3.client, with_model: bool = False):
         self.ssm_client = ssm_client
         self.with_model = with_model
 
+    @staticmethod
+    def __with_backoff(operation, **kwargs):
+        for attempt in range(THROTTLING_MAX_ATTEMPTS):
+            try:
+                return operation(**kwargs)
+            except botocore.exceptions.ClientError as error:
+                if error.response["Error"]["Code"] not in THROTTLING_ERROR_CODES:
+                    raise
+                if attempt == THROTTLING_MAX_ATTEMPTS - 1:
+                    raise
+                # Exponential backoff with jitter, so concurrent requests don't retry in lockstep
+                time.sleep(THROTTLING_BASE_DELAY_SECONDS * 2**attempt * random.uniform(0.5, 1.5))
+
     def __fetch_tags(self, parameter: Parameter, normalise=True):
-        response = self.ssm_client.list_tags_for_resource(
-            ResourceType="Parameter", ResourceId=parameter.name
+        response = self.__with_backoff(
+            self.ssm_client.list_tags_for_resource,
+            ResourceType="Parameter",
+            ResourceId=parameter.name,
         )["TagList"]
 
         if normalise:
@@ -49,6 +81,27 @@ class ParameterStore:
         else:
             return response
 
+    @staticmethod
+    def __to_model(parameter: dict) -> Parameter:
+        return Parameter(
+            name=parameter["Name"],
+            value=parameter["Value"],
+            arn=parameter["ARN"],
+            data_type=parameter["DataType"],
+            type=parameter["Type"],
+            version=parameter["Version"],
+        )
+
+    def __add_tags(self, models: list[Parameter]):
+        """SSM has no bulk tag lookup, so fetch each parameter's tags
+        concurrently."""
+        if not models:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(TAG_FETCH_MAX_WORKERS, len(models))) as executor:
+            for model, tags in zip(models, executor.map(self.__fetch_tags, models)):
+                model.tags = tags
+
     def get_ssm_parameter_by_name(
         self, parameter_name: str, add_tags: bool = False
     ) -> Union[dict, Parameter]:
@@ -69,22 +122,49 @@ class ParameterStore:
         if not self.with_model:
             return parameter
 
-        model = Parameter(
-            name=parameter["Name"],
-            value=parameter["Value"],
-            arn=parameter["ARN"],
-            data_type=parameter["DataType"],
-            type=parameter["Type"],
-            version=parameter["Version"],
-        )
+        model = self.__to_model(parameter)
 
         if add_tags:
             model.tags = self.__fetch_tags(model)
 
         return model
 
+    def get_ssm_parameters_by_names(
+        self, parameter_names: list[str], add_tags: bool = False
+    ) -> ParametersByNames:
+        """
+        Retrieves the latest version of several parameters from parameter store,
+        requesting up to ten names per call.
+
+        Args:
+            parameter_names (list): The parameter names to retrieve the parameter values for.
+            add_tags (bool): Whether to retrieve the tags for the SSM parameters requested
+        Returns:
+            ParametersByNames: The parameters found, keyed by name, and the names that do not exist.
+        """
+        names = list(dict.fromkeys(parameter_names))
+        result = ParametersByNames()
+
+        for start in range(0, len(names), SSM_GET_PARAMETERS_MAX_NAMES):
+            response = self.__with_backoff(
+                self.ssm_client.get_parameters,
+                Names=names[start : start + SSM_GET_PARAMETERS_MAX_NAMES],
+                WithDecryption=True,
+            )
+            for parameter in response.get("Parameters", []):
+                result.found[parameter["Name"]] = parameter
+            result.missing.update(response.get("InvalidParameters", []))
+
+        if self.with_model:
+            result.found = {name: self.__to_model(param) for name, param in result.found.items()}
+
+            if add_tags:
+                self.__add_tags(list(result.found.values()))
+
+        return result
+
     def get_ssm_parameters_by_path(
-        self, path: str, add_tags: bool = False
+        self, path: str, add_tags: bool = False, with_decryption: bool = True
     ) -> Union[list[dict], list[Parameter]]:
         """
         Retrieves all SSM parameters for a given path from parameter store.
@@ -92,13 +172,17 @@ class ParameterStore:
         Args:
             path (str): The parameter path to retrieve the parameters for. e.g. /copilot/applications/
             add_tags (bool): Whether to retrieve the tags for the SSM parameters requested
+            with_decryption (bool): Whether to decrypt SecureString values. Without it,
+                SecureString parameters hold their encrypted value.
         Returns:
             list: A list of dictionaries containing all SSM parameters under the provided path.
         """
 
         parameters = []
         paginator = self.ssm_client.get_paginator("get_parameters_by_path")
-        page_iterator = paginator.paginate(Path=path, Recursive=True, WithDecryption=True)
+        page_iterator = paginator.paginate(
+            Path=path, Recursive=True, WithDecryption=with_decryption
+        )
 
         for page in page_iterator:
             parameters.extend(page.get("Parameters", []))
@@ -109,26 +193,22 @@ class ParameterStore:
             else:
                 raise ParameterNotFoundForPathException()
 
-        to_model = lambda parameter: Parameter(
-            name=parameter["Name"],
-            value=parameter["Value"],
-            arn=parameter["ARN"],
-            data_type=parameter["DataType"],
-            type=parameter["Type"],
-            version=parameter["Version"],
-        )
-
-        models = [to_model(param) for param in parameters]
+        models = [self.__to_model(param) for param in parameters]
 
         if add_tags:
-            for model in models:
-                model.tags = self.__fetch_tags(model)
+            self.__add_tags(models)
 
         return models
 
     def put_parameter(self, data_dict: dict) -> dict:
-        return self.ssm_client.put_parameter(**data_dict)
+        return self.__with_backoff(self.ssm_client.put_parameter, **data_dict)
 
 
 class ParameterNotFoundForPathException(PlatformException):
     """Exception raised when no parameters are found for a given path."""
+
+
+class ParametersNotFoundException(PlatformException):
+    def __init__(self, parameter_names: list[str]):
+        names = "', '".join(sorted(parameter_names))
+        super().__init__(f"AWS SSM parameters not found: '{names}'.")
@@ -0,0 +1,71 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+ALB_RULE_JOURNAL_DIR = Path.home() / ".platform-helper" / "alb-rule-journals"
+
+
+class RuleJournalProvider:
+    """
+    Append-only record of the listener rule changes made by an ALB rule update.
+
+    Each change is written before the API call is made and again once it has
+    succeeded, and every entry is flushed to disk straight away, so the journal
+    of an interrupted update says exactly what may need undoing.
+    """
+
+    def __init__(self, application: str, environment: str):
+        self.path = ALB_RULE_JOURNAL_DIR / f"{application}-{environment}.jsonl"
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def start(self, listener_arn: str):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(mode=0o600)
+        self._write({"event": "started", "listener_arn": listener_arn})
+
+    def pending(self, operation: str, **details) -> int:
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+        self._write({"event": "pending", "id": entry_id, "operation": operation, **details})
+        return entry_id
+
+    def done(self, entry_id: int, operation: str, **details):
+        self._write({"event": "done", "id": entry_id, "operation": operation, **details})
+
+    def rolled_back(self, operation: str, rule_arns: list[str]):
+        self._write({"event": "rolled_back", "operation": operation, "rule_arns": rule_arns})
+
+    def entries(self) -> list[dict]:
+        contents = self.path.read_text()
+        if contents and not contents.endswith("\n"):
+            # Terminate a partly written entry so that new entries start on their own line
+            self._write_line("")
+
+        entries = []
+        for line in contents.splitlines():
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # The last line is cut short if the process was killed while writing it
+                continue
+
+        self._next_id = max((entry.get("id", -1) for entry in entries), default=-1) + 1
+        return entries
+
+    def remove(self):
+        self.path.unlink(missing_ok=True)
+
+    def _write(self, entry: dict):
+        self._write_line(json.dumps(entry))
+
+    def _write_line(self, line: str):
+        with self._lock, open(self.path, "a") as journal:
+            journal.write(line + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
@@ -30,11 +30,11 @@ class Migrator:
         self,
         migrations: list[SchemaMigrationProtocol],
         installed_version_provider: InstalledVersionProvider = InstalledVersionProvider,
-        io_provider: ClickIOProvider = ClickIOProvider(),
+        io_provider: ClickIOProvider = None,
     ):
         self.migrations = sorted(migrations, key=lambda m: m.from_version())
         self.installed_version_provider = installed_version_provider
-        self.io_provider = io_provider
+        self.io_provider = io_provider or ClickIOProvider()
         from_version_counts = Counter([migration.from_version() for migration in self.migrations])
         duplicate_from_versions = [count for count in from_version_counts.values() if count > 1]
 
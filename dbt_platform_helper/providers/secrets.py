@@ -12,9 +12,12 @@ class Secrets:
         self.application_name = application_name
         self.env = env
 
-    def get_postgres_connection_data_updated_with_master_secret(self, parameter_name, secret_arn):
-        response = self.ssm_client.get_parameter(Name=parameter_name, WithDecryption=True)
-        parameter_value = response["Parameter"]["Value"]
+    def get_postgres_connection_data_updated_with_master_secret(
+        self, parameter_name, secret_arn, parameter_value=None
+    ):
+        if parameter_value is None:
+            response = self.ssm_client.get_parameter(Name=parameter_name, WithDecryption=True)
+            parameter_value = response["Parameter"]["Value"]
 
         parameter_data = json.loads(parameter_value)
 
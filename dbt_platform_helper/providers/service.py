@@ -12,7 +12,7 @@ class ServiceRepository:
 
     def list_services(self, app, env, type: ServiceType = None) -> list[Service]:
         service_parameters = self.parameter_store.get_ssm_parameters_by_path(
-            f"/platform/applications/{app}/environments/{env}/services/"
+            f"/platform/applications/{app}/environments/{env}/services/", with_decryption=False
         )
         services = []
         for param in service_parameters:
@@ -14,11 +14,9 @@ from dbt_platform_helper.providers.io import ClickIOProvider
 
 
 class TerraformManifestProvider:
-    def __init__(
-        self, file_provider: FileProvider = FileProvider(), io: ClickIOProvider = ClickIOProvider()
-    ):
-        self.file_provider = file_provider
-        self.io = io
+    def __init__(self, file_provider: FileProvider = None, io: ClickIOProvider = None):
+        self.file_provider = file_provider or FileProvider()
+        self.io = io or ClickIOProvider()
 
     def generate_service_config(
         self,
@@ -53,8 +53,10 @@ class InstalledVersionProvider:
 class GithubLatestVersionProvider(VersionProvider):
     @staticmethod
     def get_semantic_version(
-        repo_name: str, tags: bool = False, request_session=set_up_retry(), io=ClickIOProvider()
+        repo_name: str, tags: bool = False, request_session=None, io=None
     ) -> Union[SemanticVersion, None]:
+        request_session = request_session or set_up_retry()
+        io = io or ClickIOProvider()
 
         semantic_version = None
         try:
@@ -78,8 +80,11 @@ class GithubLatestVersionProvider(VersionProvider):
 class PyPiLatestVersionProvider(VersionProvider):
     @staticmethod
     def get_semantic_version(
-        project_name: str, request_session=set_up_retry(), io=ClickIOProvider()
+        project_name: str, request_session=None, io=None
     ) -> Union[SemanticVersion, None]:
+        request_session = request_session or set_up_retry()
+        io = io or ClickIOProvider()
+
         semantic_version = None
         try:
             package_info = request_session.get(f"https://pypi.org/pypi/{project_name}/json").json()
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from dbt_platform_helper.platform_exception import PlatformException
+from dbt_platform_helper.utils.aws import get_aws_client
 
 
 class VpcProviderException(PlatformException):
@@ -41,7 +42,7 @@ class Vpc:
 
 class VpcProvider:
     def __init__(self, session):
-        self.ec2_client = session.client("ec2")
+        self.ec2_client = get_aws_client(session, "ec2")
 
     def _get_subnet_ids(self, vpc_id):
         subnets = self.ec2_client.describe_subnets(
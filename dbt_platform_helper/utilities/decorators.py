@@ -28,20 +28,21 @@ def retry(
     delay: float = SECONDS_BEFORE_RETRY,
     raise_custom_exception: bool = True,
     custom_exception: type = RetryException,
-    io: ClickIOProvider = ClickIOProvider(),
+    io: ClickIOProvider = None,
 ):
     def decorator(func):
         func.__wrapped_by__ = "retry"
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            click_io = io or ClickIOProvider()
             last_exception = None
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
                 except exceptions_to_catch as e:
                     last_exception = e
-                    io.debug(
+                    click_io.debug(
                         f"Attempt {attempt+1}/{max_attempts} for {func.__name__} failed with exception {str(last_exception)}"
                     )
                     if attempt < max_attempts - 1:
@@ -62,7 +63,7 @@ def wait_until(
     raise_custom_exception: bool = True,
     custom_exception=RetryException,
     message_on_false="Condition not met",
-    io: ClickIOProvider = ClickIOProvider(),
+    io: ClickIOProvider = None,
 ):
     """Wrap a function which returns a boolean."""
 
@@ -71,18 +72,19 @@ def wait_until(
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            click_io = io or ClickIOProvider()
             last_exception = None
             for attempt in range(max_attempts):
                 try:
                     result = func(*args, **kwargs)
                     if result:
                         return result
-                    io.debug(
+                    click_io.debug(
                         f"Attempt {attempt+1}/{max_attempts} for {func.__name__} returned falsy"
                     )
                 except exceptions_to_catch as e:
                     last_exception = e
-                    io.debug(
+                    click_io.debug(
                         f"Attempt {attempt+1}/{max_attempts} for {func.__name__} failed with exception {str(last_exception)}"
                     )
 
@@ -1,20 +1,41 @@
 import json
 import os
 import re
+import time
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
+from typing import Optional
 
 import boto3
+from botocore.exceptions import ClientError
 
 from dbt_platform_helper.constants import PLATFORM_CONFIG_FILE
 from dbt_platform_helper.platform_exception import PlatformException
 from dbt_platform_helper.providers.config import ConfigProvider
+from dbt_platform_helper.utils.aws import NoProfileForAccountIdException
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
 from dbt_platform_helper.utils.aws import get_profile_name_from_account_id
 from dbt_platform_helper.utils.aws import get_ssm_secrets
+from dbt_platform_helper.utils.aws import iter_ssm_parameters_by_path
+from dbt_platform_helper.utils.aws import prewarm_aws_sessions
+from dbt_platform_helper.utils.aws import write_cache_file
 from dbt_platform_helper.utils.messages import abort_with_error
 
+# Only enabled in long running processes (see dbt_platform_helper.utils.daemon), where
+# applications are kept for APPLICATION_CACHE_TTL_SECONDS keyed by (name, AWS profile).
+APPLICATION_CACHE: dict = None
+APPLICATION_CACHE_TTL_SECONDS = 300
+
+# Read-heavy commands keep each application's environments and services on disk. They are
+# trusted for APPLICATION_TOPOLOGY_CACHE_TTL_SECONDS, then for as long as none of the
+# application's SSM parameters have changed version.
+APPLICATION_TOPOLOGY_CACHE_DIR = Path.home() / ".platform-helper" / "applications"
+APPLICATION_TOPOLOGY_CACHE_TTL_SECONDS = 15 * 60
+
+SERVICE_DISCOVERY_MAX_WORKERS = 8
+
 
 @dataclass
 class Environment:
@@ -61,12 +82,60 @@ class Application:
         return str(self) == str(other)
 
 
-def load_application(app=None, default_session=None, env=None) -> Application:
+def load_application(
+    app=None,
+    default_session=None,
+    env=None,
+    prewarm_sessions=False,
+    use_topology_cache=False,
+    refresh=False,
+) -> Application:
+    """
+    Load an application's environments and services from AWS Parameter Store.
+
+    With use_topology_cache, they are read from and saved to a cache on disk
+    (see APPLICATION_TOPOLOGY_CACHE_DIR) unless refresh is set.
+    """
     application = Application(app if app else get_application_name())
     current_session = default_session if default_session else get_aws_session_or_abort()
 
-    ssm_client = current_session.client("ssm")
-    sts_client = current_session.client("sts")
+    if APPLICATION_CACHE is not None:
+        cache_key = (application.name, current_session.profile_name)
+        loaded_at, cached_application = APPLICATION_CACHE.get(cache_key, (0, None))
+        if (
+            cached_application
+            and not refresh
+            and time.monotonic() - loaded_at < APPLICATION_CACHE_TTL_SECONDS
+        ):
+            return cached_application
+
+    ssm_client = get_aws_client(current_session, "ssm")
+
+    cached_application = (
+        _load_cached_topology(application.name, current_session, ssm_client)
+        if use_topology_cache and not refresh
+        else None
+    )
+    if cached_application:
+        application = cached_application
+    else:
+        account_id = _load_topology(application, current_session, ssm_client, app, env)
+        if use_topology_cache:
+            _save_topology(application, account_id, current_session, ssm_client)
+
+    if prewarm_sessions:
+        _prewarm_environment_sessions(application)
+
+    if APPLICATION_CACHE is not None:
+        APPLICATION_CACHE[cache_key] = (time.monotonic(), application)
+
+    return application
+
+
+def _load_topology(application: Application, current_session, ssm_client, app, env) -> str:
+    """Populate the application's environments and services from Parameter
+    Store, returning the ID of the account the current session is for."""
+    sts_client = get_aws_client(current_session, "sts")
     account_id = sts_client.get_caller_identity()["Account"]
     sessions = {account_id: current_session}
 
@@ -140,7 +209,107 @@ def load_application(app=None, default_session=None, env=None) -> Application:
 
     application.services = _load_services(ssm_client, application)
 
-    return application
+    return account_id
+
+
+def _topology_cache_file(application_name: str, session) -> Path:
+    profile = re.sub(r"[^\w.-]", "_", str(session.profile_name))
+    return APPLICATION_TOPOLOGY_CACHE_DIR / f"{application_name}--{profile}.json"
+
+
+def _parameter_versions(ssm_client, application_name: str) -> Optional[dict[str, int]]:
+    """
+    Return the version of every SSM parameter describing the application.
+
+    Parameter values are not fetched, so this is much cheaper than loading the
+    application.
+    """
+    versions = {}
+    paginator = ssm_client.get_paginator("describe_parameters")
+
+    try:
+        for path in [
+            f"/platform/applications/{application_name}",
+            f"/copilot/applications/{application_name}",
+        ]:
+            for page in paginator.paginate(
+                ParameterFilters=[{"Key": "Path", "Option": "Recursive", "Values": [path]}]
+            ):
+                for parameter in page["Parameters"]:
+                    versions[parameter["Name"]] = parameter["Version"]
+    except ClientError:
+        return None
+
+    return versions
+
+
+def _load_cached_topology(application_name: str, session, ssm_client) -> Optional[Application]:
+    cache_file = _topology_cache_file(application_name, session)
+    try:
+        topology = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - topology["loaded_at"] > APPLICATION_TOPOLOGY_CACHE_TTL_SECONDS:
+        if _parameter_versions(ssm_client, application_name) != topology["parameter_versions"]:
+            return None
+        topology["loaded_at"] = time.time()
+        _write_topology_cache_file(cache_file, topology)
+
+    sessions = {topology["account_id"]: session}
+
+    return Application(
+        application_name,
+        environments={
+            name: Environment(name, account_id, sessions)
+            for name, account_id in topology["environments"].items()
+        },
+        services={name: Service(name, kind) for name, kind in topology["services"].items()},
+    )
+
+
+def _save_topology(application: Application, account_id: str, session, ssm_client):
+    parameter_versions = _parameter_versions(ssm_client, application.name)
+    if parameter_versions is None:
+        return
+
+    _write_topology_cache_file(
+        _topology_cache_file(application.name, session),
+        {
+            "loaded_at": time.time(),
+            "account_id": account_id,
+            "environments": {
+                name: environment.account_id
+                for name, environment in application.environments.items()
+            },
+            "services": {name: service.kind for name, service in application.services.items()},
+            "parameter_versions": parameter_versions,
+        },
+    )
+
+
+def _write_topology_cache_file(cache_file: Path, topology: dict):
+    try:
+        write_cache_file(cache_file, topology)
+    except OSError:
+        # The cache only saves time, so failing to write it is not an error
+        pass
+
+
+def _prewarm_environment_sessions(application: Application):
+    """Verify the session for every account the application is deployed to
+    concurrently, rather than one at a time as each is first used."""
+    profiles = []
+    for environment in application.environments.values():
+        if environment.account_id in environment.sessions:
+            continue
+        try:
+            profiles.append(get_profile_name_from_account_id(environment.account_id))
+        except NoProfileForAccountIdException:
+            # Reported when the environment's session is first used
+            continue
+
+    prewarm_aws_sessions(profiles)
 
 
 def _load_services(ssm_client, application: Application) -> dict[str, Service]:
@@ -154,52 +323,34 @@ def _load_services(ssm_client, application: Application) -> dict[str, Service]:
     """
     services: dict[str, Service] = {}
 
-    # Try /platform SSM parameter
-    for env_name in application.environments.keys():
-        params = dict(
-            Path=f"/platform/applications/{application.name}/environments/{env_name}/services",
-            Recursive=False,
-            WithDecryption=False,
-        )
-
-        while True:
-            response = ssm_client.get_parameters_by_path(**params)
-            for ssm_param in response.get("Parameters", []):
-                try:
-                    data = json.loads(ssm_param["Value"])
-                    name = data["name"]
-                    kind = data["type"]
-                    services.setdefault(name, Service(name, kind))  # Avoid duplicates
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-            if "NextToken" in response:
-                params["NextToken"] = response["NextToken"]
-            else:
-                break
+    # Try /platform SSM parameters, scanning each environment concurrently. They are
+    # yielded in environment order so the first environment to define a service wins.
+    for ssm_param in iter_ssm_parameters_by_path(
+        ssm_client,
+        f"/platform/applications/{application.name}/environments",
+        sub_paths=[f"{env_name}/services" for env_name in application.environments],
+        max_workers=SERVICE_DISCOVERY_MAX_WORKERS,
+    ):
+        try:
+            data = json.loads(ssm_param["Value"])
+            name = data["name"]
+            kind = data["type"]
+            services.setdefault(name, Service(name, kind))  # Avoid duplicates
+        except (json.JSONDecodeError, KeyError):
+            continue
 
     if services:
         return services
 
     # Fallback to legacy /copilot SSM parameter
-    response = ssm_client.get_parameters_by_path(
-        Path=f"/copilot/applications/{application.name}/components",
-        Recursive=False,
-        WithDecryption=False,
-    )
-    results = response["Parameters"]
-    while "NextToken" in response:
-        response = ssm_client.get_parameters_by_path(
-            Path=f"/copilot/applications/{application.name}/components",
-            Recursive=False,
-            WithDecryption=False,
-            NextToken=response["NextToken"],
-        )
-        results.extend(response["Parameters"])
-
     legacy_services = {
         svc["name"]: Service(svc["name"], svc["type"])
-        for svc in [json.loads(parameter["Value"]) for parameter in results]
+        for svc in [
+            json.loads(parameter["Value"])
+            for parameter in iter_ssm_parameters_by_path(
+                ssm_client, f"/copilot/applications/{application.name}/components"
+            )
+        ]
     }
 
     return legacy_services
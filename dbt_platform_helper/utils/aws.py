@@ -1,13 +1,20 @@
+import hashlib
 import json
 import os
+import tempfile
+import threading
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 import boto3
 import botocore
 import botocore.exceptions
+import botocore.loaders
 import click
 from boto3 import Session
 from botocore.exceptions import ClientError
@@ -18,11 +25,36 @@ from dbt_platform_helper.providers.aws.exceptions import (
     CopilotCodebaseNotFoundException,
 )
 from dbt_platform_helper.providers.aws.exceptions import LogGroupNotFoundException
+from dbt_platform_helper.providers.parameter_store import ParametersNotFoundException
+from dbt_platform_helper.providers.parameter_store import ParameterStore
 from dbt_platform_helper.providers.validation import ValidationException
 
 SSM_BASE_PATH = "/copilot/{app}/{env}/secrets/"
 SSM_PATH = "/copilot/{app}/{env}/secrets/{name}"
+# The largest page get_parameters_by_path will return
+SSM_PARAMETERS_BY_PATH_MAX_RESULTS = 10
 AWS_SESSION_CACHE = {}
+# Clients are thread safe and expensive to create, so one is kept per (profile, region, service)
+AWS_CLIENT_CACHE = {}
+_AWS_CLIENT_CACHE_LOCK = threading.Lock()
+# Every session shares one loader, and so the service models and endpoint data it has read.
+# It has the data path each boto3 session adds to its own loader.
+_SHARED_DATA_LOADER = botocore.loaders.create_loader()
+_SHARED_DATA_LOADER.search_paths.append(os.path.join(os.path.dirname(boto3.__file__), "data"))
+# The verified identity of each profile, kept until its credentials expire
+AWS_IDENTITY_CACHE_FILE = Path.home() / ".platform-helper" / "aws-identity-cache.json"
+AWS_IDENTITY_CACHE_TTL_SECONDS = 60 * 60
+_AWS_IDENTITY_CACHE_LOCK = threading.Lock()
+# Where the AWS CLI keeps the tokens from aws sso login
+AWS_SSO_CACHE_DIR = Path.home() / ".aws" / "sso" / "cache"
+# IAM policy simulations which allowed every action, kept briefly so repeated access checks are fast
+AWS_POLICY_SIMULATION_CACHE_FILE = (
+    Path.home() / ".platform-helper" / "aws-policy-simulation-cache.json"
+)
+AWS_POLICY_SIMULATION_CACHE_TTL_SECONDS = 5 * 60
+_AWS_POLICY_SIMULATION_CACHE_LOCK = threading.Lock()
+# Sessions verified by prewarm_aws_sessions which have not been used yet
+_PREWARMED_SESSIONS = {}
 
 
 def get_aws_session_or_abort(aws_profile: str = None) -> boto3.session.Session:
@@ -33,44 +65,357 @@ def get_aws_session_or_abort(aws_profile: str = None) -> boto3.session.Session:
     click.secho(f'Checking AWS connection for profile "{aws_profile}"...', fg="cyan")
 
     try:
-        session = boto3.session.Session(profile_name=aws_profile)
-        sts = session.client("sts")
-        account_id, user_id = get_account_details(sts)
+        prewarmed = _PREWARMED_SESSIONS.pop(aws_profile, None)
+        session, identity = prewarmed or _verify_aws_session(aws_profile)
         click.secho("Credentials are valid.", fg="green")
 
     except botocore.exceptions.ProfileNotFound:
         _handle_error(f'AWS profile "{aws_profile}" is not configured.')
     except botocore.exceptions.ClientError as e:
+        _forget_cached_identity(aws_profile)
         if e.response["Error"]["Code"] == "ExpiredToken":
             _handle_error(
                 f"Credentials are NOT valid.  \nPlease login with: aws sso login --profile {aws_profile}"
             )
+        raise
     except botocore.exceptions.NoCredentialsError:
+        _forget_cached_identity(aws_profile)
         _handle_error("There are no credentials set for this session.", REFRESH_TOKEN_MESSAGE)
     except botocore.exceptions.UnauthorizedSSOTokenError:
+        _forget_cached_identity(aws_profile)
         _handle_error("The SSO Token used for this session is unauthorised.", REFRESH_TOKEN_MESSAGE)
     except botocore.exceptions.TokenRetrievalError:
+        _forget_cached_identity(aws_profile)
         _handle_error("Unable to retrieve the Token for this session.", REFRESH_TOKEN_MESSAGE)
     except botocore.exceptions.SSOTokenLoadError:
+        _forget_cached_identity(aws_profile)
         _handle_error(
             "The SSO session associated with this profile has expired, is not set or is otherwise invalid.",
             REFRESH_TOKEN_MESSAGE,
         )
 
-    alias_client = session.client("iam")
-    account_name = alias_client.list_account_aliases().get("AccountAliases", [])
-
-    _log_account_info(account_name, account_id)
+    _log_account_info(identity["account_aliases"], identity["account_id"])
 
     click.echo(
         click.style("User: ", fg="yellow")
-        + click.style(f"{user_id.split(':')[-1]}\n", fg="white", bold=True)
+        + click.style(f"{identity['user_id'].split(':')[-1]}\n", fg="white", bold=True)
     )
 
     AWS_SESSION_CACHE[aws_profile] = session
     return session
 
 
+def clear_aws_session_caches():
+    """Forget every session and client created so far, e.g. because the
+    credentials in the environment have changed."""
+    AWS_SESSION_CACHE.clear()
+    _PREWARMED_SESSIONS.clear()
+    with _AWS_CLIENT_CACHE_LOCK:
+        AWS_CLIENT_CACHE.clear()
+    # boto3's default session holds the credentials it found when it was created
+    boto3.DEFAULT_SESSION = None
+
+
+def prewarm_aws_sessions(aws_profiles: list[str], max_workers: int = 8):
+    """
+    Verify the sessions for several AWS profiles at once.
+
+    Nothing is output here; each session is announced as usual by
+    get_aws_session_or_abort when it is first used. Profiles which fail to
+    verify are left to get_aws_session_or_abort to report.
+    """
+    pending_profiles = [
+        profile
+        for profile in dict.fromkeys(aws_profiles)
+        if profile not in AWS_SESSION_CACHE and profile not in _PREWARMED_SESSIONS
+    ]
+    if not pending_profiles:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending_profiles))) as executor:
+        verifications = {
+            profile: executor.submit(_verify_aws_session, profile) for profile in pending_profiles
+        }
+
+    for profile, verification in verifications.items():
+        if not verification.exception():
+            _PREWARMED_SESSIONS[profile] = verification.result()
+
+
+def _verify_aws_session(aws_profile: str) -> tuple[boto3.session.Session, dict]:
+    """Create a session for the profile and return it with the identity it
+    belongs to, checking the credentials with AWS unless they were verified by
+    an earlier invocation."""
+    session = _new_session(aws_profile)
+    identity = _load_cached_identity(aws_profile, session)
+    if identity:
+        return session, identity
+
+    account_id, user_id = get_account_details(get_aws_client(session, "sts"))
+    account_aliases = (
+        get_aws_client(session, "iam").list_account_aliases().get("AccountAliases", [])
+    )
+    identity = _cache_identity(aws_profile, session, account_id, user_id, account_aliases)
+
+    return session, identity
+
+
+def _credentials_fingerprint(session: Session):
+    """
+    Return a hash identifying the session's credentials and when they expire.
+
+    SSO profiles, and roles assumed from them, are identified by the profile and
+    the token from aws sso login, without fetching any credentials, as botocore
+    only keeps role credentials in memory and every process gets new ones.
+    Credentials which never expire, such as static access keys, are trusted for
+    AWS_IDENTITY_CACHE_TTL_SECONDS. Temporary credentials whose expiry is
+    unknown, such as an exported session token, are never cached.
+    """
+    if not isinstance(session, Session):
+        return None, None
+
+    credential_source = _profile_credential_source(session)
+    if credential_source:
+        source, expires_at = credential_source
+        fingerprint = hashlib.sha256(f"{session.profile_name}:{source}".encode()).hexdigest()
+        return fingerprint, expires_at
+
+    credentials = session.get_credentials()
+    if not credentials:
+        return None, None
+
+    # botocore has no public accessor for the expiry of refreshable credentials
+    expiry_time = getattr(credentials, "_expiry_time", None)
+    if not expiry_time and credentials.token:
+        return None, None
+    expires_at = (
+        expiry_time.timestamp() if expiry_time else time.time() + AWS_IDENTITY_CACHE_TTL_SECONDS
+    )
+    fingerprint = hashlib.sha256(
+        f"{credentials.method}:{credentials.access_key}:{expiry_time}".encode()
+    ).hexdigest()
+
+    return fingerprint, expires_at
+
+
+def _profile_credential_source(session: Session, profile_name: str = None, depth: int = 0):
+    """
+    Return what the credentials of an SSO profile, or of a role assumed from
+    one, are derived from and when that expires, or None for any other kind of
+    profile.
+
+    Only the AWS config and the SSO token cache are read.
+    """
+    botocore_session = session._session
+    if not profile_name:
+        profile_name = botocore_session.instance_variables().get("profile")
+        if not profile_name and os.environ.get("AWS_ACCESS_KEY_ID"):
+            # Credentials in the environment take precedence over AWS_PROFILE
+            return None
+        profile_name = profile_name or session.profile_name
+
+    full_config = botocore_session.full_config
+    profile = full_config.get("profiles", {}).get(profile_name)
+    if not profile or depth > 5:
+        return None
+
+    if "role_arn" in profile:
+        if "source_profile" not in profile:
+            return None
+        source = _profile_credential_source(session, profile["source_profile"], depth + 1)
+        return (f"{profile['role_arn']}:{source[0]}", source[1]) if source else None
+
+    sso_session = profile.get("sso_session")
+    start_url = profile.get("sso_start_url") or full_config.get("sso_sessions", {}).get(
+        sso_session, {}
+    ).get("sso_start_url")
+    token_cache_key = sso_session or start_url
+    if not token_cache_key:
+        return None
+
+    token = read_cache_file(
+        AWS_SSO_CACHE_DIR / f"{hashlib.sha1(token_cache_key.encode()).hexdigest()}.json"
+    )
+    try:
+        expires_at = datetime.fromisoformat(
+            token["expiresAt"].replace("UTC", "+00:00").replace("Z", "+00:00")
+        ).timestamp()
+        access_token = token["accessToken"]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    return (
+        f"{start_url}:{profile.get('sso_account_id')}:{profile.get('sso_role_name')}:{access_token}",
+        expires_at,
+    )
+
+
+def read_cache_file(cache_file: Path) -> dict:
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def write_cache_file(cache_file: Path, data: dict):
+    """Replace the cache file in one step, writing to a temporary file of this
+    writer's own so concurrent writers never interleave."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # NamedTemporaryFile creates the file readable by its owner only
+    with tempfile.NamedTemporaryFile(
+        "w", dir=cache_file.parent, prefix=f".{cache_file.name}.", suffix=".tmp", delete=False
+    ) as temporary_file:
+        temporary_file.write(json.dumps(data, indent=2))
+    try:
+        os.replace(temporary_file.name, cache_file)
+    except OSError:
+        os.unlink(temporary_file.name)
+        raise
+
+
+def _read_identity_cache() -> dict:
+    return read_cache_file(AWS_IDENTITY_CACHE_FILE)
+
+
+def _write_identity_cache(identities: dict):
+    write_cache_file(AWS_IDENTITY_CACHE_FILE, identities)
+
+
+def _load_cached_identity(aws_profile: str, session: Session):
+    fingerprint, _ = _credentials_fingerprint(session)
+    if not fingerprint:
+        return None
+
+    identity = _read_identity_cache().get(str(aws_profile))
+    if not identity or identity.get("fingerprint") != fingerprint:
+        return None
+    if identity.get("expires_at", 0) <= time.time():
+        return None
+
+    return identity
+
+
+def _cache_identity(
+    aws_profile: str, session: Session, account_id, user_id, account_aliases
+) -> dict:
+    fingerprint, expires_at = _credentials_fingerprint(session)
+    identity = {
+        "fingerprint": fingerprint,
+        "expires_at": expires_at,
+        "account_id": account_id,
+        "user_id": user_id,
+        "account_aliases": account_aliases,
+    }
+    if not fingerprint:
+        return identity
+
+    with _AWS_IDENTITY_CACHE_LOCK:
+        identities = _read_identity_cache()
+        identities[str(aws_profile)] = identity
+        try:
+            _write_identity_cache(identities)
+        except OSError:
+            # The cache only saves time, so failing to write it is not an error
+            pass
+
+    return identity
+
+
+def _forget_cached_identity(aws_profile: str):
+    with _AWS_IDENTITY_CACHE_LOCK:
+        identities = _read_identity_cache()
+        if identities.pop(str(aws_profile), None):
+            try:
+                _write_identity_cache(identities)
+            except OSError:
+                pass
+
+
+def simulate_principal_policy(
+    session: Session, role_arn: str, actions: list[str], region: str = "eu-west-2"
+) -> list[dict]:
+    """
+    Return IAM's evaluation of whether the role may perform each action in the
+    region.
+
+    Results which allow every action are cached on disk for
+    AWS_POLICY_SIMULATION_CACHE_TTL_SECONDS. Denials are never cached, so access
+    granted after a failed check is picked up straight away.
+    """
+    cache_key = json.dumps([role_arn, sorted(actions), region])
+    cached = read_cache_file(AWS_POLICY_SIMULATION_CACHE_FILE).get(cache_key)
+    if cached and cached.get("expires_at", 0) > time.time():
+        return cached["results"]
+
+    response = get_aws_client(session, "iam").simulate_principal_policy(
+        PolicySourceArn=role_arn,
+        ActionNames=actions,
+        ContextEntries=[
+            {
+                "ContextKeyName": "aws:RequestedRegion",
+                "ContextKeyValues": [
+                    region,
+                ],
+                "ContextKeyType": "string",
+            }
+        ],
+    )["EvaluationResults"]
+    results = [
+        {"EvalActionName": result["EvalActionName"], "EvalDecision": result["EvalDecision"]}
+        for result in response
+    ]
+
+    if results and all(result["EvalDecision"] == "allowed" for result in results):
+        with _AWS_POLICY_SIMULATION_CACHE_LOCK:
+            simulations = read_cache_file(AWS_POLICY_SIMULATION_CACHE_FILE)
+            now = time.time()
+            simulations = {
+                key: simulation
+                for key, simulation in simulations.items()
+                if simulation.get("expires_at", 0) > now
+            }
+            simulations[cache_key] = {
+                "expires_at": now + AWS_POLICY_SIMULATION_CACHE_TTL_SECONDS,
+                "results": results,
+            }
+            try:
+                write_cache_file(AWS_POLICY_SIMULATION_CACHE_FILE, simulations)
+            except OSError:
+                # The cache only saves time, so failing to write it is not an error
+                pass
+
+    return results
+
+
+def get_aws_client(session: Session, service_name: str):
+    """
+    Return a client for the service, reusing any client already created for the
+    same AWS profile and region.
+
+    Falls back to boto3's default session when no session is given.
+    """
+    session = session or boto3._get_default_session()
+    if not isinstance(session, Session):  # e.g. a stand-in session in tests
+        return session.client(service_name)
+
+    key = (session.profile_name, session.region_name, service_name)
+    with _AWS_CLIENT_CACHE_LOCK:
+        if key not in AWS_CLIENT_CACHE:
+            AWS_CLIENT_CACHE[key] = session.client(service_name)
+
+        return AWS_CLIENT_CACHE[key]
+
+
+def _new_session(aws_profile: str) -> boto3.session.Session:
+    """Create a session which shares its botocore loader, and so the service
+    models and endpoint data it has already read, with every other session."""
+    session = boto3.session.Session(profile_name=aws_profile)
+    session._session.register_component("data_loader", _SHARED_DATA_LOADER)
+    session._loader = _SHARED_DATA_LOADER
+
+    return session
+
+
 def _handle_error(message: str, refresh_token_message: str = None) -> None:
     full_message = message + (" " + refresh_token_message if refresh_token_message else "")
     click.secho(full_message, fg="red")
@@ -108,33 +453,69 @@ def get_profile_name_from_account_id(account_id: str):
     raise NoProfileForAccountIdException(account_id)
 
 
-def get_ssm_secret_names(app, env):
-    session = get_aws_session_or_abort()
-    client = session.client("ssm")
-
-    path = SSM_BASE_PATH.format(app=app, env=env)
+def iter_ssm_parameters_by_path(
+    ssm_client,
+    path: str,
+    with_decryption: bool = False,
+    recursive: bool = False,
+    sub_paths: list[str] = None,
+    max_workers: int = 8,
+) -> Iterator[dict]:
+    """
+    Yield the parameters under an SSM path, fetching each page only as it is
+    needed.
+
+    Only ask for decryption when the values of SecureString parameters are
+    needed. With sub_paths, the sibling paths under path are read concurrently
+    and their parameters yielded in the order the sub_paths were given.
+    """
+    if sub_paths is not None:
+        yield from _iter_ssm_parameters_by_sub_paths(
+            ssm_client, path, with_decryption, recursive, sub_paths, max_workers
+        )
+        return
 
     params = dict(
         Path=path,
-        Recursive=False,
-        WithDecryption=True,
-        MaxResults=10,
+        Recursive=recursive,
+        WithDecryption=with_decryption,
+        MaxResults=SSM_PARAMETERS_BY_PATH_MAX_RESULTS,
     )
 
-    secret_names = []
-
     while True:
-        response = client.get_parameters_by_path(**params)
-
-        for secret in response["Parameters"]:
-            secret_names.append(secret["Name"])
+        response = ssm_client.get_parameters_by_path(**params)
+        yield from response.get("Parameters", [])
 
         if "NextToken" in response:
             params["NextToken"] = response["NextToken"]
         else:
             break
 
-    return sorted(secret_names)
+
+def _iter_ssm_parameters_by_sub_paths(
+    ssm_client, path, with_decryption, recursive, sub_paths, max_workers
+) -> Iterator[dict]:
+    if not sub_paths:
+        return
+
+    def read_sub_path(sub_path):
+        return list(
+            iter_ssm_parameters_by_path(
+                ssm_client, f"{path.rstrip('/')}/{sub_path}", with_decryption, recursive
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sub_paths))) as executor:
+        for parameters in executor.map(read_sub_path, sub_paths):
+            yield from parameters
+
+
+def get_ssm_secret_names(app, env):
+    client = get_aws_client(get_aws_session_or_abort(), "ssm")
+
+    path = SSM_BASE_PATH.format(app=app, env=env)
+
+    return sorted(parameter["Name"] for parameter in iter_ssm_parameters_by_path(client, path))
 
 
 def get_ssm_secrets(app, env, session=None, path=None):
@@ -143,40 +524,23 @@ def get_ssm_secrets(app, env, session=None, path=None):
 
     if not session:
         session = get_aws_session_or_abort()
-    client = session.client("ssm")
+    client = get_aws_client(session, "ssm")
 
     if not path:
         path = SSM_BASE_PATH.format(app=app, env=env)
 
-    params = dict(
-        Path=path,
-        Recursive=False,
-        WithDecryption=True,
-        MaxResults=10,
-    )
-
     secrets = []
 
-    while True:
-        try:
-            response = client.get_parameters_by_path(**params)
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "AccessDeniedException":
-                click.secho(
-                    "Access denied on SSM, due to missing permissions. Please update your environment infrastructure.",
-                    fg="magenta",
-                )
-                break
-            else:
-                raise e
-
-        for secret in response["Parameters"]:
+    try:
+        for secret in iter_ssm_parameters_by_path(client, path, with_decryption=True):
             secrets.append((secret["Name"], secret["Value"]))
-
-        if "NextToken" in response:
-            params["NextToken"] = response["NextToken"]
-        else:
-            break
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "AccessDeniedException":
+            raise e
+        click.secho(
+            "Access denied on SSM, due to missing permissions. Please update your environment infrastructure.",
+            fg="magenta",
+        )
 
     return sorted(secrets)
 
@@ -184,8 +548,7 @@ def get_ssm_secrets(app, env, session=None, path=None):
 def set_ssm_param(
     app, env, param_name, param_value, overwrite, exists, description="Copied from Cloud Foundry."
 ):
-    session = get_aws_session_or_abort()
-    client = session.client("ssm")
+    client = get_aws_client(get_aws_session_or_abort(), "ssm")
 
     parameter_args = dict(
         Name=param_name,
@@ -214,18 +577,21 @@ def set_ssm_param(
 
 def get_account_details(sts_client=None):
     if not sts_client:
-        sts_client = get_aws_session_or_abort().client("sts")
+        sts_client = get_aws_client(get_aws_session_or_abort(), "sts")
     response = sts_client.get_caller_identity()
 
     return response["Account"], response["UserId"]
 
 
-def get_postgres_connection_data_updated_with_master_secret(session, parameter_name, secret_arn):
+def get_postgres_connection_data_updated_with_master_secret(
+    session, parameter_name, secret_arn, parameter_value=None
+):
     # TODO: DBTP-1968: This is pretty much the same as dbt_platform_helper.providers.secrets.Secrets.get_postgres_connection_data_updated_with_master_secret
-    ssm_client = session.client("ssm")
-    secrets_manager_client = session.client("secretsmanager")
-    response = ssm_client.get_parameter(Name=parameter_name, WithDecryption=True)
-    parameter_value = response["Parameter"]["Value"]
+    secrets_manager_client = get_aws_client(session, "secretsmanager")
+    if parameter_value is None:
+        ssm_client = get_aws_client(session, "ssm")
+        response = ssm_client.get_parameter(Name=parameter_name, WithDecryption=True)
+        parameter_value = response["Parameter"]["Value"]
 
     parameter_data = json.loads(parameter_value)
 
@@ -251,11 +617,17 @@ def get_connection_string(
         f"/copilot/{app}/{env}/secrets/{normalised_addon_name}_READ_ONLY_USER"
     )
     master_secret_name = f"/copilot/{app}/{env}/secrets/{normalised_addon_name}_RDS_MASTER_ARN"
-    master_secret_arn = session.client("ssm").get_parameter(
-        Name=master_secret_name, WithDecryption=True
-    )["Parameter"]["Value"]
+    parameters = ParameterStore(get_aws_client(session, "ssm")).get_ssm_parameters_by_names(
+        [master_secret_name, connection_string_parameter]
+    )
+    if master_secret_name in parameters.missing:
+        raise ParametersNotFoundException([master_secret_name])
+    master_secret_arn = parameters.found[master_secret_name]["Value"]
+    connection_string = parameters.found.get(connection_string_parameter, {}).get("Value")
 
-    conn = connection_data(session, connection_string_parameter, master_secret_arn)
+    conn = connection_data(
+        session, connection_string_parameter, master_secret_arn, parameter_value=connection_string
+    )
 
     return f"postgres://{conn['username']}:{conn['password']}@{conn['host']}:{conn['port']}/{conn['dbname']}"
 
@@ -274,7 +646,7 @@ def start_pipeline_and_return_execution_id(codepipeline_client, build_options):
 def check_codebase_exists(session: Session, application, codebase: str):
     try:
         # TODO: DBTP-1968: Can this leverage dbt_platform_helper.providers.secrets.Secrets.get_connection_secret_arn?
-        ssm_client = session.client("ssm")
+        ssm_client = get_aws_client(session, "ssm")
         json.loads(
             ssm_client.get_parameter(
                 Name=f"/copilot/applications/{application.name}/codebases/{codebase}"
@@ -1,3 +1,6 @@
+import importlib
+import sys
+
 from click import Argument
 from click import Choice
 from click import Command
@@ -5,6 +8,8 @@ from click import Context
 from click import Group
 from click import HelpFormatter
 
+from dbt_platform_helper.utils.daemon import forward_to_daemon
+
 
 class ClickDocOptCommand(Command):
     def format_usage(self, ctx: Context, formatter: HelpFormatter) -> None:
@@ -18,6 +23,53 @@ class ClickDocOptGroup(Group):
         format_click_usage(ctx, formatter, True)
 
 
+class LazyClickDocOptGroup(ClickDocOptGroup):
+    """
+    A ClickDocOptGroup whose subcommands are only imported when they are used.
+
+    Subcommands are registered as a mapping of command name to an import path of
+    the form "package.module:attribute", so running e.g. `--version` or a single
+    subcommand does not import every other command module (and the boto3,
+    pydantic and jinja2 dependencies that come with them).
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+
+        if not isinstance(command, Command):
+            raise ValueError(
+                f"Lazy loading of {self.lazy_subcommands[cmd_name]} failed by returning a non-command object"
+            )
+
+        return command
+
+
+class DaemonClientGroup(LazyClickDocOptGroup):
+    """A LazyClickDocOptGroup which hands commands to a running platform-helper
+    daemon, if there is one, instead of running them in this process."""
+
+    def main(self, args=None, prog_name=None, complete_var=None, standalone_mode=True, **extra):
+        if standalone_mode:
+            exit_code = forward_to_daemon(sys.argv[1:] if args is None else list(args))
+            if exit_code is not None:
+                sys.exit(exit_code)
+
+        return super().main(args, prog_name, complete_var, standalone_mode, **extra)
+
+
 def format_click_usage(ctx: Context, formatter: HelpFormatter, group: bool = False) -> None:
     help_text = f"Usage: {ctx.command_path} "
     current_line = 0
@@ -30,6 +82,11 @@ def format_click_usage(ctx: Context, formatter: HelpFormatter, group: bool = Fal
 
     if group:
         command_list = list(ctx.command.commands.keys())
+        command_list += [
+            name
+            for name in getattr(ctx.command, "lazy_subcommands", {})
+            if name not in command_list
+        ]
 
         if len(command_list) == 1:
             help_text += f"{command_list[0]} "
@@ -0,0 +1,437 @@
+"""
+A warm platform-helper process that other invocations can hand commands to.
+
+The client side of this module is imported on every invocation, so it must only
+depend on the standard library.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from dbt_platform_helper.constants import PLATFORM_HELPER_DAEMON_SOCKET_ENV_VAR
+from dbt_platform_helper.constants import PLATFORM_HELPER_NO_DAEMON_ENV_VAR
+
+DEFAULT_DAEMON_SOCKET = Path.home() / ".platform-helper" / "daemon.sock"
+DEFAULT_IDLE_TIMEOUT_SECONDS = 30 * 60
+
+# Commands which need an interactive terminal, run interactive subprocesses (conduit and
+# service exec hand the terminal to the AWS and Copilot CLIs) or manage the daemon itself.
+LOCAL_ONLY_COMMANDS = ["conduit", "daemon", "database", "service"]
+
+
+def get_daemon_socket_path() -> Path:
+    return Path(os.environ.get(PLATFORM_HELPER_DAEMON_SOCKET_ENV_VAR) or DEFAULT_DAEMON_SOCKET)
+
+
+def get_installed_version() -> Optional[str]:
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version
+
+    try:
+        return version("dbt-platform-helper")
+    except PackageNotFoundError:
+        return None
+
+
+def send_daemon_request(request: dict, socket_path: Path = None, timeout: float = None):
+    """Send a request to the daemon and yield each message it responds with."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(str(socket_path or get_daemon_socket_path()))
+        connection.sendall(json.dumps(request).encode() + b"\n")
+
+        with connection.makefile("r", encoding="utf-8") as responses:
+            for line in responses:
+                yield json.loads(line)
+
+
+def forward_to_daemon(args: list[str], socket_path: Path = None) -> Optional[int]:
+    """
+    Run the command in the daemon if one is running.
+
+    Returns the exit code of the command, or None if it should be run in this
+    process instead.
+    """
+    if os.environ.get(PLATFORM_HELPER_NO_DAEMON_ENV_VAR):
+        return None
+
+    if args and args[0] in LOCAL_ONLY_COMMANDS:
+        return None
+
+    socket_path = socket_path or get_daemon_socket_path()
+    if not socket_path.exists():
+        return None
+
+    request = {
+        "version": get_installed_version(),
+        "args": args,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "isatty": {
+            "stdin": sys.stdin.isatty(),
+            "stdout": sys.stdout.isatty(),
+            "stderr": sys.stderr.isatty(),
+        },
+    }
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_path))
+            connection.sendall(json.dumps(request).encode() + b"\n")
+        except OSError:
+            # No daemon is listening on the socket, e.g. it was killed without cleaning up
+            return None
+
+        with connection.makefile("r", encoding="utf-8") as responses:
+            try:
+                first_response = json.loads(next(responses))
+            except (OSError, StopIteration, ValueError):
+                return None
+
+            if "version_mismatch" in first_response:
+                # The daemon is running the code of a different installed version
+                return None
+
+            return _relay_responses(
+                _chain(first_response, (json.loads(line) for line in responses)), connection
+            )
+
+
+def _relay_responses(responses, connection: socket.socket) -> int:
+    exit_code = 1
+    for response in responses:
+        if "prompt" in response:
+            connection.sendall(
+                json.dumps(_read_input(response["prompt"], response["hidden"])).encode() + b"\n"
+            )
+        if "stdout" in response:
+            sys.stdout.write(response["stdout"])
+            sys.stdout.flush()
+        if "stderr" in response:
+            sys.stderr.write(response["stderr"])
+            sys.stderr.flush()
+        if "exit_code" in response:
+            exit_code = response["exit_code"]
+
+    return exit_code
+
+
+def _read_input(prompt: str, hidden: bool) -> dict:
+    """Answer a prompt from a command running in the daemon using this process's
+    terminal."""
+    try:
+        if hidden:
+            import getpass
+
+            return {"input": getpass.getpass(prompt)}
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+    except (EOFError, KeyboardInterrupt):
+        return {"eof": True}
+
+    return {"input": line.rstrip("\n")} if line else {"eof": True}
+
+
+def _chain(first, rest):
+    yield first
+    yield from rest
+
+
+class _StreamWriter(io.TextIOBase):
+    """Relays everything written to stdout or stderr back to the client."""
+
+    def __init__(self, connection: socket.socket, stream: str, isatty: bool):
+        self.connection = connection
+        self.stream = stream
+        self._isatty = isatty
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return self._isatty
+
+    def write(self, data: str) -> int:
+        if not isinstance(data, str):
+            raise TypeError(f"write() argument must be str, not {type(data).__name__}")
+        if data:
+            self.connection.sendall(json.dumps({self.stream: data}).encode() + b"\n")
+        return len(data)
+
+
+class _InputRelay:
+    """Asks the client to read input from its terminal for a command running in
+    the daemon."""
+
+    def __init__(self, connection: socket.socket, responses, isatty: bool):
+        self.connection = connection
+        self.responses = responses
+        self.isatty = isatty
+
+    def read(self, prompt: str = "", hidden: bool = False) -> str:
+        self.connection.sendall(json.dumps({"prompt": prompt, "hidden": hidden}).encode() + b"\n")
+        line = self.responses.readline()
+        response = json.loads(line) if line else {"eof": True}
+        if "eof" in response:
+            raise EOFError()
+        return response["input"]
+
+    def hidden_prompt(self, prompt: str) -> str:
+        return self.read(prompt, hidden=True)
+
+
+class _StdinReader(io.TextIOBase):
+    """Stands in for stdin, reading each line from the client."""
+
+    def __init__(self, relay: _InputRelay):
+        self.relay = relay
+
+    def readable(self):
+        return True
+
+    def isatty(self):
+        return self.relay.isatty
+
+    def readline(self, size=-1) -> str:
+        try:
+            return self.relay.read() + "\n"
+        except EOFError:
+            return ""
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        self.server.last_request_at = time.monotonic()
+
+        if request.get("command") == "status":
+            self._respond(self.server.status())
+        elif request.get("command") == "stop":
+            self._respond({"stopping": True})
+            self.server.stopping = True
+        elif request.get("version") != self.server.version:
+            # platform-helper has been upgraded or downgraded since the daemon started, so
+            # the client runs the command itself and the daemon makes way for a new one
+            self._respond({"version_mismatch": self.server.version})
+            self.server.stopping = True
+        else:
+            self._respond(
+                {"exit_code": self.server.run_command(request, self.connection, self.rfile)}
+            )
+
+    def _respond(self, message: dict):
+        self.wfile.write(json.dumps(message).encode() + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """
+    Serves platform-helper commands from a single warm interpreter.
+
+    Commands are run one at a time, since each one changes the working directory
+    and environment of the process to match the client's. AWS sessions and
+    applications loaded by earlier commands are kept in memory for later ones.
+    """
+
+    def __init__(self, socket_path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS):
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            socket_path.unlink()
+
+        # Only the user running the daemon may connect to it
+        original_umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), _DaemonRequestHandler)
+        finally:
+            os.umask(original_umask)
+
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.timeout = 1
+        self.started_at = time.monotonic()
+        self.last_request_at = self.started_at
+        self.commands_run = 0
+        self.stopping = False
+        self.root_command = None
+        self.credential_environment = None
+        self.version = get_installed_version()
+
+    def warm_up(self):
+        """Import every command and enable the in-memory application cache."""
+        import click
+
+        from dbt_platform_helper.utils import application
+        from platform_helper import platform_helper
+
+        context = click.Context(platform_helper)
+        for name in platform_helper.list_commands(context):
+            platform_helper.get_command(context, name)
+
+        application.APPLICATION_CACHE = {}
+        self.root_command = platform_helper
+
+    def serve_until_idle(self):
+        try:
+            while not self.stopping:
+                self.handle_request()
+                if time.monotonic() - self.last_request_at > self.idle_timeout:
+                    break
+        finally:
+            self.server_close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+    def status(self) -> dict:
+        from dbt_platform_helper.utils.application import APPLICATION_CACHE
+        from dbt_platform_helper.utils.aws import AWS_SESSION_CACHE
+
+        return {
+            "pid": os.getpid(),
+            "version": self.version,
+            "uptime": round(time.monotonic() - self.started_at),
+            "commands_run": self.commands_run,
+            "aws_profiles": sorted(str(profile) for profile in AWS_SESSION_CACHE),
+            "applications": sorted(name for name, _ in (APPLICATION_CACHE or {})),
+        }
+
+    def run_command(self, request: dict, connection: socket.socket, responses) -> int:
+        """
+        Run a command with the client's working directory, environment and
+        output streams.
+
+        Prompts are sent to the client, which reads the answers from its own
+        terminal, so hidden input such as passphrases is never echoed.
+        """
+        import click.termui
+
+        self.commands_run += 1
+        original_cwd = os.getcwd()
+        original_environ = dict(os.environ)
+        isatty = request.get("isatty", {})
+        relay = _InputRelay(connection, responses, isatty.get("stdin", False))
+        original_hidden_prompt = click.termui.hidden_prompt_func
+
+        try:
+            os.chdir(request["cwd"])
+            os.environ.clear()
+            os.environ.update(request["env"])
+            os.environ[PLATFORM_HELPER_NO_DAEMON_ENV_VAR] = "true"
+            self._forget_sessions_if_credentials_changed()
+
+            with contextlib.redirect_stdout(
+                _StreamWriter(connection, "stdout", isatty.get("stdout", False))
+            ), contextlib.redirect_stderr(
+                _StreamWriter(connection, "stderr", isatty.get("stderr", False))
+            ):
+                sys.stdin = _StdinReader(relay)
+                click.termui.hidden_prompt_func = relay.hidden_prompt
+                try:
+                    self.root_command.main(args=request["args"], prog_name="platform-helper")
+                except SystemExit as system_exit:
+                    return system_exit.code if isinstance(system_exit.code, int) else 1
+                except Exception as error:
+                    print(f"Error: {error}", file=sys.stderr)
+                    return 1
+                return 0
+        finally:
+            sys.stdin = sys.__stdin__
+            click.termui.hidden_prompt_func = original_hidden_prompt
+            os.environ.clear()
+            os.environ.update(original_environ)
+            os.chdir(original_cwd)
+
+    def _forget_sessions_if_credentials_changed(self):
+        """
+        Clear the AWS sessions, clients and applications kept from earlier
+        commands if this one was run with different AWS settings in its
+        environment.
+
+        The caches are keyed by profile, so without this a client with different
+        credentials for the same profile would reuse another client's sessions.
+        """
+        from dbt_platform_helper.utils import application
+        from dbt_platform_helper.utils.aws import clear_aws_session_caches
+
+        credential_environment = hashlib.sha256(
+            json.dumps(
+                sorted(
+                    (name, value) for name, value in os.environ.items() if name.startswith("AWS_")
+                )
+            ).encode()
+        ).hexdigest()
+        if credential_environment == self.credential_environment:
+            return
+
+        if self.credential_environment is not None:
+            clear_aws_session_caches()
+            if application.APPLICATION_CACHE is not None:
+                application.APPLICATION_CACHE.clear()
+        self.credential_environment = credential_environment
+
+
+def serve(socket_path: str = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS):
+    server = DaemonServer(
+        Path(socket_path) if socket_path else get_daemon_socket_path(), idle_timeout
+    )
+    server.warm_up()
+    server.serve_until_idle()
+
+
+def get_daemon_status(socket_path: Path = None) -> Optional[dict]:
+    """Return the status of the running daemon, or None if there isn't one."""
+    try:
+        return next(send_daemon_request({"command": "status"}, socket_path, timeout=5))
+    except (OSError, StopIteration, ValueError):
+        return None
+
+
+def stop_daemon(socket_path: Path = None) -> bool:
+    try:
+        return next(send_daemon_request({"command": "stop"}, socket_path, timeout=5))["stopping"]
+    except (OSError, StopIteration, ValueError, KeyError):
+        return False
+
+
+def start_daemon(
+    socket_path: Path = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    startup_timeout: float = 30,
+) -> Optional[dict]:
+    """Start the daemon in a new background process and wait for it to accept
+    commands."""
+    socket_path = socket_path or get_daemon_socket_path()
+
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from dbt_platform_helper.utils.daemon import serve; "
+            f"serve({str(socket_path)!r}, {idle_timeout!r})",
+        ],
+        start_new_session=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        status = get_daemon_status(socket_path)
+        if status:
+            return status
+        time.sleep(0.1)
+
+    return None
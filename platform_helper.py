@@ -4,24 +4,29 @@ from importlib.metadata import version
 
 import click
 
-from dbt_platform_helper.commands.application import application as application_commands
-from dbt_platform_helper.commands.codebase import codebase as codebase_commands
-from dbt_platform_helper.commands.conduit import conduit as conduit_commands
-from dbt_platform_helper.commands.config import config as config_commands
-from dbt_platform_helper.commands.copilot import copilot as copilot_commands
-from dbt_platform_helper.commands.database import database as database_commands
-from dbt_platform_helper.commands.environment import environment as environment_commands
-from dbt_platform_helper.commands.generate import generate as generate_commands
-from dbt_platform_helper.commands.internal import internal as internal_commands
-from dbt_platform_helper.commands.job import job as job_commands
-from dbt_platform_helper.commands.notify import notify as notify_commands
-from dbt_platform_helper.commands.pipeline import pipeline as pipeline_commands
-from dbt_platform_helper.commands.secrets import secrets as secrets_commands
-from dbt_platform_helper.commands.service import service as service_commands
-from dbt_platform_helper.utils.click import ClickDocOptGroup
-
-
-@click.group(cls=ClickDocOptGroup)
+from dbt_platform_helper.utils.click import DaemonClientGroup
+
+
+@click.group(
+    cls=DaemonClientGroup,
+    lazy_subcommands={
+        "application": "dbt_platform_helper.commands.application:application",
+        "codebase": "dbt_platform_helper.commands.codebase:codebase",
+        "conduit": "dbt_platform_helper.commands.conduit:conduit",
+        "config": "dbt_platform_helper.commands.config:config",
+        "copilot": "dbt_platform_helper.commands.copilot:copilot",
+        "daemon": "dbt_platform_helper.commands.daemon:daemon",
+        "environment": "dbt_platform_helper.commands.environment:environment",
+        "generate": "dbt_platform_helper.commands.generate:generate",
+        "internal": "dbt_platform_helper.commands.internal:internal",
+        "pipeline": "dbt_platform_helper.commands.pipeline:pipeline",
+        "secrets": "dbt_platform_helper.commands.secrets:secrets",
+        "notify": "dbt_platform_helper.commands.notify:notify",
+        "database": "dbt_platform_helper.commands.database:database",
+        "service": "dbt_platform_helper.commands.service:service",
+        "job": "dbt_platform_helper.commands.job:job",
+    },
+)
 @click.version_option(
     version=version("dbt-platform-helper"),
     message=f"dbt-platform-helper %(version)s",
@@ -30,20 +35,5 @@ def platform_helper():
     pass
 
 
-platform_helper.add_command(application_commands)
-platform_helper.add_command(codebase_commands)
-platform_helper.add_command(conduit_commands)
-platform_helper.add_command(config_commands)
-platform_helper.add_command(copilot_commands)
-platform_helper.add_command(environment_commands)
-platform_helper.add_command(generate_commands)
-platform_helper.add_command(internal_commands)
-platform_helper.add_command(pipeline_commands)
-platform_helper.add_command(secrets_commands)
-platform_helper.add_command(notify_commands)
-platform_helper.add_command(database_commands)
-platform_helper.add_command(service_commands)
-platform_helper.add_command(job_commands)
-
 if __name__ == "__main__":
     platform_helper(auto_envvar_prefix="DBT_PLATFORM")
@@ -20,6 +20,8 @@ from dbt_platform_helper.constants import SERVICE_CONFIG_FILE
 from dbt_platform_helper.constants import SERVICE_CONFIG_SCHEMA_VERSION
 from dbt_platform_helper.constants import SERVICE_DIRECTORY
 from dbt_platform_helper.providers.cache import Cache
+from dbt_platform_helper.utils.aws import _PREWARMED_SESSIONS
+from dbt_platform_helper.utils.aws import AWS_CLIENT_CACHE
 from dbt_platform_helper.utils.aws import AWS_SESSION_CACHE
 
 BASE_DIR = Path(__file__).parent.parent.parent
@@ -426,6 +428,58 @@ def clear_session_cache():
     AWS_SESSION_CACHE.clear()
 
 
+@pytest.fixture(autouse=True)
+def aws_identity_cache_file(tmp_path, monkeypatch):
+    cache_file = tmp_path / "aws-identity-cache.json"
+    monkeypatch.setattr("dbt_platform_helper.utils.aws.AWS_IDENTITY_CACHE_FILE", cache_file)
+    return cache_file
+
+
+@pytest.fixture(autouse=True)
+def aws_policy_simulation_cache_file(tmp_path, monkeypatch):
+    cache_file = tmp_path / "aws-policy-simulation-cache.json"
+    monkeypatch.setattr(
+        "dbt_platform_helper.utils.aws.AWS_POLICY_SIMULATION_CACHE_FILE", cache_file
+    )
+    return cache_file
+
+
+@pytest.fixture(autouse=True)
+def load_balancer_cache_file(tmp_path, monkeypatch):
+    cache_file = tmp_path / "load-balancer-cache.json"
+    monkeypatch.setattr(
+        "dbt_platform_helper.providers.load_balancers.LOAD_BALANCER_CACHE_FILE", cache_file
+    )
+    return cache_file
+
+
+@pytest.fixture(autouse=True)
+def alb_rule_journal_dir(tmp_path, monkeypatch):
+    journal_dir = tmp_path / "alb-rule-journals"
+    monkeypatch.setattr(
+        "dbt_platform_helper.providers.rule_journal.ALB_RULE_JOURNAL_DIR", journal_dir
+    )
+    return journal_dir
+
+
+@pytest.fixture(autouse=True)
+def application_topology_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "applications"
+    monkeypatch.setattr(
+        "dbt_platform_helper.utils.application.APPLICATION_TOPOLOGY_CACHE_DIR", cache_dir
+    )
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    AWS_CLIENT_CACHE.clear()
+    _PREWARMED_SESSIONS.clear()
+    yield
+    AWS_CLIENT_CACHE.clear()
+    _PREWARMED_SESSIONS.clear()
+
+
 @pytest.fixture()
 def valid_platform_config():
     return yaml.safe_load(
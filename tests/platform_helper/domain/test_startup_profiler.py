@@ -0,0 +1,123 @@
+import cProfile
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from dbt_platform_helper.domain.startup_profiler import ImportCost
+from dbt_platform_helper.domain.startup_profiler import StartupProfiler
+from dbt_platform_helper.domain.startup_profiler import StartupProfilerException
+from dbt_platform_helper.domain.startup_profiler import parse_import_times
+from dbt_platform_helper.providers.io import ClickIOProvider
+
+IMPORT_TIME_STDERR = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3000 |       5000 | dbt_platform_helper.providers.io
+Error: Something went wrong
+import time:       900 |      42000 | platform_helper
+"""
+
+
+def test_parse_import_times():
+    import_costs, other_lines = parse_import_times(IMPORT_TIME_STDERR)
+
+    assert import_costs == [
+        ImportCost(module="_io", self_us=120, cumulative_us=120),
+        ImportCost(module="dbt_platform_helper.providers.io", self_us=3000, cumulative_us=5000),
+        ImportCost(module="platform_helper", self_us=900, cumulative_us=42000),
+    ]
+    assert other_lines == ["Error: Something went wrong"]
+
+
+class TestStartupProfiler:
+    @staticmethod
+    def _fake_run(first_aws_call: dict, returncode: int = 0):
+        def run(args, **kwargs):
+            profile_path, aws_call_path = args[5], args[6]
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+            ClickIOProvider()
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+
+            Path(aws_call_path).write_text(
+                json.dumps({"total": 1.5, "first_aws_call": first_aws_call})
+            )
+
+            return Mock(returncode=returncode, stdout="command output\n", stderr=IMPORT_TIME_STDERR)
+
+        return run
+
+    def test_profile_reports_import_provider_and_aws_costs(self):
+        io = Mock()
+        run_subprocess = Mock(
+            side_effect=self._fake_run(
+                {
+                    "service": "sts",
+                    "operation": "GetCallerIdentity",
+                    "started_after": 0.75,
+                    "duration": 0.25,
+                }
+            )
+        )
+
+        result = StartupProfiler(
+            io=io, run_subprocess=run_subprocess, python_executable="python"
+        ).profile(["secrets", "copy", "--app", "test-app"], top=2)
+
+        args = run_subprocess.call_args.args[0]
+        assert args[:4] == ["python", "-X", "importtime", "-c"]
+        assert args[7:] == ["secrets", "copy", "--app", "test-app"]
+
+        assert result.exit_code == 0
+        assert result.total_seconds == 1.5
+        assert [cost.module for cost in result.import_costs] == [
+            "platform_helper",
+            "dbt_platform_helper.providers.io",
+            "_io",
+        ]
+        assert [cost.provider for cost in result.provider_costs] == [
+            "io.ClickIOProvider",
+        ]
+        assert result.provider_costs[0].calls == 1
+        assert result.first_aws_call.service == "sts"
+        assert result.first_aws_call.operation == "GetCallerIdentity"
+
+        messages = [str(call.args[0]) for call in io.info.call_args_list]
+        assert messages[0] == "command output"
+        assert messages[1] == "Error: Something went wrong"
+        assert "platform_helper" in messages[4]
+        assert "_io" not in messages[4]
+        assert "io.ClickIOProvider" in messages[6]
+        assert (
+            messages[7]
+            == "\nFirst AWS call: sts.GetCallerIdentity started after 750.0ms and took 250.0ms"
+        )
+
+    def test_profile_reports_when_no_aws_calls_are_made(self):
+        io = Mock()
+
+        result = StartupProfiler(io=io, run_subprocess=self._fake_run({}, 2)).profile(["--help"])
+
+        assert result.exit_code == 2
+        assert result.first_aws_call is None
+        io.info.assert_called_with("\nNo AWS calls were made.")
+
+    def test_profile_raises_when_the_command_could_not_be_profiled(self):
+        run_subprocess = Mock(return_value=Mock(returncode=1, stdout="", stderr="Boom"))
+
+        with pytest.raises(StartupProfilerException, match="Boom"):
+            StartupProfiler(io=Mock(), run_subprocess=run_subprocess).profile(["--version"])
+
+    def test_profile_runs_platform_helper_in_a_fresh_interpreter(self):
+        io = Mock()
+
+        result = StartupProfiler(io=io).profile(["--version"])
+
+        assert result.exit_code == 0
+        assert "platform_helper" in [cost.module for cost in result.import_costs]
+        assert not [cost for cost in result.import_costs if cost.module.startswith("botocore")]
+        assert result.first_aws_call is None
+        assert io.info.call_args_list[0].args[0].startswith("dbt-platform-helper ")
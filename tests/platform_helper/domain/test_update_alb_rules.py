@@ -0,0 +1,88 @@
+from dbt_platform_helper.domain.update_alb_rules import PlatformRule
+from dbt_platform_helper.domain.update_alb_rules import UpdateALBRules
+
+
+def test_pack_platform_rules_removes_duplicate_aliases():
+    grouped = {("web", "/api"): ["b.example", "a.example", "b.example", "a.example", "c.example"]}
+
+    rules = UpdateALBRules._pack_platform_rules(grouped)
+
+    assert rules == [
+        {
+            "service": "web",
+            "depth": 1,
+            "path_pattern": ["/api", "/api/*"],
+            "aliases": ["a.example", "b.example", "c.example"],
+        }
+    ]
+    assert UpdateALBRules._count_unpacked_platform_rules(grouped) == 2
+
+
+def test_pack_platform_rules_merges_paths_of_the_same_depth_served_on_the_same_hosts():
+    grouped = {
+        ("web", "/a"): ["web.example"],
+        ("web", "/b"): ["web.example"],
+        # Not merged: a different depth, different hosts and a different service
+        ("web", "/a/c"): ["web.example"],
+        ("web", "/d"): ["other.example"],
+        ("api", "/e"): ["web.example"],
+    }
+
+    rules = UpdateALBRules._pack_platform_rules(grouped)
+
+    assert [(rule["service"], rule["path_pattern"], rule["aliases"]) for rule in rules] == [
+        ("web", ["/a/c", "/a/c/*"], ["web.example"]),
+        ("web", ["/a", "/a/*", "/b", "/b/*"], ["web.example"]),
+        ("api", ["/e", "/e/*"], ["web.example"]),
+        ("web", ["/d", "/d/*"], ["other.example"]),
+    ]
+    assert UpdateALBRules._count_unpacked_platform_rules(grouped) == 5
+
+
+def test_pack_platform_rules_splits_values_into_the_fewest_rules():
+    aliases = [f"{index}.example" for index in range(6)]
+    grouped = {("web", "/a"): aliases, ("web", "/b"): aliases}
+
+    rules = UpdateALBRules._pack_platform_rules(grouped)
+
+    # Each rule can match at most 6 of the 24 host and path pairs
+    assert len(rules) == 4
+    assert all(len(rule["path_pattern"]) + len(rule["aliases"]) <= 5 for rule in rules)
+    assert {
+        (alias, pattern)
+        for rule in rules
+        for alias in rule["aliases"]
+        for pattern in rule["path_pattern"]
+    } == {(alias, pattern) for alias in aliases for pattern in ["/a", "/a/*", "/b", "/b/*"]}
+
+
+def test_match_platform_rules_only_reuses_rules_of_the_same_service():
+    def desired_rule(service, priority):
+        return PlatformRule(
+            service=service,
+            priority=priority,
+            aliases=[f"{service}.example"],
+            path_pattern=["/*"],
+            target_group_arn=f"{service}-tg",
+            tags={"service": service},
+        )
+
+    def existing_rule(service, priority):
+        return {
+            "RuleArn": f"{service}-rule",
+            "Priority": str(priority),
+            "Conditions": {"host-header": ["old.example"], "path-pattern": ["/*"]},
+            "Actions": [{"Type": "forward", "TargetGroupArn": "old-tg"}],
+            "Tags": {"service": service},
+        }
+
+    web, api = desired_rule("web", 10000), desired_rule("api", 10100)
+    web_rule, admin_rule = existing_rule("web", 10100), existing_rule("admin", 10000)
+
+    pairs, rules_to_create, rules_to_delete = UpdateALBRules._match_platform_rules(
+        [web, api], [admin_rule, web_rule]
+    )
+
+    assert pairs == [(web, web_rule)]
+    assert rules_to_create == [api]
+    assert rules_to_delete == [admin_rule]
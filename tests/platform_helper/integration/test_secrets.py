@@ -1,4 +1,5 @@
 import re
+import threading
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import call
@@ -220,15 +221,19 @@ class AWSMocks:
                 env_param_status = self.create_existing_params
 
             if env_param_status == "exists":
-                mock_ssm_client.get_parameter.return_value = {"Parameter": {"Name": "doesntmatter"}}
+                mock_ssm_client.get_parameters.side_effect = lambda Names, **kwargs: {
+                    "Parameters": [{"Name": name} for name in Names],
+                    "InvalidParameters": [],
+                }
             elif env_param_status == "unexpected":
-                mock_ssm_client.get_parameter.side_effect = AWSTestFixtures.client_error_response(
-                    "GetParameter"
+                mock_ssm_client.get_parameters.side_effect = AWSTestFixtures.client_error_response(
+                    "GetParameters"
                 )
             else:
-                mock_ssm_client.get_parameter.side_effect = (
-                    AWSTestFixtures.get_parameter_not_found_error_response()
-                )
+                mock_ssm_client.get_parameters.side_effect = lambda Names, **kwargs: {
+                    "Parameters": [],
+                    "InvalidParameters": Names,
+                }
 
             mock_session.client.side_effect = self.__make_client_side_effect(
                 mock_sts_client, mock_iam_client, mock_ssm_client
@@ -303,38 +308,47 @@ class AWSMocks:
                 mock_ssm_client.get_paginator.return_value = (
                     self._create_parameters_by_path_paginator(source)
                 )
-                mock_ssm_client.list_tags_for_resource.side_effect = [
-                    AWSTestFixtures.list_tags_for_resource_response(env=env, platform="copilot"),
-                    AWSTestFixtures.list_tags_for_resource_response(env=env, platform="copilot"),
-                    AWSTestFixtures.list_tags_for_resource_response(env=env),
-                    AWSTestFixtures.list_tags_for_resource_response(
-                        env=env, managed_by="DBT Platform - Terraform"
-                    ),
-                    AWSTestFixtures.list_tags_for_resource_response(env=env),
-                    AWSTestFixtures.list_tags_for_resource_response(env=env),
-                ]
-            if stage == "target":
-
-                def _create_ssm_mock_with_failing_put_parameter(ssm_client, calls_to_fail_on=[2]):
-                    return_value = ssm_client.put_parameter.return_value
 
-                    def mock_put_parameter(*args, **kwargs):
-                        if not hasattr(mock_put_parameter, "call_count"):
-                            mock_put_parameter.call_count = 0
-                        if mock_put_parameter.call_count in calls_to_fail_on:
-                            mock_put_parameter.call_count += 1
-                            raise AWSTestFixtures.put_parameter_already_exists_error_response()
-                        mock_put_parameter.call_count += 1
-                        return return_value
+                # Tags are fetched concurrently, so respond by parameter name rather than call order
+                def list_tags_for_resource(ResourceType, ResourceId, env=env):
+                    if ResourceId.startswith("/copilot/"):
+                        return AWSTestFixtures.list_tags_for_resource_response(
+                            env=env, platform="copilot"
+                        )
+                    if ResourceId.endswith("/TERRAFORMED_SECRET"):
+                        return AWSTestFixtures.list_tags_for_resource_response(
+                            env=env, managed_by="DBT Platform - Terraform"
+                        )
+                    return AWSTestFixtures.list_tags_for_resource_response(env=env)
+
+                mock_ssm_client.list_tags_for_resource.side_effect = list_tags_for_resource
+            if stage == "target":
+                # SECRET_EXISTS differs from the source value, SECRET3 is identical
+                existing = {
+                    f"/platform/test-application/{env}/secrets/SECRET_EXISTS": "a-different-value",
+                    f"/platform/test-application/{env}/secrets/SECRET3": "secret3",
+                }
+                mock_ssm_client.get_parameters.side_effect = lambda Names, **kwargs: {
+                    "Parameters": [
+                        AWSTestFixtures.get_parameter_response(name, existing[name])
+                        for name in Names
+                        if name in existing
+                    ],
+                    "InvalidParameters": [name for name in Names if name not in existing],
+                }
 
-                    ssm_client.put_parameter.side_effect = mock_put_parameter
+                def put_parameter(**kwargs):
+                    # SECRET4 is created by someone else between reading and writing the target
+                    if kwargs["Name"].endswith("/SECRET4"):
+                        raise AWSTestFixtures.put_parameter_already_exists_error_response()
+                    return {"Version": 1}
 
                 if self.put_parameter_unexpected:
                     mock_ssm_client.put_parameter.side_effect = (
                         AWSTestFixtures.client_error_response("PutParameter")
                     )
                 else:
-                    _create_ssm_mock_with_failing_put_parameter(mock_ssm_client)
+                    mock_ssm_client.put_parameter.side_effect = put_parameter
 
             mocks[env] = {
                 "session": mock_session,
@@ -379,6 +393,7 @@ def test_create(mock_application, input_args, params_exist):
     info_calls = []
     input_calls = []
     debug_calls = []
+    success_calls = []
     for account_id, mocked in mock.mocks.items():
         env = mocked["env"]
         mocked["session"].client("sts").get_caller_identity.assert_called()
@@ -411,7 +426,7 @@ def test_create(mock_application, input_args, params_exist):
             )
         )
 
-        debug_calls.append(
+        success_calls.append(
             call(
                 f"Successfully created AWS Parameter Store secret /platform/test-application/{env}/secrets/SECRET"
             )
@@ -434,7 +449,20 @@ def test_create(mock_application, input_args, params_exist):
 
     mock.io_mock.info.assert_has_calls(info_calls)
     mock.io_mock.input.assert_has_calls(input_calls)
-    mock.io_mock.debug.assert_has_calls(debug_calls)
+    # Secrets are written once every value has been entered
+    mock.io_mock.debug.assert_has_calls(debug_calls + success_calls)
+
+
+def test_create_writes_every_environment_concurrently(mock_application):
+    mock = AWSMocks()
+    input_mocks = mock.setup_create(mock_application)
+    barrier = threading.Barrier(len(mock_application.environments), timeout=5)
+    for mocked in mock.mocks.values():
+        mocked["session"].client("ssm").put_parameter.side_effect = lambda **kwargs: barrier.wait()
+
+    Secrets(**input_mocks).create("test-application", "secret", False)
+
+    assert mock.io_mock.input.call_count == len(mock_application.environments)
 
 
 def test_create_no_access(mock_application):
@@ -472,7 +500,7 @@ def test_create_exception_unexpected(mock_application):
     with pytest.raises(
         PlatformException,
         match=re.escape(
-            """An error occurred (Unexpected) when calling the GetParameter operation: Simulated failure"""
+            """An error occurred (Unexpected) when calling the GetParameters operation: Simulated failure"""
         ),
     ):
         secrets.create("test-application", "secret", False)
@@ -524,27 +552,43 @@ def test_secrets_copy(mock_application, input_args):
     aws_mocks.io_mock.debug.assert_has_calls(
         [
             call(
-                f"Creating AWS Parameter Store secret /copilot/test-application/{target}/secrets/SECRET1 ..."
+                f"Skipping AWS Parameter Store secret /platform/test-application/{target}/secrets/TERRAFORMED_SECRET with managed-by: DBT Platform - Terraform"
             ),
             call(
-                f"Creating AWS Parameter Store secret /copilot/test-application/{target}/secrets/SECRET2 ..."
+                f"AWS Parameter Store secret /platform/test-application/{target}/secrets/SECRET3 is already up to date in '{target}'"
             ),
             call(
-                f"Creating AWS Parameter Store secret /platform/test-application/{target}/secrets/SECRET_EXISTS ..."
+                f"Creating AWS Parameter Store secret /copilot/test-application/{target}/secrets/SECRET1 ..."
             ),
             call(
-                f"Skipping AWS Parameter Store secret /platform/test-application/{target}/secrets/TERRAFORMED_SECRET with managed-by: DBT Platform - Terraform"
+                f"Creating AWS Parameter Store secret /copilot/test-application/{target}/secrets/SECRET2 ..."
             ),
             call(
-                f"Creating AWS Parameter Store secret /platform/test-application/{target}/secrets/SECRET3 ..."
+                f"Creating AWS Parameter Store secret /platform/test-application/{target}/secrets/SECRET4 ..."
             ),
+        ]
+    )
+    aws_mocks.io_mock.warn.assert_has_calls(
+        [
             call(
-                f"Creating AWS Parameter Store secret /platform/test-application/{target}/secrets/SECRET4 ..."
+                f"""The "SECRET_EXISTS" parameter already exists for the "{target}" environment."""
             ),
+            call(f"""The "SECRET4" parameter already exists for the "{target}" environment."""),
         ]
     )
-    aws_mocks.io_mock.warn.assert_called_with(
-        f"""The "SECRET_EXISTS" parameter already exists for the "{target}" environment."""
+    aws_mocks.io_mock.info.assert_called_with(
+        f"Copied 2 secrets from '{source}' to '{target}'; 2 already existed, "
+        "1 were already up to date and 1 were skipped."
+    )
+    target_env.session.client("ssm").get_parameters.assert_called_once_with(
+        Names=[
+            f"/copilot/test-application/{target}/secrets/SECRET1",
+            f"/copilot/test-application/{target}/secrets/SECRET2",
+            f"/platform/test-application/{target}/secrets/SECRET_EXISTS",
+            f"/platform/test-application/{target}/secrets/SECRET3",
+            f"/platform/test-application/{target}/secrets/SECRET4",
+        ],
+        WithDecryption=True,
     )
 
     def sort_tags(mock_call):
@@ -584,16 +628,6 @@ def test_secrets_copy(mock_application, input_args):
                 ],
             )
         ),
-        call(
-            **AWSTestFixtures.put_parameter_copied_called_with(
-                "platform", source, target, "secret_exists"
-            )
-        ),
-        call(
-            **AWSTestFixtures.put_parameter_copied_called_with(
-                "platform", source, target, "secret3"
-            )
-        ),
         call(
             **AWSTestFixtures.put_parameter_copied_called_with(
                 "platform", source, target, "secret4"
@@ -604,7 +638,9 @@ def test_secrets_copy(mock_application, input_args):
     sorted_actual = [sort_tags(c.args[0] if c.args else c.kwargs) for c in actual_calls]
     sorted_expected = [sort_tags(c.args[0] if c.args else c.kwargs) for c in expected_calls]
 
-    assert sorted_actual == sorted_expected
+    # Secrets are written concurrently, so the order of the calls is not fixed
+    by_name = lambda mock_call: mock_call.kwargs["Name"]
+    assert sorted(sorted_actual, key=by_name) == sorted(sorted_expected, key=by_name)
 
 
 @pytest.mark.parametrize(
@@ -709,3 +745,176 @@ def test_create_with_overwrite_uses_correct_overwrite_per_environment(
     staging_env.session.client("ssm").put_parameter.assert_called_with(
         **AWSTestFixtures.put_parameter_called_with("staging", "2", overwrite=False)
     )
+
+
+def _mock_secrets_diff_session(env, secrets):
+    """Mock a session whose SSM secret trees hold the given {path: (value,
+    version)} secrets."""
+
+    def paginate(Path, **kwargs):
+        return [
+            {
+                "Parameters": [
+                    dict(
+                        AWSTestFixtures.get_parameter_response(name, value),
+                        Version=version,
+                    )
+                    for name, (value, version) in secrets.items()
+                    if name.startswith(f"{Path}/")
+                ]
+            }
+        ]
+
+    mock_ssm_client = MagicMock(name=f"{env}-ssm-client-mock")
+    mock_ssm_client.get_paginator.return_value.paginate.side_effect = paginate
+    mock_session = MagicMock(name=f"{env}-session-mock")
+    mock_session.client.return_value = mock_ssm_client
+    return mock_session
+
+
+def test_secrets_diff_reports_missing_and_differing_secrets_without_values(
+    mock_application_without_prod,
+):
+    environments = mock_application_without_prod.environments
+    environments["dev"].sessions["000000000"] = _mock_secrets_diff_session(
+        "dev",
+        {
+            "/copilot/test-application/dev/secrets/SAME": ("shared-value", 1),
+            "/platform/test-application/dev/secrets/CHANGED": ("dev-value", 2),
+            "/platform/test-application/dev/secrets/DEV_ONLY": ("only-in-dev", 1),
+        },
+    )
+    environments["staging"].sessions["111111111"] = _mock_secrets_diff_session(
+        "staging",
+        {
+            "/copilot/test-application/staging/secrets/SAME": ("shared-value", 4),
+            "/platform/test-application/staging/secrets/CHANGED": ("staging-value", 1),
+        },
+    )
+    io_mock = MagicMock()
+
+    Secrets(load_application=Mock(return_value=mock_application_without_prod), io=io_mock).diff(
+        "test-application", ["dev", "staging"]
+    )
+
+    table = io_mock.info.call_args_list[0].args[0]
+    rows = {row[0]: row[1:] for row in table.rows}
+    assert rows.keys() == {
+        "/copilot/test-application/*/secrets/SAME",
+        "/platform/test-application/*/secrets/CHANGED",
+        "/platform/test-application/*/secrets/DEV_ONLY",
+    }
+    same = rows["/copilot/test-application/*/secrets/SAME"]
+    assert same[0].startswith("v1 ") and same[1].startswith("v4 ")
+    assert same[0].split()[1] == same[1].split()[1]
+    assert same[2] == "same"
+    changed = rows["/platform/test-application/*/secrets/CHANGED"]
+    assert changed[0].split()[1] != changed[1].split()[1]
+    assert changed[2] == "differs"
+    assert rows["/platform/test-application/*/secrets/DEV_ONLY"][1:] == ["-", "missing"]
+    assert "value" not in table.get_string()
+    io_mock.info.assert_called_with("2 of 3 secrets differ between 'dev', 'staging'.")
+
+
+def test_secrets_diff_needs_two_known_environments(mock_application_without_prod):
+    secrets = Secrets(load_application=Mock(return_value=mock_application_without_prod))
+
+    with pytest.raises(PlatformException, match="At least two environments"):
+        secrets.diff("test-application", ["dev", "dev"])
+    with pytest.raises(
+        PlatformException,
+        match="Environment 'prod' not found for application 'test-application'.",
+    ):
+        secrets.diff("test-application", ["dev", "prod"])
+
+
+def test_secrets_export_then_import_creates_missing_secrets(mock_application, tmp_path):
+    bundle = tmp_path / "development.bundle"
+    aws_mocks = AWSMocks()
+    inputs = aws_mocks.setup_copy(mock_application, "development", "staging")
+    aws_mocks.io_mock.input.return_value = "correct horse"
+    secrets = Secrets(**inputs)
+
+    secrets.export_secrets("test-application", "development", str(bundle))
+
+    aws_mocks.io_mock.info.assert_called_with(f"Exported 5 secrets from 'development' to {bundle}")
+    assert "secret_exists" not in bundle.read_text()
+
+    secrets.import_secrets("test-application", "staging", str(bundle))
+
+    target_ssm = mock_application.environments["staging"].session.client("ssm")
+    created = {call.kwargs["Name"]: call.kwargs for call in target_ssm.put_parameter.call_args_list}
+    assert sorted(created) == [
+        "/copilot/test-application/staging/secrets/SECRET1",
+        "/copilot/test-application/staging/secrets/SECRET2",
+        "/platform/test-application/staging/secrets/SECRET4",
+    ]
+    secret1 = created["/copilot/test-application/staging/secrets/SECRET1"]
+    assert secret1["Value"] == "secret1"
+    assert secret1["Description"] == "Imported from development environment."
+    assert {"Key": "copied-from", "Value": "development"} in secret1["Tags"]
+    assert {"Key": "copilot-environment", "Value": "staging"} in secret1["Tags"]
+    aws_mocks.io_mock.info.assert_called_with(
+        f"Imported 2 secrets from {bundle} into 'staging'; 2 already existed, "
+        "1 were already up to date and 0 were skipped."
+    )
+
+
+@pytest.mark.parametrize("env", ["prod", "production"])
+def test_secrets_export_will_not_write_prod_account_secrets_to_a_bundle(
+    mock_application, tmp_path, env
+):
+    bundle = tmp_path / "prod.bundle"
+    aws_mocks = AWSMocks()
+    inputs = aws_mocks.setup_copy(mock_application, env, "staging")
+    secrets = Secrets(**inputs)
+
+    with pytest.raises(
+        PlatformException,
+        match=f"Cannot export secrets from '{env}' in the prod account '222222222'",
+    ):
+        secrets.export_secrets("test-application", env, str(bundle))
+
+    aws_mocks.io_mock.input.assert_not_called()
+    mock_application.environments[env].session.client(
+        "ssm"
+    ).get_parameters_by_path.assert_not_called()
+    assert not bundle.exists()
+
+
+def test_secrets_import_rejects_bundle_for_another_application(mock_application, tmp_path):
+    bundle_provider = Mock()
+    bundle_provider.read.return_value = {
+        "application": "another-application",
+        "environment": "development",
+        "account_id": "000000000",
+        "secrets": [],
+    }
+    aws_mocks = AWSMocks()
+    inputs = aws_mocks.setup_copy(mock_application, "development", "staging")
+    secrets = Secrets(**inputs, bundle_provider=bundle_provider)
+
+    with pytest.raises(
+        PlatformException,
+        match="holds secrets for application 'another-application', not 'test-application'",
+    ):
+        secrets.import_secrets("test-application", "staging", "bundle")
+
+
+def test_secrets_import_will_not_move_prod_secrets_out_of_the_prod_account(mock_application):
+    bundle_provider = Mock()
+    bundle_provider.read.return_value = {
+        "application": "test-application",
+        "environment": "production",
+        "account_id": "222222222",
+        "secrets": [],
+    }
+    aws_mocks = AWSMocks()
+    inputs = aws_mocks.setup_copy(mock_application, "development", "staging")
+    secrets = Secrets(**inputs, bundle_provider=bundle_provider)
+
+    with pytest.raises(
+        PlatformException,
+        match="Cannot transfer secrets out from 'production' in the prod account '222222222'",
+    ):
+        secrets.import_secrets("test-application", "staging", "bundle")
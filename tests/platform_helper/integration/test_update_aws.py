@@ -12,6 +12,8 @@ from dbt_platform_helper.platform_exception import PlatformException
 from dbt_platform_helper.providers.config import ConfigProvider
 from dbt_platform_helper.providers.config_validator import ConfigValidator
 from dbt_platform_helper.providers.version import InstalledVersionProvider
+from dbt_platform_helper.utils.application import Application
+from dbt_platform_helper.utils.application import Environment
 
 
 class ALBRulesTestFixtures:
@@ -159,13 +161,18 @@ class MockALBService:
         mock_client.get_paginator.side_effect = self._get_paginator
 
         mock_client.describe_tags = self._create_tag_descriptions()
+        mock_client.describe_load_balancers.return_value = {
+            "LoadBalancers": [
+                {"LoadBalancerArn": "alb-arn-doesnt-matter", "State": {"Code": "active"}}
+            ]
+        }
 
         return mock_client
 
     def _get_paginator(self, operation_name):
         if operation_name not in self._paginators:
-            if operation_name == "describe_load_balancers":
-                self._paginators[operation_name] = self._create_lb_paginator()
+            if operation_name == "get_resources":
+                self._paginators[operation_name] = self._create_get_resources_paginator()
             elif operation_name == "describe_listeners":
                 self._paginators[operation_name] = self._create_listener_paginator()
             elif operation_name == "describe_rules":
@@ -177,21 +184,38 @@ class MockALBService:
 
         return self._paginators[operation_name]
 
-    def _create_lb_paginator(self):
-        paginator = Mock()
-        paginator.paginate.return_value = [
+    def _create_get_resources_paginator(self):
+        load_balancer = self.fixtures.create_tag_descriptions(
+            "alb-arn-doesnt-matter",
             {
-                "LoadBalancers": [
-                    {
-                        "LoadBalancerArn": "copilot-alb-arn",
-                    },
-                    {
-                        "LoadBalancerArn": "alb-arn-doesnt-matter",
-                    },
-                ],
-                "NextMarker": "string",
-            }
-        ]
+                "copilot-application": "test-application",
+                "copilot-environment": self.environment,
+                "managed-by": "DBT Platform - Terraform",
+            },
+        )
+
+        def get_resources(TagFilters, ResourceTypeFilters):
+            if ResourceTypeFilters == ["elasticloadbalancing:loadbalancer"]:
+                resources = [load_balancer]
+            else:
+                resources = self._target_group_tag_descriptions()
+
+            return [
+                {
+                    "ResourceTagMappingList": [
+                        {"ResourceARN": resource["ResourceArn"], "Tags": resource["Tags"]}
+                        for resource in resources
+                        if all(
+                            {"Key": tag_filter["Key"], "Value": value} in resource["Tags"]
+                            for tag_filter in TagFilters
+                            for value in tag_filter["Values"]
+                        )
+                    ],
+                }
+            ]
+
+        paginator = Mock()
+        paginator.paginate.side_effect = get_resources
         return paginator
 
     def _create_listener_paginator(self):
@@ -259,11 +283,6 @@ class MockALBService:
         return paginator
 
     def _create_describe_target_groups_paginator(self):
-        """
-        This function for target groups is called multiple times.
-
-        Each item in the side effect is returned each call
-        """
         paginator = Mock()
 
         target_rules = [
@@ -283,42 +302,109 @@ class MockALBService:
                     11,
                 )
             )
-        paginator.paginate = Mock(
-            side_effect=[
-                [
-                    {
-                        "TargetGroups": target_rules,
-                        "NextMarker": "string",
-                    },
-                ],
-                [
-                    {
-                        "TargetGroups": [
-                            self.fixtures.create_target_group(4, "/secondary-service"),
-                        ],
-                        "NextMarker": "string",
-                    },
-                ],
-                [
-                    {
-                        "TargetGroups": [
-                            self.fixtures.create_target_group(5),
-                        ],
-                        "NextMarker": "string",
-                    },
-                ],
-                [
-                    {
-                        "TargetGroups": [
-                            self.fixtures.create_target_group(6),
-                        ],
-                        "NextMarker": "string",
-                    }
-                ],
+
+        def describe_target_groups(TargetGroupArns):
+            return [
+                {
+                    "TargetGroups": [
+                        tg for tg in target_rules if tg["TargetGroupArn"] in TargetGroupArns
+                    ],
+                    "NextMarker": "string",
+                },
             ]
-        )
+
+        paginator.paginate = Mock(side_effect=describe_target_groups)
         return paginator
 
+    def _target_group_tag_descriptions(self):
+        return [
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-8",
+                {
+                    "environment": self.environment,
+                    "application": "test-application",
+                    "managed-by": "DBT Platform - Service Terraform",
+                    "service": "web-path",
+                },
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-9",
+                {
+                    "environment": self.environment,
+                    "application": "test-application",
+                    "managed-by": "DBT Platform - Service Terraform",
+                    "service": "web",
+                },
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-10",
+                {
+                    "environment": self.environment,
+                    "application": "test-application",
+                    "managed-by": "DBT Platform - Service Terraform",
+                    "service": "api",
+                },
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-99",
+                {
+                    "environment": "different-env",
+                    "application": "test-application",
+                    "managed-by": "DBT Platform - Service Terraform",
+                    "service": "web",
+                },
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-98",
+                {
+                    "environment": self.environment,
+                    "application": "different-application",
+                    "managed-by": "DBT Platform - Service Terraform",
+                    "service": "web",
+                },
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-97",
+                {
+                    "copilot-application": "test-application",
+                    "copilot-environment": self.environment,
+                    "environment": self.environment,
+                    "application": "test-application",
+                    "managed-by": "DBT Platform - Terraform",
+                },
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-4",
+                {
+                    "copilot-application": "test-application",
+                    "copilot-environment": self.environment,
+                    "copilot-service": "web-path",
+                },
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-5",
+                {
+                    "copilot-application": "test-application",
+                    "copilot-environment": self.environment,
+                    "copilot-service": "api",
+                },
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-6",
+                {
+                    "copilot-application": "test-application",
+                    "copilot-environment": self.environment,
+                    "copilot-service": "web",
+                },
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-7",
+            ),
+            self.fixtures.create_tag_descriptions(
+                "tg-arn-doesnt-matter-12",
+            ),
+        ]
+
     def _create_tag_descriptions(self):
         """Order is based on the order they are called so it is very important
         for boto3 calls."""
@@ -368,27 +454,6 @@ class MockALBService:
             )
         return Mock(
             side_effect=[
-                {  # ALB
-                    "TagDescriptions": [
-                        self.fixtures.create_tag_descriptions(
-                            "copilot-alb-arn",
-                            {
-                                "copilot-application": "test-application",
-                                "copilot-environment": self.environment,
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "alb-arn-doesnt-matter",
-                            {
-                                "copilot-application": "test-application",
-                                "copilot-environment": self.environment,
-                                "application": "test-application",
-                                "environment": self.environment,
-                                "managed-by": "DBT Platform - Terraform",
-                            },
-                        ),
-                    ]
-                },
                 {  # Listener rule tags
                     "TagDescriptions": [
                         self.fixtures.create_tag_descriptions(
@@ -461,95 +526,6 @@ class MockALBService:
                         *rule_tags,
                     ]
                 },
-                {  # Target group tags
-                    "TagDescriptions": [
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-8",
-                            {
-                                "environment": self.environment,
-                                "application": "test-application",
-                                "managed-by": "DBT Platform - Service Terraform",
-                                "service": "web-path",
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-9",
-                            {
-                                "environment": self.environment,
-                                "application": "test-application",
-                                "managed-by": "DBT Platform - Service Terraform",
-                                "service": "web",
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-10",
-                            {
-                                "environment": self.environment,
-                                "application": "test-application",
-                                "managed-by": "DBT Platform - Service Terraform",
-                                "service": "api",
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-99",
-                            {
-                                "environment": "different-env",
-                                "application": "test-application",
-                                "managed-by": "DBT Platform - Service Terraform",
-                                "service": "web",
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-98",
-                            {
-                                "environment": self.environment,
-                                "application": "different-application",
-                                "managed-by": "DBT Platform - Service Terraform",
-                                "service": "web",
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-97",
-                            {
-                                "copilot-application": "test-application",
-                                "copilot-environment": self.environment,
-                                "environment": self.environment,
-                                "application": "test-application",
-                                "managed-by": "DBT Platform - Terraform",
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-4",
-                            {
-                                "copilot-application": "test-application",
-                                "copilot-environment": self.environment,
-                                "copilot-service": "web-path",
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-5",
-                            {
-                                "copilot-application": "test-application",
-                                "copilot-environment": self.environment,
-                                "copilot-service": "api",
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-6",
-                            {
-                                "copilot-application": "test-application",
-                                "copilot-environment": self.environment,
-                                "copilot-service": "web",
-                            },
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-7",
-                        ),
-                        self.fixtures.create_tag_descriptions(
-                            "tg-arn-doesnt-matter-12",
-                        ),
-                    ]
-                },
                 {
                     "TagDescriptions": [
                         self.fixtures.create_tag_descriptions(
@@ -1179,3 +1155,476 @@ def test_alb_rules_with_manual(
         update_aws.update_alb_rules(
             environment="test",
         )
+
+
+def _reconcile_update_aws(mock_application, mock_boto_elbv2_client, mock_io):
+    load_application = Mock()
+    load_application.return_value = mock_application
+    mock_installed_version_provider = create_autospec(spec=InstalledVersionProvider, spec_set=True)
+    mock_installed_version_provider.get_semantic_version.return_value = SemanticVersion(14, 0, 0)
+    mock_config_provider = ConfigProvider(
+        Mock(spec=ConfigValidator), installed_version_provider=mock_installed_version_provider
+    )
+
+    mock_session = Mock(name="session-mock")
+    mock_session.client.return_value = mock_boto_elbv2_client
+
+    return UpdateALBRules(
+        mock_session,
+        config_provider=mock_config_provider,
+        io=mock_io,
+        load_application=load_application,
+    )
+
+
+def test_alb_rules_reconciles_existing_platform_rules(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+    mock_application,
+):
+    mock_alb = MockALBService(environment="staging", create_platform_rules=True)
+    mock_boto_elbv2_client = mock_alb.create_elbv2_client_mock()
+    mock_boto_elbv2_client.set_rule_priorities.return_value = {
+        "Rules": [
+            mock_alb.fixtures.create_rule_response(9, "10000"),
+            mock_alb.fixtures.create_rule_response(10, "10100", host_header="api.doesnt-matter"),
+        ]
+    }
+    mock_boto_elbv2_client.modify_rule.side_effect = [
+        {
+            "Rules": [
+                mock_alb.fixtures.create_rule_response(
+                    9, "10000", host_header="web.dev.test-app.uktrade.digital"
+                )
+            ]
+        },
+        {
+            "Rules": [
+                mock_alb.fixtures.create_rule_response(
+                    10, "10100", host_header="api.dev.test-app.uktrade.digital"
+                )
+            ]
+        },
+    ]
+    mock_io = MagicMock()
+
+    _reconcile_update_aws(mock_application, mock_boto_elbv2_client, mock_io).update_alb_rules(
+        environment="staging"
+    )
+
+    assert mock_boto_elbv2_client.delete_rule.call_args_list == [
+        # Frees priority 10000 before the web rule moves into it
+        call(RuleArn="listener-rule-arn-doesnt-matter-8"),
+        # Dummy rule
+        call(RuleArn="listener-rule-arn-doesnt-matter-12"),
+    ]
+    mock_boto_elbv2_client.set_rule_priorities.assert_called_once_with(
+        RulePriorities=[
+            {"RuleArn": "listener-rule-arn-doesnt-matter-9", "Priority": 10000},
+            {"RuleArn": "listener-rule-arn-doesnt-matter-10", "Priority": 10100},
+        ]
+    )
+    assert mock_boto_elbv2_client.modify_rule.call_args_list == [
+        call(
+            RuleArn=f"listener-rule-arn-doesnt-matter-{index}",
+            Conditions=[
+                {"Field": "host-header", "HostHeaderConfig": {"Values": [host]}},
+                {"Field": "path-pattern", "PathPatternConfig": {"Values": ["/*"]}},
+            ],
+            Actions=[{"Type": "forward", "TargetGroupArn": f"tg-arn-doesnt-matter-{index}"}],
+        )
+        for index, host in [
+            (9, "web.dev.test-app.uktrade.digital"),
+            (10, "api.dev.test-app.uktrade.digital"),
+        ]
+    ]
+    mock_boto_elbv2_client.create_rule.assert_not_called()
+    mock_boto_elbv2_client.add_tags.assert_not_called()
+    # Rules are rewritten before they move to their new priorities
+    assert [
+        name
+        for name, _, _ in mock_boto_elbv2_client.method_calls
+        if name in ["modify_rule", "set_rule_priorities"]
+    ] == ["modify_rule", "modify_rule", "set_rule_priorities"]
+
+    mock_io.info.assert_has_calls(
+        [
+            call("Modified rules: 2"),
+            call("ARN: listener-rule-arn-doesnt-matter-9"),
+            call("Priority: 10000"),
+            call("Hosts: web.dev.test-app.uktrade.digital"),
+            call("Paths: /*\n"),
+            call("ARN: listener-rule-arn-doesnt-matter-10"),
+            call("Priority: 10100"),
+            call("Hosts: api.dev.test-app.uktrade.digital"),
+            call("Paths: /*\n"),
+            call("Reprioritised rules: 2"),
+        ]
+    )
+    mock_io.info.assert_any_call("Deleted rules: 2")
+
+
+def test_alb_rules_reconcile_rolls_back_modified_and_reprioritised_rules(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+    mock_application,
+):
+    mock_alb = MockALBService(environment="staging", create_platform_rules=True)
+    mock_boto_elbv2_client = mock_alb.create_elbv2_client_mock()
+    mock_boto_elbv2_client.set_rule_priorities.return_value = {
+        "Rules": [
+            mock_alb.fixtures.create_rule_response(9, "10000"),
+            mock_alb.fixtures.create_rule_response(10, "10100", host_header="api.doesnt-matter"),
+        ]
+    }
+    mock_boto_elbv2_client.modify_rule.side_effect = [
+        {"Rules": [mock_alb.fixtures.create_rule_response(9, "10000")]},
+        {"Rules": [mock_alb.fixtures.create_rule_response(10, "10100")]},
+        # Rollback of rules 9 and 10
+        {"Rules": [mock_alb.fixtures.create_rule_response(9, "10100")]},
+        {"Rules": [mock_alb.fixtures.create_rule_response(10, "11000")]},
+    ]
+    delete_failure = ClientError(
+        {"Error": {"Code": "ValidationError", "Message": "Simulated failure"}}, "DeleteRule"
+    )
+    # Freeing priority 10000 succeeds, deleting the dummy rule fails
+    mock_boto_elbv2_client.delete_rule.side_effect = [{}, delete_failure]
+    mock_boto_elbv2_client.create_rule.return_value = {
+        "Rules": [{"RuleArn": "listener-rule-arn-doesnt-matter-8"}]
+    }
+    mock_io = MagicMock()
+
+    with pytest.raises(PlatformException, match="Rule update failed and rolled back"):
+        _reconcile_update_aws(mock_application, mock_boto_elbv2_client, mock_io).update_alb_rules(
+            environment="staging"
+        )
+
+    assert mock_boto_elbv2_client.set_rule_priorities.call_args_list[-1] == call(
+        RulePriorities=[
+            {"RuleArn": "listener-rule-arn-doesnt-matter-9", "Priority": 10100},
+            {"RuleArn": "listener-rule-arn-doesnt-matter-10", "Priority": 11000},
+        ]
+    )
+    assert (
+        call(
+            RuleArn="listener-rule-arn-doesnt-matter-9",
+            Conditions=[
+                {"Field": "host-header", "Values": ["web.doesnt-matter"]},
+                {"Field": "path-pattern", "Values": ["/*"]},
+            ],
+            Actions=mock_alb.fixtures.create_rule_response(9, "10100")["Actions"],
+        )
+        in mock_boto_elbv2_client.modify_rule.call_args_list[2:]
+    )
+    assert sorted(
+        call.kwargs["RuleArn"] for call in mock_boto_elbv2_client.modify_rule.call_args_list[2:]
+    ) == ["listener-rule-arn-doesnt-matter-10", "listener-rule-arn-doesnt-matter-9"]
+    mock_boto_elbv2_client.create_rule.assert_called_once()
+    assert mock_boto_elbv2_client.create_rule.call_args.kwargs["Priority"] == 10000
+    mock_io.info.assert_any_call("Rollback completed successfully")
+
+
+def test_alb_rules_plan_outputs_changes_without_applying_them(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+    mock_application,
+):
+    mock_alb = MockALBService(environment="staging", create_platform_rules=True)
+    mock_boto_elbv2_client = mock_alb.create_elbv2_client_mock()
+    mock_io = MagicMock()
+
+    _reconcile_update_aws(mock_application, mock_boto_elbv2_client, mock_io).update_alb_rules(
+        environment="staging", plan=True
+    )
+
+    for operation in [
+        "create_rule",
+        "modify_rule",
+        "set_rule_priorities",
+        "add_tags",
+        "delete_rule",
+    ]:
+        getattr(mock_boto_elbv2_client, operation).assert_not_called()
+
+    mock_io.info.assert_has_calls(
+        [
+            call("Deployment Mode: platform"),
+            call("Platform listener rules: 2 after condition packing, 2 before"),
+            call("Rules to modify: 2"),
+            call("ARN: listener-rule-arn-doesnt-matter-9"),
+            call("Priority: 10000"),
+            call("Hosts: web.dev.test-app.uktrade.digital"),
+            call("Paths: /*\n"),
+            call("ARN: listener-rule-arn-doesnt-matter-10"),
+            call("Priority: 10100"),
+            call("Hosts: api.dev.test-app.uktrade.digital"),
+            call("Paths: /*\n"),
+            call("Rules to reprioritise: 2"),
+            call("ARN: listener-rule-arn-doesnt-matter-9"),
+            call("Priority: 10100 -> 10000\n"),
+            call("ARN: listener-rule-arn-doesnt-matter-10"),
+            call("Priority: 11000 -> 10100\n"),
+            call("Rules to delete: 2"),
+            call("ARN: listener-rule-arn-doesnt-matter-8"),
+            call("Priority: 10000"),
+            call("Hosts: web.doesnt-matter"),
+            call("Paths: /secondary-service/*,/secondary-service\n"),
+            call("ARN: listener-rule-arn-doesnt-matter-12"),
+            call("Priority: 1000"),
+            call("Hosts: web.doesnt-matter"),
+            call("Paths: /*\n"),
+            # 2 deletes, 1 batched reprioritisation and 2 modifications
+            call("Applying this plan would make 5 ELB API calls."),
+        ]
+    )
+
+
+def _interrupted_reconcile(mock_application, mock_alb):
+    mock_boto_elbv2_client = mock_alb.create_elbv2_client_mock()
+    mock_boto_elbv2_client.modify_rule.side_effect = [
+        {"Rules": [mock_alb.fixtures.create_rule_response(9, "10100")]},
+        {"Rules": [mock_alb.fixtures.create_rule_response(10, "11000")]},
+    ]
+    # The process is killed while the modified rules are being moved
+    mock_boto_elbv2_client.set_rule_priorities.side_effect = KeyboardInterrupt()
+
+    with pytest.raises(KeyboardInterrupt):
+        _reconcile_update_aws(
+            mock_application, mock_boto_elbv2_client, MagicMock()
+        ).update_alb_rules(environment="staging")
+
+    return mock_boto_elbv2_client
+
+
+def test_alb_rules_journal_is_removed_after_a_successful_update(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+    mock_application,
+    alb_rule_journal_dir,
+):
+    mock_boto_elbv2_client = MockALBService(environment="test").create_elbv2_client_mock()
+    mock_boto_elbv2_client.create_rule.return_value = {
+        "Rules": [{"RuleArn": "platform-new-arn", "Priority": "10000", "Conditions": []}]
+    }
+
+    _reconcile_update_aws(mock_application, mock_boto_elbv2_client, MagicMock()).update_alb_rules(
+        environment="test"
+    )
+
+    assert mock_boto_elbv2_client.create_rule.call_count == 2
+    assert not list(alb_rule_journal_dir.glob("*"))
+
+
+def test_alb_rules_refuses_to_start_over_an_interrupted_update(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+    mock_application,
+    alb_rule_journal_dir,
+):
+    _interrupted_reconcile(
+        mock_application, MockALBService(environment="staging", create_platform_rules=True)
+    )
+
+    assert (alb_rule_journal_dir / "test-application-staging.jsonl").exists()
+    with pytest.raises(
+        PlatformException,
+        match="An interrupted ALB rule update was found for environment staging. Run again with --resume to finish it or --rollback to undo it.",
+    ):
+        _reconcile_update_aws(
+            mock_application,
+            MockALBService(environment="staging").create_elbv2_client_mock(),
+            MagicMock(),
+        ).update_alb_rules(environment="staging")
+
+
+def test_alb_rules_rollback_undoes_an_interrupted_update_from_its_journal(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+    mock_application,
+    alb_rule_journal_dir,
+):
+    mock_alb = MockALBService(environment="staging", create_platform_rules=True)
+    _interrupted_reconcile(mock_application, mock_alb)
+
+    mock_boto_elbv2_client = Mock(name="elbv2-client-mock")
+    mock_boto_elbv2_client.create_rule.return_value = {
+        "Rules": [{"RuleArn": "listener-rule-arn-doesnt-matter-8-recreated"}]
+    }
+    mock_io = MagicMock()
+
+    _reconcile_update_aws(mock_application, mock_boto_elbv2_client, mock_io).update_alb_rules(
+        environment="staging", rollback=True
+    )
+
+    mock_boto_elbv2_client.set_rule_priorities.assert_called_once_with(
+        RulePriorities=[
+            {"RuleArn": "listener-rule-arn-doesnt-matter-9", "Priority": 10100},
+            {"RuleArn": "listener-rule-arn-doesnt-matter-10", "Priority": 11000},
+        ]
+    )
+    # The rules were being moved when the process died, so their priorities are restored too
+    assert sorted(
+        call.kwargs["RuleArn"] for call in mock_boto_elbv2_client.modify_rule.call_args_list
+    ) == ["listener-rule-arn-doesnt-matter-10", "listener-rule-arn-doesnt-matter-9"]
+    mock_boto_elbv2_client.create_rule.assert_called_once()
+    assert mock_boto_elbv2_client.create_rule.call_args.kwargs["Priority"] == 10000
+    assert mock_boto_elbv2_client.create_rule.call_args.kwargs["Tags"][2] == {
+        "Key": "service",
+        "Value": "web-path",
+    }
+    mock_io.info.assert_any_call(
+        "Rolled back rules by creating: ['listener-rule-arn-doesnt-matter-8-recreated'] \n and deleting []"
+    )
+    assert not list(alb_rule_journal_dir.glob("*"))
+
+
+def test_alb_rules_resume_finishes_an_interrupted_update(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+    mock_application,
+    alb_rule_journal_dir,
+):
+    _interrupted_reconcile(
+        mock_application, MockALBService(environment="staging", create_platform_rules=True)
+    )
+
+    mock_alb = MockALBService(environment="staging", create_platform_rules=True)
+    mock_boto_elbv2_client = mock_alb.create_elbv2_client_mock()
+    mock_boto_elbv2_client.set_rule_priorities.return_value = {
+        "Rules": [
+            mock_alb.fixtures.create_rule_response(9, "10000"),
+            mock_alb.fixtures.create_rule_response(10, "10100", host_header="api.doesnt-matter"),
+        ]
+    }
+    mock_boto_elbv2_client.modify_rule.side_effect = [
+        {"Rules": [mock_alb.fixtures.create_rule_response(9, "10000")]},
+        {"Rules": [mock_alb.fixtures.create_rule_response(10, "10100")]},
+    ]
+    mock_io = MagicMock()
+
+    _reconcile_update_aws(mock_application, mock_boto_elbv2_client, mock_io).update_alb_rules(
+        environment="staging", resume=True
+    )
+
+    assert mock_boto_elbv2_client.modify_rule.call_count == 2
+    mock_io.info.assert_any_call("Modified rules: 2")
+    assert not list(alb_rule_journal_dir.glob("*"))
+
+
+def _multiple_environment_update_aws(clients: dict, mock_io):
+    """An updater for an application whose environments are in different
+    accounts, each with its own ELB client."""
+    sessions = {}
+    application = Application("test-application")
+    for index, (environment, client) in enumerate(clients.items()):
+        account_id = f"{index}" * 9
+        sessions[account_id] = Mock(name=f"{environment}-session-mock")
+        sessions[account_id].client.return_value = client
+        application.environments[environment] = Environment(environment, account_id, sessions)
+
+    load_application = Mock(return_value=application)
+    mock_installed_version_provider = create_autospec(spec=InstalledVersionProvider, spec_set=True)
+    mock_installed_version_provider.get_semantic_version.return_value = SemanticVersion(14, 0, 0)
+    mock_config_provider = ConfigProvider(
+        Mock(spec=ConfigValidator), installed_version_provider=mock_installed_version_provider
+    )
+    mock_config_provider.get_enriched_config = Mock(wraps=mock_config_provider.get_enriched_config)
+
+    update_aws = UpdateALBRules(
+        Mock(name="session-mock"),
+        config_provider=mock_config_provider,
+        io=mock_io,
+        load_application=load_application,
+    )
+    return update_aws, load_application, mock_config_provider
+
+
+def test_alb_rules_for_environments_updates_each_environment_and_aggregates_the_results(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+    alb_rule_journal_dir,
+):
+    staging_client = MockALBService(environment="staging").create_elbv2_client_mock()
+    staging_client.create_rule.return_value = {
+        "Rules": [{"RuleArn": "platform-new-arn", "Priority": "10000", "Conditions": []}]
+    }
+    test_client = MockALBService(environment="test", manual_rule=True).create_elbv2_client_mock()
+    mock_io = MagicMock()
+    update_aws, load_application, config_provider = _multiple_environment_update_aws(
+        {"staging": staging_client, "test": test_client}, mock_io
+    )
+
+    with pytest.raises(
+        PlatformException, match="ALB rule updates failed for 1 of 2 environments: test"
+    ):
+        update_aws.update_alb_rules_for_environments(["staging", "test"])
+
+    # The config and application are loaded once for all the environments
+    config_provider.get_enriched_config.assert_called_once()
+    load_application.assert_called_once_with(app="test-application", prewarm_sessions=True)
+
+    # The failing environment does not stop or undo the other
+    assert staging_client.create_rule.call_count == 2
+    test_client.create_rule.assert_not_called()
+    test_client.delete_rule.assert_not_called()
+    assert not list(alb_rule_journal_dir.glob("*"))
+
+    mock_io.info.assert_any_call("[staging] Created rules: 2")
+    mock_io.info.assert_has_calls([call("ALB rule update results:"), call("staging: succeeded")])
+    assert mock_io.error.call_args.args[0].startswith(
+        "test: The following rules have been created manually"
+    )
+
+
+def test_alb_rules_for_environments_reports_every_result_when_a_worker_exits(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+    alb_rule_journal_dir,
+):
+    staging_client = MockALBService(environment="staging").create_elbv2_client_mock()
+    staging_client.create_rule.return_value = {
+        "Rules": [{"RuleArn": "platform-new-arn", "Priority": "10000", "Conditions": []}]
+    }
+    test_client = MockALBService(environment="test").create_elbv2_client_mock()
+    test_client.create_rule.side_effect = SystemExit(1)
+    mock_io = MagicMock()
+    update_aws, _, _ = _multiple_environment_update_aws(
+        {"staging": staging_client, "test": test_client}, mock_io
+    )
+
+    with pytest.raises(
+        PlatformException, match="ALB rule updates failed for 1 of 2 environments: test"
+    ):
+        update_aws.update_alb_rules_for_environments(["staging", "test"])
+
+    assert staging_client.create_rule.call_count == 2
+    mock_io.info.assert_has_calls([call("ALB rule update results:"), call("staging: succeeded")])
+    mock_io.error.assert_any_call(
+        "test: the update was interrupted (exited with code 1). Run again with --resume to finish it or --rollback to undo it."
+    )
+
+
+def test_alb_rules_for_environments_rejects_unknown_environments(
+    fakefs,
+    create_valid_platform_config_file,
+    create_valid_multiple_service_config_files,
+):
+    staging_client = MockALBService(environment="staging").create_elbv2_client_mock()
+    update_aws, _, _ = _multiple_environment_update_aws({"staging": staging_client}, MagicMock())
+
+    with pytest.raises(
+        PlatformException,
+        match="The environments missing were not found in the application test-application.",
+    ):
+        update_aws.update_alb_rules_for_environments(["staging", "missing"])
+
+    staging_client.create_rule.assert_not_called()
@@ -35,6 +35,9 @@ def test_create_postgres_admin_task(mock_get_connection_string, mock_subprocess,
     boto3.client("ssm").put_parameter(
         Name=master_secret_name, Value="master-secret-arn", Type="String"
     )
+    boto3.client("ssm").put_parameter(
+        Name="POSTGRES_SECRET_NAME_READ_ONLY_USER", Value="read-only-secret", Type="SecureString"
+    )
 
     create_postgres_admin_task(
         ssm_client,
@@ -49,6 +52,7 @@ def test_create_postgres_admin_task(mock_get_connection_string, mock_subprocess,
     mock_get_connection_string.assert_called_once_with(
         "POSTGRES_SECRET_NAME_READ_ONLY_USER",
         "master-secret-arn",
+        parameter_value="read-only-secret",
     )
 
     mock_subprocess.call.assert_called_once_with(
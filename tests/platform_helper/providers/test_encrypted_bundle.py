@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from dbt_platform_helper.providers.encrypted_bundle import BundleNotFoundException
+from dbt_platform_helper.providers.encrypted_bundle import EncryptedBundleProvider
+from dbt_platform_helper.providers.encrypted_bundle import InvalidBundleException
+
+
+def test_bundle_round_trips_without_storing_plaintext(tmp_path):
+    bundle = tmp_path / "secrets.bundle"
+    contents = {"secrets": [{"name": "/platform/app/dev/secrets/API_KEY", "value": "s3cr3t"}]}
+
+    EncryptedBundleProvider.write(bundle, contents, "correct horse")
+
+    assert "s3cr3t" not in bundle.read_text()
+    assert "API_KEY" not in bundle.read_text()
+    assert bundle.stat().st_mode & 0o777 == 0o600
+    assert EncryptedBundleProvider.read(bundle, "correct horse") == contents
+
+
+def test_bundle_with_wrong_passphrase_is_rejected(tmp_path):
+    bundle = tmp_path / "secrets.bundle"
+    EncryptedBundleProvider.write(bundle, {"secrets": []}, "correct horse")
+
+    with pytest.raises(InvalidBundleException, match="Could not decrypt"):
+        EncryptedBundleProvider.read(bundle, "battery staple")
+
+
+def test_bundle_which_is_not_a_bundle_is_rejected(tmp_path):
+    bundle = tmp_path / "secrets.bundle"
+    bundle.write_text(json.dumps({"something": "else"}))
+
+    with pytest.raises(InvalidBundleException):
+        EncryptedBundleProvider.read(bundle, "correct horse")
+
+
+def test_missing_bundle_is_reported(tmp_path):
+    with pytest.raises(BundleNotFoundException, match="does not exist"):
+        EncryptedBundleProvider.read(tmp_path / "missing.bundle", "correct horse")
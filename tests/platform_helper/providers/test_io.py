@@ -1,4 +1,5 @@
 from io import StringIO
+from unittest.mock import MagicMock
 from unittest.mock import call
 from unittest.mock import patch
 
@@ -6,6 +7,7 @@ import pytest
 
 from dbt_platform_helper.providers.io import ClickIOProvider
 from dbt_platform_helper.providers.io import ClickIOProviderException
+from dbt_platform_helper.providers.io import PrefixedIOProvider
 
 
 class TestClickIOProvider:
@@ -152,3 +154,22 @@ class TestClickIOProviderProcessMessages:
                 call("info_1\ninfo_2"),
             ]
         )
+
+
+class TestPrefixedIOProvider:
+    def test_prefixes_messages_and_prompts(self):
+        mock_io = MagicMock()
+        mock_io.confirm.return_value = True
+        io = PrefixedIOProvider("staging", mock_io)
+
+        io.info("Info.", fg="green")
+        io.warn("Warning!")
+        io.error("Error!")
+        io.debug("Debug.")
+
+        assert io.confirm("Continue?")
+        mock_io.info.assert_called_once_with("[staging] Info.", fg="green")
+        mock_io.warn.assert_called_once_with("[staging] Warning!")
+        mock_io.error.assert_called_once_with("[staging] Error!")
+        mock_io.debug.assert_called_once_with("[staging] Debug.")
+        mock_io.confirm.assert_called_once_with("[staging] Continue?")
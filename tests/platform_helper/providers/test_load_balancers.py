@@ -2,7 +2,9 @@ import json
 from unittest.mock import Mock
 from unittest.mock import patch
 
+import boto3
 import pytest
+from botocore.exceptions import ClientError
 from moto import mock_aws
 
 from dbt_platform_helper.providers.load_balancers import CertificateNotFoundException
@@ -25,11 +27,11 @@ def _create_subnet(session):
     )
 
 
-def _create_load_balancer(session):
+def _create_load_balancer(session, name="test-load-balancer"):
     _, subnet_id = _create_subnet(session)
     elbv2_client = session.client("elbv2")
     return elbv2_client.create_load_balancer(
-        Name="test-load-balancer",
+        Name=name,
         Subnets=[subnet_id],
         Tags=[
             {"Key": "copilot-application", "Value": "test-application"},
@@ -322,6 +324,26 @@ def test_find_target_group_not_found(mock_application):
     )
 
 
+@mock_aws
+def test_get_target_groups_by_tags(mock_application):
+    session = mock_application.environments["development"].session
+    web_arn = _create_target_group(session)
+    _create_target_group(session, service_name="api", copilot_tags=True)
+
+    alb_provider = LoadBalancerProvider(session)
+    result = alb_provider.get_target_groups_by_tags(
+        {"application": "test-application", "environment": "development"}
+    )
+
+    assert [tg["TargetGroupArn"] for tg in result] == [web_arn]
+    assert result[0]["TargetGroupName"] == "web-target-group"
+    assert result[0]["Tags"] == {
+        "application": "test-application",
+        "environment": "development",
+        "service": "web",
+    }
+
+
 @mock_aws
 def test_delete_listener_rule(mock_application):
     session = mock_application.environments["development"].session
@@ -397,6 +419,81 @@ def test_get_load_balancer_for_application(mock_application):
     assert result == lb_arn
 
 
+@mock_aws
+def test_get_load_balancer_for_application_reuses_cached_load_balancer(load_balancer_cache_file):
+    session = boto3.session.Session(region_name="eu-west-2")
+    lb_arn = _create_load_balancer(session)
+
+    assert (
+        LoadBalancerProvider(session).get_load_balancer_for_application(
+            "test-application", "development"
+        )
+        == lb_arn
+    )
+    assert list(json.loads(load_balancer_cache_file.read_text()).values()) == [lb_arn]
+
+    alb_provider = LoadBalancerProvider(session)
+    with patch.object(
+        alb_provider.rg_tagging_client, "get_paginator"
+    ) as get_paginator, patch.object(
+        alb_provider.evlb_client,
+        "describe_load_balancers",
+        wraps=alb_provider.evlb_client.describe_load_balancers,
+    ) as describe_load_balancers:
+        result = alb_provider.get_load_balancer_for_application("test-application", "development")
+
+    assert result == lb_arn
+    # The cached load balancer is checked with a single describe_tags call
+    get_paginator.assert_not_called()
+    describe_load_balancers.assert_not_called()
+
+
+@mock_aws
+def test_get_load_balancer_for_application_ignores_deleted_cached_load_balancer(
+    load_balancer_cache_file,
+):
+    session = boto3.session.Session(region_name="eu-west-2")
+    deleted_arn = _create_load_balancer(session)
+    LoadBalancerProvider(session).get_load_balancer_for_application(
+        "test-application", "development"
+    )
+    session.client("elbv2").delete_load_balancer(LoadBalancerArn=deleted_arn)
+    lb_arn = _create_load_balancer(session)
+
+    alb_provider = LoadBalancerProvider(session)
+    # moto keeps the tags of deleted load balancers, where AWS reports them as not found
+    not_found = ClientError(
+        {"Error": {"Code": "LoadBalancerNotFound", "Message": "not found"}}, "DescribeTags"
+    )
+    with patch.object(alb_provider.evlb_client, "describe_tags", side_effect=not_found):
+        result = alb_provider.get_load_balancer_for_application("test-application", "development")
+
+    assert result == lb_arn
+    assert list(json.loads(load_balancer_cache_file.read_text()).values()) == [lb_arn]
+
+
+@mock_aws
+def test_get_load_balancer_for_application_ignores_retagged_cached_load_balancer(
+    load_balancer_cache_file,
+):
+    session = boto3.session.Session(region_name="eu-west-2")
+    retagged_arn = _create_load_balancer(session)
+    LoadBalancerProvider(session).get_load_balancer_for_application(
+        "test-application", "development"
+    )
+    session.client("elbv2").add_tags(
+        ResourceArns=[retagged_arn], Tags=[{"Key": "copilot-environment", "Value": "staging"}]
+    )
+    lb_arn = _create_load_balancer(session, name="replacement-load-balancer")
+
+    result = LoadBalancerProvider(session).get_load_balancer_for_application(
+        "test-application", "development"
+    )
+
+    assert result == lb_arn
+    assert list(json.loads(load_balancer_cache_file.read_text()).values()) == [lb_arn]
+
+
 @mock_aws
 def test_get_https_listener_for_application(mock_application):
     session = mock_application.environments["development"].session
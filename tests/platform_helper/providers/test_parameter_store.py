@@ -1,7 +1,13 @@
+from unittest.mock import Mock
+from unittest.mock import patch
+
 import boto3
 import pytest
+from botocore.exceptions import ClientError
 from botocore.stub import Stubber
+from moto import mock_aws
 
+from dbt_platform_helper.providers.parameter_store import Parameter
 from dbt_platform_helper.providers.parameter_store import (
     ParameterNotFoundForPathException,
 )
@@ -75,3 +81,193 @@ def test_get_ssm_parameters_by_path_no_parameters_found():
             ParameterStore(ssm_client=ssm_client).get_ssm_parameters_by_path(parameter_path)
 
     stubbed_ssm_client.assert_no_pending_responses()
+
+
+@mock_aws
+def test_get_ssm_parameters_by_names_batches_names_and_reports_missing():
+    ssm_client = boto3.client("ssm")
+    for index in range(12):
+        ssm_client.put_parameter(
+            Name=f"/app/env/secrets/SECRET_{index}", Value=str(index), Type="SecureString"
+        )
+    names = [f"/app/env/secrets/SECRET_{index}" for index in range(12)] + [
+        "/app/env/secrets/MISSING"
+    ]
+    get_parameters = Mock(wraps=ssm_client.get_parameters)
+    ssm_client.get_parameters = get_parameters
+
+    result = ParameterStore(ssm_client).get_ssm_parameters_by_names(names)
+
+    assert [len(call.kwargs["Names"]) for call in get_parameters.call_args_list] == [10, 3]
+    assert {name: param["Value"] for name, param in result.found.items()} == {
+        f"/app/env/secrets/SECRET_{index}": str(index) for index in range(12)
+    }
+    assert result.missing == {"/app/env/secrets/MISSING"}
+
+
+@mock_aws
+def test_get_ssm_parameters_by_names_with_model_and_tags():
+    ssm_client = boto3.client("ssm")
+    ssm_client.put_parameter(
+        Name="/app/env/secrets/SECRET",
+        Value="value",
+        Type="SecureString",
+        Tags=[{"Key": "application", "Value": "app"}],
+    )
+
+    result = ParameterStore(ssm_client, with_model=True).get_ssm_parameters_by_names(
+        ["/app/env/secrets/SECRET", "/app/env/secrets/SECRET"], add_tags=True
+    )
+
+    parameter = result.found["/app/env/secrets/SECRET"]
+    assert isinstance(parameter, Parameter)
+    assert parameter.value == "value"
+    assert parameter.tags == {"application": "app"}
+    assert result.missing == set()
+
+
+@mock_aws
+def test_get_ssm_parameters_by_path_without_decryption():
+    ssm_client = boto3.client("ssm")
+    ssm_client.put_parameter(Name="/app/env/PLAIN", Value="plain-value", Type="String")
+    ssm_client.put_parameter(Name="/app/env/SECRET", Value="secret-value", Type="SecureString")
+
+    result = ParameterStore(ssm_client, with_model=True).get_ssm_parameters_by_path(
+        "/app/env", with_decryption=False
+    )
+
+    parameters = {parameter.name: parameter.value for parameter in result}
+    assert parameters["/app/env/PLAIN"] == "plain-value"
+    assert parameters["/app/env/SECRET"] != "secret-value"
+
+
+def test_parameter_model_is_slotted():
+    parameter = Parameter(name="/app/env/SECRET", value="value")
+
+    assert not hasattr(parameter, "__dict__")
+    with pytest.raises(AttributeError):
+        parameter.unexpected = "attribute"
+
+
+@mock_aws
+def test_get_ssm_parameters_by_path_adds_each_parameters_own_tags():
+    ssm_client = boto3.client("ssm")
+    for index in range(20):
+        ssm_client.put_parameter(
+            Name=f"/app/env/secrets/SECRET_{index}",
+            Value="value",
+            Type="SecureString",
+            Tags=[{"Key": "index", "Value": str(index)}],
+        )
+
+    result = ParameterStore(ssm_client, with_model=True).get_ssm_parameters_by_path(
+        "/app/env/secrets", add_tags=True
+    )
+
+    assert len(result) == 20
+    for parameter in result:
+        assert parameter.tags == {"index": parameter.name.split("_")[-1]}
+
+
+@patch("dbt_platform_helper.providers.parameter_store.time.sleep")
+def test_get_ssm_parameters_by_path_retries_throttled_tag_lookups(mock_sleep):
+    ssm_client = Mock()
+    ssm_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Parameters": [
+                {
+                    "Name": "/app/env/secrets/SECRET",
+                    "Value": "value",
+                    "ARN": "arn:::parameter/app/env/secrets/SECRET",
+                    "DataType": "text",
+                    "Type": "SecureString",
+                    "Version": 1,
+                }
+            ]
+        }
+    ]
+    throttled = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "ListTagsForResource",
+    )
+    ssm_client.list_tags_for_resource.side_effect = [
+        throttled,
+        throttled,
+        {"TagList": [{"Key": "managed-by", "Value": "DBT Platform"}]},
+    ]
+
+    result = ParameterStore(ssm_client, with_model=True).get_ssm_parameters_by_path(
+        "/app/env/secrets", add_tags=True
+    )
+
+    assert result[0].tags == {"managed-by": "DBT Platform"}
+    assert ssm_client.list_tags_for_resource.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+def test_get_ssm_parameters_by_path_raises_other_tag_lookup_errors():
+    ssm_client = Mock()
+    ssm_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Parameters": [
+                {
+                    "Name": "/app/env/secrets/SECRET",
+                    "Value": "value",
+                    "ARN": "arn:::parameter/app/env/secrets/SECRET",
+                    "DataType": "text",
+                    "Type": "SecureString",
+                    "Version": 1,
+                }
+            ]
+        }
+    ]
+    ssm_client.list_tags_for_resource.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "Denied"}}, "ListTagsForResource"
+    )
+
+    with pytest.raises(ClientError):
+        ParameterStore(ssm_client, with_model=True).get_ssm_parameters_by_path(
+            "/app/env/secrets", add_tags=True
+        )
+
+    ssm_client.list_tags_for_resource.assert_called_once()
+
+
+@patch("dbt_platform_helper.providers.parameter_store.time.sleep")
+def test_put_parameter_retries_when_throttled(mock_sleep):
+    ssm_client = Mock()
+    ssm_client.put_parameter.side_effect = [
+        ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            "PutParameter",
+        ),
+        {"Version": 1},
+    ]
+
+    response = ParameterStore(ssm_client).put_parameter(
+        {"Name": "/app/env/secrets/SECRET", "Value": "value"}
+    )
+
+    assert response == {"Version": 1}
+    assert ssm_client.put_parameter.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+@patch("dbt_platform_helper.providers.parameter_store.time.sleep")
+def test_get_ssm_parameters_by_names_retries_when_throttled(mock_sleep):
+    ssm_client = Mock()
+    ssm_client.get_parameters.side_effect = [
+        ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            "GetParameters",
+        ),
+        {"Parameters": [{"Name": "/app/env/secrets/SECRET", "Value": "value"}]},
+    ]
+
+    result = ParameterStore(ssm_client).get_ssm_parameters_by_names(["/app/env/secrets/SECRET"])
+
+    assert result.found == {
+        "/app/env/secrets/SECRET": {"Name": "/app/env/secrets/SECRET", "Value": "value"}
+    }
+    assert ssm_client.get_parameters.call_count == 2
+    mock_sleep.assert_called_once()
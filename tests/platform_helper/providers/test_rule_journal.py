@@ -0,0 +1,42 @@
+from dbt_platform_helper.providers.rule_journal import RuleJournalProvider
+
+
+def test_journal_records_changes_in_order(alb_rule_journal_dir):
+    journal = RuleJournalProvider("test-application", "development")
+    journal.start("listener-arn")
+    entry_id = journal.pending("delete", rule={"RuleArn": "rule-arn"})
+    journal.done(entry_id, "delete")
+    journal.rolled_back("delete", ["rule-arn"])
+
+    assert journal.path == alb_rule_journal_dir / "test-application-development.jsonl"
+    assert oct(journal.path.stat().st_mode & 0o777) == "0o600"
+    assert RuleJournalProvider("test-application", "development").entries() == [
+        {"event": "started", "listener_arn": "listener-arn"},
+        {"event": "pending", "id": 0, "operation": "delete", "rule": {"RuleArn": "rule-arn"}},
+        {"event": "done", "id": 0, "operation": "delete"},
+        {"event": "rolled_back", "operation": "delete", "rule_arns": ["rule-arn"]},
+    ]
+
+
+def test_journal_ignores_a_partly_written_entry_and_continues_numbering(alb_rule_journal_dir):
+    journal = RuleJournalProvider("test-application", "development")
+    journal.start("listener-arn")
+    journal.pending("create", priority=10000, tags={})
+    with open(journal.path, "a") as journal_file:
+        journal_file.write('{"event": "pen')
+
+    resumed_journal = RuleJournalProvider("test-application", "development")
+
+    assert len(resumed_journal.entries()) == 2
+    assert resumed_journal.pending("create", priority=10100, tags={}) == 1
+    assert [entry.get("id") for entry in resumed_journal.entries()] == [None, 0, 1]
+
+
+def test_journal_remove(alb_rule_journal_dir):
+    journal = RuleJournalProvider("test-application", "development")
+    journal.start("listener-arn")
+
+    journal.remove()
+    journal.remove()
+
+    assert not journal.exists()
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from dbt_platform_helper.commands.daemon import daemon
+
+
+class TestDaemonCommands:
+    @patch("dbt_platform_helper.commands.daemon.start_daemon", return_value={"pid": 123})
+    @patch("dbt_platform_helper.commands.daemon.get_daemon_status", return_value=None)
+    def test_start(self, get_daemon_status, start_daemon):
+        result = CliRunner().invoke(daemon, ["start", "--idle-timeout", "60"])
+
+        assert result.exit_code == 0
+        assert "Started the daemon with pid 123" in result.output
+        assert start_daemon.call_args.args[1] == 60
+
+    @patch("dbt_platform_helper.commands.daemon.start_daemon")
+    @patch("dbt_platform_helper.commands.daemon.get_daemon_status", return_value={"pid": 123})
+    def test_start_when_already_running(self, get_daemon_status, start_daemon):
+        result = CliRunner().invoke(daemon, ["start"])
+
+        assert result.exit_code == 0
+        assert "The daemon is already running with pid 123" in result.output
+        start_daemon.assert_not_called()
+
+    @patch("dbt_platform_helper.commands.daemon.start_daemon", return_value=None)
+    @patch("dbt_platform_helper.commands.daemon.get_daemon_status", return_value=None)
+    def test_start_failure(self, get_daemon_status, start_daemon):
+        result = CliRunner().invoke(daemon, ["start"])
+
+        assert result.exit_code == 1
+        assert "The daemon did not start listening on" in result.output
+
+    @patch("dbt_platform_helper.commands.daemon.serve")
+    @patch("dbt_platform_helper.commands.daemon.get_daemon_status", return_value=None)
+    def test_start_in_foreground(self, get_daemon_status, serve):
+        result = CliRunner().invoke(daemon, ["start", "--foreground"])
+
+        assert result.exit_code == 0
+        serve.assert_called_once()
+
+    @patch("dbt_platform_helper.commands.daemon.stop_daemon", return_value=True)
+    def test_stop(self, stop_daemon):
+        result = CliRunner().invoke(daemon, ["stop"])
+
+        assert result.exit_code == 0
+        assert "Stopped the daemon" in result.output
+
+    @patch("dbt_platform_helper.commands.daemon.stop_daemon", return_value=False)
+    def test_stop_when_not_running(self, stop_daemon):
+        result = CliRunner().invoke(daemon, ["stop"])
+
+        assert result.exit_code == 0
+        assert "The daemon is not running" in result.output
+
+    @patch(
+        "dbt_platform_helper.commands.daemon.get_daemon_status",
+        return_value={
+            "pid": 123,
+            "uptime": 10,
+            "commands_run": 4,
+            "aws_profiles": ["dev"],
+            "applications": [],
+        },
+    )
+    def test_status(self, get_daemon_status):
+        result = CliRunner().invoke(daemon, ["status"])
+
+        assert result.exit_code == 0
+        assert "The daemon is running with pid 123" in result.output
+        assert "Commands run: 4" in result.output
+        assert "AWS profiles: dev" in result.output
+        assert "Applications: none" in result.output
@@ -256,3 +256,25 @@ class TestInternal:
 
         assert result.exit_code == 0
         mock_instance.undo_migrate_schedule.assert_called_once()
+
+    @patch("dbt_platform_helper.commands.internal.StartupProfiler")
+    def test_profile_startup(self, mock_startup_profiler):
+        result = CliRunner().invoke(
+            internal,
+            ["profile-startup", "--top", "5", "secrets", "copy", "--app", "my-app"],
+        )
+
+        assert result.exit_code == 0
+        mock_startup_profiler.return_value.profile.assert_called_once_with(
+            ["secrets", "copy", "--app", "my-app"], top=5
+        )
+
+    @patch("dbt_platform_helper.commands.internal.StartupProfiler")
+    @patch("dbt_platform_helper.commands.internal.click.secho")
+    def test_profile_startup_failure(self, mock_click, mock_startup_profiler):
+        mock_startup_profiler.return_value.profile.side_effect = PlatformException("Boom")
+
+        result = CliRunner().invoke(internal, ["profile-startup", "--version"])
+
+        assert result.exit_code == 1
+        mock_click.assert_called_with("Error: Boom", err=True, fg="red")
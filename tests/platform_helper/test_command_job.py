@@ -23,7 +23,9 @@ def test_job_run(mock_application, mock_step_functions, mock_job_manager_object)
 
     assert result.exit_code == 0
 
-    mock_application.assert_called_once_with(app="test-application", env="development")
+    mock_application.assert_called_once_with(
+        app="test-application", env="development", use_topology_cache=True, refresh=False
+    )
     mock_step_functions.assert_called_once()
     mock_job_manager_instance.start_execution.assert_called_once_with(
         "test-application", "development", "test-job", False
@@ -82,7 +84,9 @@ def test_job_run_with_optional_follow(
 
     assert result.exit_code == 0
 
-    mock_application.assert_called_once_with(app="test-application", env="development")
+    mock_application.assert_called_once_with(
+        app="test-application", env="development", use_topology_cache=True, refresh=False
+    )
     mock_step_functions.assert_called_once()
     mock_job_manager_instance.start_execution.assert_called_once_with(
         "test-application", "development", "test-job", True
@@ -108,10 +112,27 @@ def test_job_list(
 
     assert result.exit_code == 0
 
-    mock_application.assert_called_once_with(app="test-application", env="development")
+    mock_application.assert_called_once_with(
+        app="test-application", env="development", use_topology_cache=True, refresh=False
+    )
     mock_job_manager_instance.list_jobs.assert_called_once_with("test-application", "development")
 
 
+@patch("dbt_platform_helper.commands.job.JobManager")
+@patch("dbt_platform_helper.commands.job.load_application")
+@patch("dbt_platform_helper.commands.job.ServiceRepository")
+def test_job_list_with_refresh(mock_service_repository, mock_application, mock_job_manager_object):
+    result = CliRunner().invoke(
+        ls,
+        ["--app", "test-application", "--env", "development", "--refresh"],
+    )
+
+    assert result.exit_code == 0
+    mock_application.assert_called_once_with(
+        app="test-application", env="development", use_topology_cache=True, refresh=True
+    )
+
+
 @patch("dbt_platform_helper.commands.job.load_application")
 @patch("dbt_platform_helper.commands.job.ClickIOProvider")
 def test_job_list_raises_given_wrong_environment(mock_io, mock_application):
@@ -0,0 +1,145 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from tests.platform_helper.conftest import BASE_DIR
+
+# Modules which are slow to import and only needed once a command runs
+HEAVY_MODULES = ["boto3", "botocore", "yaml", "jsonschema", "cryptography"]
+IMPORT_ALL_MODULES_SCRIPT = """
+import builtins
+import importlib.abc
+import importlib.util
+import json
+import pkgutil
+import sys
+from importlib import import_module
+
+opened_files = []
+original_open = builtins.open
+
+
+def recording_open(file, *args, **kwargs):
+    opened_files.append(str(file))
+    return original_open(file, *args, **kwargs)
+
+
+builtins.open = recording_open
+
+constructed_providers = []
+
+# The classes to record, by module. Each is patched as soon as its module has been
+# executed, before any other module can import and construct it.
+RECORDED_METHODS = {
+    "dbt_platform_helper.domain.plans": {"PlanLoader": ["__init__", "load"]},
+    "dbt_platform_helper.providers.config": {"ConfigProvider": ["__init__"]},
+    "dbt_platform_helper.providers.config_validator": {"ConfigValidator": ["__init__"]},
+    "dbt_platform_helper.providers.ecr": {"ECRProvider": ["__init__"]},
+    "dbt_platform_helper.providers.environment_variable": {
+        "EnvironmentVariableProvider": ["__init__"]
+    },
+    "dbt_platform_helper.providers.io": {"ClickIOProvider": ["__init__"]},
+}
+
+
+def record_calls(cls, method_name):
+    original_method = getattr(cls, method_name)
+
+    def recording_method(self, *args, **kwargs):
+        constructed_providers.append(f"{type(self).__name__}.{method_name}")
+        return original_method(self, *args, **kwargs)
+
+    setattr(cls, method_name, recording_method)
+
+
+class RecordingFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name not in RECORDED_METHODS:
+            return None
+        sys.meta_path.remove(self)
+        try:
+            spec = importlib.util.find_spec(name)
+        finally:
+            sys.meta_path.insert(0, self)
+        original_exec_module = spec.loader.exec_module
+
+        def exec_module(module):
+            original_exec_module(module)
+            for class_name, method_names in RECORDED_METHODS[name].items():
+                for method_name in method_names:
+                    record_calls(getattr(module, class_name), method_name)
+
+        spec.loader.exec_module = exec_module
+        return spec
+
+
+sys.meta_path.insert(0, RecordingFinder())
+
+import dbt_platform_helper
+
+for module in pkgutil.walk_packages(dbt_platform_helper.__path__, "dbt_platform_helper."):
+    import_module(module.name)
+
+print(
+    json.dumps(
+        {
+            "opened_files": opened_files,
+            "constructed_providers": constructed_providers,
+        }
+    )
+)
+"""
+
+IMPORT_ENTRY_POINT_SCRIPT = """
+import json
+import sys
+
+import platform_helper
+
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _run_script(script: str):
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=BASE_DIR,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def import_report():
+    return _run_script(IMPORT_ALL_MODULES_SCRIPT)
+
+
+def test_importing_modules_does_not_read_files(import_report):
+    opened_files = import_report["opened_files"]
+
+    assert [file for file in opened_files if file.endswith((".yml", ".yaml"))] == []
+
+
+def test_importing_modules_does_not_construct_providers(import_report):
+    assert import_report["constructed_providers"] == []
+
+
+def test_importing_the_entry_point_does_not_import_heavy_modules():
+    imported_modules = _run_script(IMPORT_ENTRY_POINT_SCRIPT)
+
+    assert [
+        module
+        for module in imported_modules
+        if module.split(".")[0] in HEAVY_MODULES
+        or module.startswith(
+            (
+                "dbt_platform_helper.commands",
+                "dbt_platform_helper.domain",
+                "dbt_platform_helper.providers",
+            )
+        )
+    ] == []
@@ -1,7 +1,12 @@
 import re
+import subprocess
+import sys
 
+import click
 from click.testing import CliRunner
 
+from tests.platform_helper.conftest import BASE_DIR
+
 
 class TestCopilotHelperCli:
     def test_check_version(self):
@@ -18,12 +23,13 @@ class TestCopilotHelperCli:
     def test_sub_commands(self):
         from platform_helper import platform_helper
 
-        assert list(platform_helper.commands.keys()) == [
+        assert list(platform_helper.lazy_subcommands.keys()) == [
             "application",
             "codebase",
             "conduit",
             "config",
             "copilot",
+            "daemon",
             "environment",
             "generate",
             "internal",
@@ -34,3 +40,30 @@ class TestCopilotHelperCli:
             "service",
             "job",
         ]
+
+    def test_sub_commands_are_resolvable(self):
+        from platform_helper import platform_helper
+
+        ctx = click.Context(platform_helper)
+
+        for name in platform_helper.list_commands(ctx):
+            assert platform_helper.get_command(ctx, name).name == name
+
+    def test_version_does_not_import_sub_commands(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "from click.testing import CliRunner\n"
+                "from platform_helper import platform_helper\n"
+                "CliRunner().invoke(platform_helper, ['--version'])\n"
+                "print(sorted(m for m in sys.modules if m.startswith(('dbt_platform_helper.commands', 'boto3'))))",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=BASE_DIR,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
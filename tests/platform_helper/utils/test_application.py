@@ -1,4 +1,6 @@
 import json
+import threading
+import time
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import MagicMock
@@ -12,8 +14,10 @@ from dbt_platform_helper.constants import PLATFORM_CONFIG_FILE
 from dbt_platform_helper.utils.application import Application
 from dbt_platform_helper.utils.application import ApplicationNotFoundException
 from dbt_platform_helper.utils.application import Environment
+from dbt_platform_helper.utils.application import _load_services
 from dbt_platform_helper.utils.application import get_application_name
 from dbt_platform_helper.utils.application import load_application
+from dbt_platform_helper.utils.aws import get_ssm_secrets
 
 
 def test_getting_an_application_name_from_platform_config(fakefs):
@@ -442,3 +446,211 @@ class ApplicationTest(TestCase):
         assert app.services.keys() == {"web", "celery-worker"}
         assert app.services["web"].kind == "Load Balanced Web Service"
         assert app.services["celery-worker"].kind == "Backend Service"
+
+
+@patch("dbt_platform_helper.utils.application.get_ssm_secrets")
+def test_load_application_reuses_cached_applications_when_the_cache_is_enabled(get_ssm_secrets):
+    mock_session = MagicMock(name="session-mock", profile_name="foo")
+    mock_session.client.return_value.get_caller_identity.return_value = {"Account": "111111111"}
+    mock_session.client.return_value.get_parameters_by_path.return_value = {"Parameters": []}
+    get_ssm_secrets.return_value = [
+        (
+            "/platform/applications/test/environments/one",
+            json.dumps({"allEnvironments": [{"name": "one", "accountID": "111111111"}]}),
+        )
+    ]
+
+    with patch("dbt_platform_helper.utils.application.APPLICATION_CACHE", {}):
+        first = load_application("test", default_session=mock_session)
+        second = load_application("test", default_session=mock_session)
+
+    assert first is second
+    get_ssm_secrets.assert_called_once()
+    mock_session.client.return_value.get_caller_identity.assert_called_once()
+
+
+@patch("dbt_platform_helper.utils.application.get_ssm_secrets")
+def test_load_application_refresh_replaces_the_cached_application(get_ssm_secrets):
+    mock_session = MagicMock(name="session-mock", profile_name="foo")
+    mock_session.client.return_value.get_caller_identity.return_value = {"Account": "111111111"}
+    mock_session.client.return_value.get_parameters_by_path.return_value = {"Parameters": []}
+    get_ssm_secrets.return_value = [
+        (
+            "/platform/applications/test/environments/one",
+            json.dumps({"allEnvironments": [{"name": "one", "accountID": "111111111"}]}),
+        )
+    ]
+
+    with patch("dbt_platform_helper.utils.application.APPLICATION_CACHE", {}):
+        first = load_application("test", default_session=mock_session)
+        refreshed = load_application("test", default_session=mock_session, refresh=True)
+        third = load_application("test", default_session=mock_session)
+
+    assert refreshed is not first
+    assert third is refreshed
+    assert get_ssm_secrets.call_count == 2
+
+
+@patch("dbt_platform_helper.utils.application.get_ssm_secrets")
+def test_load_application_does_not_cache_applications_by_default(get_ssm_secrets):
+    mock_session = MagicMock(name="session-mock", profile_name="foo")
+    mock_session.client.return_value.get_caller_identity.return_value = {"Account": "111111111"}
+    mock_session.client.return_value.get_parameters_by_path.return_value = {"Parameters": []}
+    get_ssm_secrets.return_value = [
+        (
+            "/platform/applications/test/environments/one",
+            json.dumps({"allEnvironments": [{"name": "one", "accountID": "111111111"}]}),
+        )
+    ]
+
+    load_application("test", default_session=mock_session)
+    load_application("test", default_session=mock_session)
+
+    assert get_ssm_secrets.call_count == 2
+
+
+@patch("dbt_platform_helper.utils.application.prewarm_aws_sessions")
+@patch(
+    "dbt_platform_helper.utils.application.get_profile_name_from_account_id",
+    side_effect=lambda account_id: f"profile-{account_id}",
+)
+@patch("dbt_platform_helper.utils.application.get_ssm_secrets")
+def test_load_application_prewarms_sessions_for_other_accounts(
+    get_ssm_secrets, get_profile_name_from_account_id, prewarm_aws_sessions
+):
+    mock_session = MagicMock(name="session-mock", profile_name="foo")
+    mock_session.client.return_value.get_caller_identity.return_value = {"Account": "111111111"}
+    mock_session.client.return_value.get_parameters_by_path.return_value = {"Parameters": []}
+    get_ssm_secrets.return_value = [
+        (
+            "/platform/applications/test/environments/one",
+            json.dumps(
+                {
+                    "allEnvironments": [
+                        {"name": "one", "accountID": "111111111"},
+                        {"name": "two", "accountID": "222222222"},
+                        {"name": "three", "accountID": "333333333"},
+                    ]
+                }
+            ),
+        )
+    ]
+
+    load_application("test", default_session=mock_session)
+    prewarm_aws_sessions.assert_not_called()
+
+    load_application("test", default_session=mock_session, prewarm_sessions=True)
+    prewarm_aws_sessions.assert_called_once_with(["profile-222222222", "profile-333333333"])
+
+
+def _put_platform_environments(ssm_client, environments):
+    ssm_client.put_parameter(
+        Name="/platform/applications/test/environments/one",
+        Value=json.dumps({"allEnvironments": environments}),
+        Type="String",
+        Overwrite=True,
+    )
+
+
+@mock_aws
+def test_load_application_uses_the_topology_cache_until_a_parameter_changes(
+    application_topology_cache_dir,
+):
+    session = boto3.session.Session(region_name="eu-west-2")
+    ssm_client = session.client("ssm")
+    _put_platform_environments(ssm_client, [{"name": "one", "accountID": "123456789012"}])
+
+    with patch(
+        "dbt_platform_helper.utils.application.get_ssm_secrets", wraps=get_ssm_secrets
+    ) as spy_get_ssm_secrets:
+        first = load_application("test", default_session=session, use_topology_cache=True)
+        second = load_application("test", default_session=session, use_topology_cache=True)
+
+        assert spy_get_ssm_secrets.call_count == 1
+        assert second.environments.keys() == first.environments.keys() == {"one"}
+        assert second.environments["one"].session is session
+
+        _put_platform_environments(
+            ssm_client,
+            [
+                {"name": "one", "accountID": "123456789012"},
+                {"name": "two", "accountID": "123456789012"},
+            ],
+        )
+
+        with patch(
+            "dbt_platform_helper.utils.application.APPLICATION_TOPOLOGY_CACHE_TTL_SECONDS", 0
+        ):
+            third = load_application("test", default_session=session, use_topology_cache=True)
+
+        assert spy_get_ssm_secrets.call_count == 2
+        assert third.environments.keys() == {"one", "two"}
+
+
+@mock_aws
+def test_load_application_revalidates_an_expired_topology_cache_with_parameter_versions(
+    application_topology_cache_dir,
+):
+    session = boto3.session.Session(region_name="eu-west-2")
+    _put_platform_environments(session.client("ssm"), [{"name": "one", "accountID": "123"}])
+
+    with patch(
+        "dbt_platform_helper.utils.application.get_ssm_secrets", wraps=get_ssm_secrets
+    ) as spy_get_ssm_secrets:
+        load_application("test", default_session=session, use_topology_cache=True)
+        with patch(
+            "dbt_platform_helper.utils.application.APPLICATION_TOPOLOGY_CACHE_TTL_SECONDS", 0
+        ):
+            application = load_application("test", default_session=session, use_topology_cache=True)
+
+    assert spy_get_ssm_secrets.call_count == 1
+    assert application.environments.keys() == {"one"}
+
+
+@mock_aws
+def test_load_application_refresh_bypasses_the_topology_cache(application_topology_cache_dir):
+    session = boto3.session.Session(region_name="eu-west-2")
+    _put_platform_environments(session.client("ssm"), [{"name": "one", "accountID": "123"}])
+
+    with patch(
+        "dbt_platform_helper.utils.application.get_ssm_secrets", wraps=get_ssm_secrets
+    ) as spy_get_ssm_secrets:
+        load_application("test", default_session=session, use_topology_cache=True)
+        load_application("test", default_session=session, use_topology_cache=True, refresh=True)
+        load_application("test", default_session=session)
+
+    assert spy_get_ssm_secrets.call_count == 3
+    assert len(list(application_topology_cache_dir.iterdir())) == 1
+
+
+def test_load_services_scans_environments_concurrently_and_merges_in_environment_order():
+    environment_names = ["one", "two", "three"]
+    all_scans_started = threading.Barrier(len(environment_names), timeout=5)
+    ssm_client = MagicMock(name="ssm-client-mock")
+
+    def get_parameters_by_path(Path, NextToken=None, **kwargs):
+        env_name = Path.split("/")[5]
+        if not NextToken:
+            all_scans_started.wait()
+            # Make the first environment's scan finish last
+            time.sleep(0.1 if env_name == "one" else 0)
+            return {
+                "Parameters": [{"Value": json.dumps({"name": "web", "type": f"{env_name} kind"})}],
+                "NextToken": f"{env_name}-token",
+            }
+        return {
+            "Parameters": [{"Value": json.dumps({"name": env_name, "type": "Backend Service"})}]
+        }
+
+    ssm_client.get_parameters_by_path.side_effect = get_parameters_by_path
+    application = Application(
+        "test", environments={name: Environment(name, "123", {}) for name in environment_names}
+    )
+
+    services = _load_services(ssm_client, application)
+
+    assert list(services.keys()) == ["web", "one", "two", "three"]
+    assert services["web"].kind == "one kind"
+    assert not all_scans_started.broken
+    for call in ssm_client.get_parameters_by_path.call_args_list:
+        assert call.kwargs["MaxResults"] == 10
@@ -1,3 +1,7 @@
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock
 from unittest.mock import Mock
@@ -12,8 +16,12 @@ from moto import mock_aws
 from dbt_platform_helper.constants import REFRESH_TOKEN_MESSAGE
 from dbt_platform_helper.providers.aws.exceptions import LogGroupNotFoundException
 from dbt_platform_helper.providers.validation import ValidationException
+from dbt_platform_helper.utils.aws import AWS_SESSION_CACHE
 from dbt_platform_helper.utils.aws import NoProfileForAccountIdException
+from dbt_platform_helper.utils.aws import _credentials_fingerprint
+from dbt_platform_helper.utils.aws import _new_session
 from dbt_platform_helper.utils.aws import get_account_details
+from dbt_platform_helper.utils.aws import get_aws_client
 from dbt_platform_helper.utils.aws import get_aws_session_or_abort
 from dbt_platform_helper.utils.aws import get_build_url_from_pipeline_execution_id
 from dbt_platform_helper.utils.aws import get_connection_string
@@ -23,9 +31,15 @@ from dbt_platform_helper.utils.aws import (
     get_postgres_connection_data_updated_with_master_secret,
 )
 from dbt_platform_helper.utils.aws import get_profile_name_from_account_id
+from dbt_platform_helper.utils.aws import get_ssm_secret_names
 from dbt_platform_helper.utils.aws import get_ssm_secrets
+from dbt_platform_helper.utils.aws import iter_ssm_parameters_by_path
+from dbt_platform_helper.utils.aws import prewarm_aws_sessions
+from dbt_platform_helper.utils.aws import read_cache_file
 from dbt_platform_helper.utils.aws import set_ssm_param
+from dbt_platform_helper.utils.aws import simulate_principal_policy
 from dbt_platform_helper.utils.aws import wait_for_log_group_to_exist
+from dbt_platform_helper.utils.aws import write_cache_file
 from tests.platform_helper.conftest import mock_aws_client
 from tests.platform_helper.conftest import mock_get_caller_identity
 
@@ -63,6 +77,258 @@ def test_get_aws_session_caches_sessions_per_profile(mock_session):
     assert session1 is not session4
 
 
+def test_get_aws_client_reuses_clients_per_profile_region_and_service(aws_credentials):
+    session = boto3.session.Session(profile_name="foo", region_name="eu-west-2")
+    same_profile_session = boto3.session.Session(profile_name="foo", region_name="eu-west-2")
+    other_region_session = boto3.session.Session(profile_name="foo", region_name="eu-west-1")
+
+    ssm_client = get_aws_client(session, "ssm")
+
+    assert get_aws_client(session, "ssm") is ssm_client
+    assert get_aws_client(same_profile_session, "ssm") is ssm_client
+    assert get_aws_client(session, "sts") is not ssm_client
+    assert get_aws_client(other_region_session, "ssm") is not ssm_client
+    assert get_aws_client(other_region_session, "ssm").meta.region_name == "eu-west-1"
+
+
+@patch("dbt_platform_helper.utils.aws.boto3._get_default_session")
+def test_get_aws_client_uses_default_session_without_a_session(mock_get_default_session):
+    default_session = mock_get_default_session.return_value
+
+    client = get_aws_client(None, "elasticache")
+
+    assert client is default_session.client.return_value
+    default_session.client.assert_called_once_with("elasticache")
+
+
+@patch("dbt_platform_helper.utils.aws.get_account_details", return_value=("123", "user"))
+def test_get_aws_session_or_abort_shares_data_loader_between_sessions(
+    mock_get_account_details, aws_credentials, clear_session_cache
+):
+    with mock_aws():
+        first_session = get_aws_session_or_abort("foo")
+        AWS_SESSION_CACHE.clear()
+        second_session = get_aws_session_or_abort("foo")
+
+    assert first_session is not second_session
+    first_loader = first_session._session.get_component("data_loader")
+
+    assert first_loader is second_session._session.get_component("data_loader")
+    assert len(first_loader.search_paths) == len(set(first_loader.search_paths))
+
+
+def test_write_cache_file_from_concurrent_writers(tmp_path):
+    cache_file = tmp_path / "cache" / "cache.json"
+    contents = [{"writer": writer, "padding": "x" * 10000} for writer in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda data: write_cache_file(cache_file, data), contents))
+
+    assert read_cache_file(cache_file) in contents
+    assert oct(cache_file.stat().st_mode & 0o777) == oct(0o600)
+    assert [path.name for path in cache_file.parent.iterdir()] == ["cache.json"]
+
+
+def test_new_sessions_created_concurrently_share_an_unchanging_data_loader(aws_credentials):
+    first_loader = _new_session("foo")._session.get_component("data_loader")
+    search_paths = list(first_loader.search_paths)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(executor.map(_new_session, ["foo"] * 16))
+
+    for session in sessions:
+        assert session._session.get_component("data_loader") is first_loader
+    assert first_loader.search_paths == search_paths
+
+
+@patch("dbt_platform_helper.utils.aws.get_account_details", return_value=("123", "arn:user"))
+def test_get_aws_session_or_abort_caches_verified_identity_on_disk(
+    mock_get_account_details, aws_credentials, aws_identity_cache_file, clear_session_cache, capsys
+):
+    with mock_aws():
+        get_aws_session_or_abort("foo")
+        AWS_SESSION_CACHE.clear()
+        get_aws_session_or_abort("foo")
+
+    mock_get_account_details.assert_called_once()
+    cached_identity = json.loads(aws_identity_cache_file.read_text())["foo"]
+    assert cached_identity["account_id"] == "123"
+    assert cached_identity["user_id"] == "arn:user"
+    assert "mock" not in aws_identity_cache_file.read_text()
+    assert capsys.readouterr().out.count("Logged in with AWS account id: 123") == 2
+
+
+@pytest.mark.parametrize(
+    "cached_identity_changes",
+    [{"expires_at": 0}, {"fingerprint": "credentials-which-have-since-changed"}],
+)
+@patch("dbt_platform_helper.utils.aws.get_account_details", return_value=("123", "arn:user"))
+def test_get_aws_session_or_abort_reverifies_expired_or_changed_credentials(
+    mock_get_account_details,
+    aws_credentials,
+    aws_identity_cache_file,
+    clear_session_cache,
+    cached_identity_changes,
+):
+    with mock_aws():
+        get_aws_session_or_abort("foo")
+        identities = json.loads(aws_identity_cache_file.read_text())
+        identities["foo"].update(cached_identity_changes)
+        aws_identity_cache_file.write_text(json.dumps(identities))
+        AWS_SESSION_CACHE.clear()
+        get_aws_session_or_abort("foo")
+
+    assert mock_get_account_details.call_count == 2
+
+
+@patch("dbt_platform_helper.utils.aws.get_account_details", return_value=("123", "arn:user"))
+def test_get_aws_session_or_abort_does_not_cache_session_tokens_of_unknown_expiry(
+    mock_get_account_details, aws_identity_cache_file, clear_session_cache, monkeypatch
+):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "exported-key")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "exported-secret")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "exported-token")
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+
+    with mock_aws():
+        get_aws_session_or_abort()
+        AWS_SESSION_CACHE.clear()
+        get_aws_session_or_abort()
+
+    assert mock_get_account_details.call_count == 2
+    assert not aws_identity_cache_file.exists()
+
+
+@pytest.fixture
+def sso_profiles(tmp_path, monkeypatch):
+    config_file = tmp_path / "config"
+    config_file.write_text(
+        """
+[profile sso-dev]
+sso_session = platform
+sso_account_id = 111111111
+sso_role_name = Developer
+region = eu-west-2
+
+[profile assumed-dev]
+role_arn = arn:aws:iam::111111111:role/deploy
+source_profile = sso-dev
+
+[sso-session platform]
+sso_start_url = https://example.awsapps.com/start
+sso_region = eu-west-2
+"""
+    )
+    monkeypatch.setenv("AWS_CONFIG_FILE", str(config_file))
+    monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+    sso_cache_dir = tmp_path / "sso-cache"
+    sso_cache_dir.mkdir()
+    monkeypatch.setattr("dbt_platform_helper.utils.aws.AWS_SSO_CACHE_DIR", sso_cache_dir)
+
+    def login(access_token):
+        token_file = sso_cache_dir / f"{hashlib.sha1(b'platform').hexdigest()}.json"
+        token_file.write_text(
+            json.dumps({"accessToken": access_token, "expiresAt": "2099-01-01T00:00:00Z"})
+        )
+
+    return login
+
+
+@pytest.mark.parametrize("profile", ["sso-dev", "assumed-dev"])
+def test_credentials_fingerprint_of_sso_profiles_comes_from_the_sso_token(sso_profiles, profile):
+    sso_profiles("first-token")
+
+    with patch.object(
+        boto3.session.Session, "get_credentials", side_effect=AssertionError("fetched credentials")
+    ):
+        fingerprint, expires_at = _credentials_fingerprint(
+            boto3.session.Session(profile_name=profile)
+        )
+        # Another process has a new session, and so would be given new role credentials
+        same_fingerprint, _ = _credentials_fingerprint(boto3.session.Session(profile_name=profile))
+        sso_profiles("second-token")
+        new_fingerprint, _ = _credentials_fingerprint(boto3.session.Session(profile_name=profile))
+
+    assert fingerprint == same_fingerprint
+    assert fingerprint != new_fingerprint
+    assert expires_at == 4070908800
+
+
+def test_credentials_fingerprint_differs_between_profiles_sharing_an_sso_token(sso_profiles):
+    sso_profiles("token")
+
+    assert (
+        _credentials_fingerprint(boto3.session.Session(profile_name="sso-dev"))[0]
+        != _credentials_fingerprint(boto3.session.Session(profile_name="assumed-dev"))[0]
+    )
+
+
+def test_credentials_fingerprint_of_an_sso_profile_without_a_token(sso_profiles):
+    with patch.object(boto3.session.Session, "get_credentials", return_value=None):
+        assert _credentials_fingerprint(boto3.session.Session(profile_name="sso-dev")) == (
+            None,
+            None,
+        )
+
+
+@patch("dbt_platform_helper.utils.aws.get_account_details")
+def test_get_aws_session_or_abort_forgets_cached_identity_on_auth_errors(
+    mock_get_account_details, aws_credentials, aws_identity_cache_file, clear_session_cache
+):
+    aws_identity_cache_file.write_text(
+        json.dumps({"foo": {"fingerprint": "stale", "expires_at": 2**40}, "bar": {}})
+    )
+    mock_get_account_details.side_effect = ClientError(
+        {"Error": {"Code": "ExpiredToken", "Message": "expired"}}, "GetCallerIdentity"
+    )
+
+    with mock_aws(), pytest.raises(SystemExit):
+        get_aws_session_or_abort("foo")
+
+    assert json.loads(aws_identity_cache_file.read_text()) == {"bar": {}}
+
+
+@patch("dbt_platform_helper.utils.aws.get_account_details", return_value=("123", "arn:user"))
+def test_prewarm_aws_sessions_defers_output_until_the_session_is_used(
+    mock_get_account_details, aws_credentials, clear_session_cache, capsys
+):
+    with mock_aws():
+        prewarm_aws_sessions(["foo", "foo", "not-configured"])
+
+        assert capsys.readouterr().out == ""
+        mock_get_account_details.assert_called_once()
+
+        get_aws_session_or_abort("foo")
+
+    mock_get_account_details.assert_called_once()
+    output = capsys.readouterr().out
+    assert 'Checking AWS connection for profile "foo"...' in output
+    assert "Logged in with AWS account id: 123" in output
+
+    with pytest.raises(SystemExit):
+        get_aws_session_or_abort("not-configured")
+
+    assert 'AWS profile "not-configured" is not configured.' in capsys.readouterr().out
+
+
+@patch("dbt_platform_helper.utils.aws._verify_aws_session")
+def test_prewarm_aws_sessions_verifies_profiles_concurrently(
+    mock_verify_aws_session, clear_session_cache
+):
+    all_profiles_started = threading.Barrier(3, timeout=5)
+
+    def verify(profile):
+        all_profiles_started.wait()
+        return f"{profile}-session", {}
+
+    mock_verify_aws_session.side_effect = verify
+
+    prewarm_aws_sessions(["one", "two", "three"])
+
+    assert mock_verify_aws_session.call_count == 3
+    assert not all_profiles_started.broken
+
+
 @patch("dbt_platform_helper.utils.aws.get_aws_session_or_abort")
 def test_get_ssm_secrets(mock_get_aws_session_or_abort):
     client = mock_aws_client(mock_get_aws_session_or_abort)
@@ -100,6 +366,69 @@ def test_get_ssm_secrets_access_denied(mock_get_aws_session_or_abort):
     assert result == []
 
 
+@mock_aws
+def test_get_ssm_secret_names_does_not_decrypt_values():
+    ssm_client = boto3.client("ssm")
+    for name in ["B_SECRET", "A_SECRET"]:
+        ssm_client.put_parameter(
+            Name=f"/copilot/test-application/development/secrets/{name}",
+            Value="secret",
+            Type="SecureString",
+        )
+
+    with patch("dbt_platform_helper.utils.aws.get_aws_session_or_abort", return_value=boto3), patch(
+        "dbt_platform_helper.utils.aws.iter_ssm_parameters_by_path",
+        wraps=iter_ssm_parameters_by_path,
+    ) as spy_iter_ssm_parameters_by_path:
+        names = get_ssm_secret_names("test-application", "development")
+
+    assert names == [
+        "/copilot/test-application/development/secrets/A_SECRET",
+        "/copilot/test-application/development/secrets/B_SECRET",
+    ]
+    assert spy_iter_ssm_parameters_by_path.call_args.kwargs.get("with_decryption") is not True
+
+
+def test_iter_ssm_parameters_by_path_fetches_pages_lazily_at_the_maximum_page_size():
+    ssm_client = Mock()
+    ssm_client.get_parameters_by_path.side_effect = [
+        {"Parameters": [{"Name": "/path/one"}], "NextToken": "page-2"},
+        {"Parameters": [{"Name": "/path/two"}]},
+    ]
+
+    parameters = iter_ssm_parameters_by_path(ssm_client, "/path", with_decryption=True)
+
+    assert next(parameters) == {"Name": "/path/one"}
+    ssm_client.get_parameters_by_path.assert_called_once_with(
+        Path="/path", Recursive=False, WithDecryption=True, MaxResults=10
+    )
+    assert list(parameters) == [{"Name": "/path/two"}]
+    ssm_client.get_parameters_by_path.assert_called_with(
+        Path="/path", Recursive=False, WithDecryption=True, MaxResults=10, NextToken="page-2"
+    )
+
+
+@mock_aws
+def test_iter_ssm_parameters_by_path_reads_sub_paths_in_the_given_order():
+    ssm_client = boto3.client("ssm")
+    for env_name in ["dev", "prod", "staging"]:
+        for index in range(12):
+            ssm_client.put_parameter(
+                Name=f"/app/environments/{env_name}/services/svc-{index:02}",
+                Value=env_name,
+                Type="String",
+            )
+
+    parameters = list(
+        iter_ssm_parameters_by_path(
+            ssm_client, "/app/environments", sub_paths=["staging/services", "dev/services"]
+        )
+    )
+
+    assert [parameter["Value"] for parameter in parameters] == ["staging"] * 12 + ["dev"] * 12
+    assert list(iter_ssm_parameters_by_path(ssm_client, "/app/environments", sub_paths=[])) == []
+
+
 @pytest.mark.parametrize(
     "aws_profile, side_effect, expected_error_message",
     [
@@ -456,6 +785,11 @@ def test_get_connection_string():
         Value=master_secret_arn,
         Type="String",
     )
+    session.client("ssm").put_parameter(
+        Name="/copilot/my_app/my_env/secrets/MY_POSTGRES_READ_ONLY_USER",
+        Value='{"username": "read-only-user"}',
+        Type="SecureString",
+    )
     mock_connection_data = Mock(
         return_value={
             "username": "master_user",
@@ -471,7 +805,10 @@ def test_get_connection_string():
     )
 
     mock_connection_data.assert_called_once_with(
-        session, f"/copilot/my_app/my_env/secrets/MY_POSTGRES_READ_ONLY_USER", master_secret_arn
+        session,
+        f"/copilot/my_app/my_env/secrets/MY_POSTGRES_READ_ONLY_USER",
+        master_secret_arn,
+        parameter_value='{"username": "read-only-user"}',
     )
     assert (
         connection_string
@@ -479,6 +816,59 @@ def test_get_connection_string():
     )
 
 
+def _simulation_session(decision):
+    session = MagicMock()
+    session.client("iam").simulate_principal_policy.return_value = {
+        "EvaluationResults": [
+            {
+                "EvalActionName": "ssm:PutParameter",
+                "EvalResourceName": "*",
+                "EvalDecision": decision,
+                "MatchedStatements": [],
+            }
+        ]
+    }
+    return session
+
+
+def test_simulate_principal_policy_caches_allowed_results(aws_policy_simulation_cache_file):
+    session = _simulation_session("allowed")
+
+    for _ in range(2):
+        results = simulate_principal_policy(
+            session, "arn:aws:iam::123:role/r", ["ssm:PutParameter"]
+        )
+
+    assert results == [{"EvalActionName": "ssm:PutParameter", "EvalDecision": "allowed"}]
+    session.client("iam").simulate_principal_policy.assert_called_once()
+    assert aws_policy_simulation_cache_file.exists()
+
+    simulate_principal_policy(session, "arn:aws:iam::456:role/r", ["ssm:PutParameter"])
+    assert session.client("iam").simulate_principal_policy.call_count == 2
+
+
+def test_simulate_principal_policy_does_not_cache_denials(aws_policy_simulation_cache_file):
+    session = _simulation_session("implicitDeny")
+
+    for _ in range(2):
+        simulate_principal_policy(session, "arn:aws:iam::123:role/r", ["ssm:PutParameter"])
+
+    assert session.client("iam").simulate_principal_policy.call_count == 2
+    assert not aws_policy_simulation_cache_file.exists()
+
+
+@patch("dbt_platform_helper.utils.aws.time.time")
+def test_simulate_principal_policy_resimulates_after_ttl(mock_time):
+    session = _simulation_session("allowed")
+    mock_time.return_value = 1000
+
+    simulate_principal_policy(session, "arn:aws:iam::123:role/r", ["ssm:PutParameter"])
+    mock_time.return_value = 1000 + 5 * 60 + 1
+    simulate_principal_policy(session, "arn:aws:iam::123:role/r", ["ssm:PutParameter"])
+
+    assert session.client("iam").simulate_principal_policy.call_count == 2
+
+
 class ObjectWithId:
     def __init__(self, id, tags=None):
         self.id = id
@@ -3,6 +3,7 @@ from click.testing import CliRunner
 
 from dbt_platform_helper.utils.click import ClickDocOptCommand
 from dbt_platform_helper.utils.click import ClickDocOptGroup
+from dbt_platform_helper.utils.click import LazyClickDocOptGroup
 
 
 def test_click_docopt_command_help():
@@ -95,3 +96,51 @@ def test_click_docopt_command_group_usage_command_many():
     result = CliRunner().invoke(test_collection, ["--help"])
 
     assert "test-collection <command>" in result.output
+
+
+def test_lazy_click_docopt_group_only_loads_invoked_command():
+    @click.group(
+        cls=LazyClickDocOptGroup,
+        lazy_subcommands={
+            "notify": "dbt_platform_helper.commands.notify:notify",
+            "does-not-exist": "dbt_platform_helper.commands.does_not_exist:does_not_exist",
+        },
+    )
+    def test_collection():
+        pass
+
+    result = CliRunner().invoke(test_collection, ["notify", "--help"])
+
+    assert result.exit_code == 0
+    assert "test-collection notify (environment-progress|post-message|add-comment)" in result.output
+    assert list(test_collection.commands.keys()) == ["notify"]
+
+
+def test_lazy_click_docopt_group_usage_includes_unloaded_commands():
+    @click.group(
+        cls=LazyClickDocOptGroup,
+        lazy_subcommands={
+            "command-one": "dbt_platform_helper.commands.notify:notify",
+            "command-two": "dbt_platform_helper.commands.generate:generate",
+        },
+    )
+    def test_collection():
+        pass
+
+    result = CliRunner().invoke(test_collection, ["--help"])
+
+    assert "test-collection (command-one|command-two)" in result.output
+
+
+def test_lazy_click_docopt_group_rejects_non_command():
+    @click.group(
+        cls=LazyClickDocOptGroup,
+        lazy_subcommands={"not-a-command": "dbt_platform_helper.utils.click:format_click_usage"},
+    )
+    def test_collection():
+        pass
+
+    result = CliRunner().invoke(test_collection, ["not-a-command"])
+
+    assert result.exit_code != 0
+    assert "non-command object" in str(result.exception)
@@ -0,0 +1,231 @@
+import io
+import multiprocessing
+import os
+import socket
+import time
+from unittest.mock import patch
+
+import click
+import pytest
+
+from dbt_platform_helper.utils import aws
+from dbt_platform_helper.utils.click import DaemonClientGroup
+from dbt_platform_helper.utils.daemon import DaemonServer
+from dbt_platform_helper.utils.daemon import forward_to_daemon
+from dbt_platform_helper.utils.daemon import get_daemon_socket_path
+from dbt_platform_helper.utils.daemon import get_daemon_status
+from dbt_platform_helper.utils.daemon import stop_daemon
+
+
+@click.group()
+def fake_platform_helper():
+    pass
+
+
+@fake_platform_helper.command()
+@click.argument("name")
+def greet(name):
+    click.echo(f"Hello {name} from {click.get_current_context().command_path}")
+    click.echo("Something went wrong", err=True)
+
+
+@fake_platform_helper.command()
+def fail():
+    raise click.ClickException("Boom")
+
+
+@fake_platform_helper.command()
+def show_env():
+    click.echo(f"{os.environ.get('MY_VAR')} {os.getcwd()}")
+
+
+@fake_platform_helper.command()
+def delete():
+    passphrase = click.prompt("Passphrase", hide_input=True)
+    if click.confirm("Are you sure?"):
+        click.echo(f"Deleted with {passphrase}")
+
+
+def _serve(socket_path):
+    server = DaemonServer(socket_path, idle_timeout=60)
+    server.root_command = fake_platform_helper
+    server.serve_until_idle()
+
+
+@pytest.fixture
+def daemon_socket(tmp_path, monkeypatch):
+    """Runs the daemon in a separate process, as it redirects stdout and stderr
+    while running commands."""
+    monkeypatch.delenv("PLATFORM_HELPER_NO_DAEMON", raising=False)
+    socket_path = tmp_path / "daemon.sock"
+    process = multiprocessing.get_context("spawn").Process(target=_serve, args=(socket_path,))
+    process.start()
+
+    deadline = time.monotonic() + 10
+    while not get_daemon_status(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    yield socket_path
+
+    stop_daemon(socket_path)
+    process.join(timeout=5)
+    if process.is_alive():
+        process.kill()
+
+
+def test_get_daemon_socket_path_can_be_overridden(monkeypatch):
+    monkeypatch.setenv("PLATFORM_HELPER_DAEMON_SOCKET", "/tmp/my-daemon.sock")
+
+    assert str(get_daemon_socket_path()) == "/tmp/my-daemon.sock"
+
+
+def test_forward_to_daemon_runs_in_process_when_no_daemon_is_running(tmp_path, monkeypatch):
+    monkeypatch.delenv("PLATFORM_HELPER_NO_DAEMON", raising=False)
+
+    assert forward_to_daemon(["greet", "world"], tmp_path / "daemon.sock") is None
+
+
+def test_forward_to_daemon_runs_in_process_when_the_socket_is_stale(tmp_path, monkeypatch):
+    monkeypatch.delenv("PLATFORM_HELPER_NO_DAEMON", raising=False)
+    socket_path = tmp_path / "daemon.sock"
+    socket_path.touch()
+
+    assert forward_to_daemon(["greet", "world"], socket_path) is None
+
+
+def test_forward_to_daemon_is_disabled_by_environment_variable(daemon_socket, monkeypatch):
+    monkeypatch.setenv("PLATFORM_HELPER_NO_DAEMON", "true")
+
+    assert forward_to_daemon(["greet", "world"], daemon_socket) is None
+    assert get_daemon_status(daemon_socket)["commands_run"] == 0
+
+
+@pytest.mark.parametrize("command", ["conduit", "daemon", "database", "service"])
+def test_forward_to_daemon_runs_local_only_commands_in_process(daemon_socket, command):
+    assert forward_to_daemon([command, "--help"], daemon_socket) is None
+    assert get_daemon_status(daemon_socket)["commands_run"] == 0
+
+
+def test_forward_to_daemon_runs_in_process_when_the_daemon_runs_another_version(daemon_socket):
+    with patch(
+        "dbt_platform_helper.utils.daemon.get_installed_version", return_value="0.0.0-upgraded"
+    ):
+        assert forward_to_daemon(["greet", "world"], daemon_socket) is None
+
+    # The outdated daemon stops so that a new one can be started
+    deadline = time.monotonic() + 10
+    while get_daemon_status(daemon_socket) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert get_daemon_status(daemon_socket) is None
+
+
+def test_forward_to_daemon_relays_output_and_exit_code(daemon_socket, capsys):
+    exit_code = forward_to_daemon(["greet", "world"], daemon_socket)
+
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert captured.out == "Hello world from platform-helper greet\n"
+    assert captured.err == "Something went wrong\n"
+    assert get_daemon_status(daemon_socket)["commands_run"] == 1
+
+
+def test_forward_to_daemon_relays_failures(daemon_socket, capsys):
+    exit_code = forward_to_daemon(["fail"], daemon_socket)
+
+    assert exit_code == 1
+    assert "Error: Boom" in capsys.readouterr().err
+
+
+def test_daemon_runs_commands_with_the_client_environment(daemon_socket, monkeypatch, capsys):
+    monkeypatch.setenv("MY_VAR", "from-client")
+    monkeypatch.chdir(daemon_socket.parent)
+
+    forward_to_daemon(["show-env"], daemon_socket)
+
+    assert capsys.readouterr().out == f"from-client {daemon_socket.parent}\n"
+
+
+@patch("getpass.getpass", return_value="secret")
+def test_daemon_relays_prompts_to_the_client(getpass, daemon_socket, monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("y\n"))
+
+    exit_code = forward_to_daemon(["delete"], daemon_socket)
+
+    assert exit_code == 0
+    getpass.assert_called_once_with("Passphrase: ")
+    assert capsys.readouterr().out == "Are you sure? [y/N]: Deleted with secret\n"
+
+
+def test_daemon_aborts_a_prompt_when_the_client_has_no_input(daemon_socket, monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO(""))
+
+    with patch("getpass.getpass", return_value="secret"):
+        exit_code = forward_to_daemon(["delete"], daemon_socket)
+
+    assert exit_code == 1
+    assert "Aborted!" in capsys.readouterr().err
+
+
+def test_daemon_forgets_aws_sessions_when_the_client_credentials_change(tmp_path, monkeypatch):
+    monkeypatch.setattr("dbt_platform_helper.utils.application.APPLICATION_CACHE", {})
+    server = DaemonServer(tmp_path / "daemon.sock")
+    server.root_command = fake_platform_helper
+    connection, client = socket.socketpair()
+
+    def run_with_credentials(access_key_id):
+        environ = {"AWS_PROFILE": "foo", "AWS_ACCESS_KEY_ID": access_key_id}
+        request = {"args": ["show-env"], "cwd": str(tmp_path), "env": environ}
+        assert server.run_command(request, connection, None) == 0
+
+    try:
+        run_with_credentials("first")
+        aws.AWS_SESSION_CACHE["foo"] = "first-session"
+        aws.AWS_CLIENT_CACHE[("foo", "eu-west-2", "ssm")] = "first-client"
+
+        run_with_credentials("first")
+        assert aws.AWS_SESSION_CACHE["foo"] == "first-session"
+
+        run_with_credentials("second")
+        assert "foo" not in aws.AWS_SESSION_CACHE
+        assert not aws.AWS_CLIENT_CACHE
+    finally:
+        aws.AWS_SESSION_CACHE.pop("foo", None)
+        connection.close()
+        client.close()
+        server.server_close()
+
+
+def test_daemon_status_and_stop(daemon_socket):
+    status = get_daemon_status(daemon_socket)
+
+    assert status["pid"] != os.getpid()
+    assert status["commands_run"] == 0
+    assert stop_daemon(daemon_socket) is True
+
+
+def test_daemon_status_when_not_running(tmp_path):
+    assert get_daemon_status(tmp_path / "daemon.sock") is None
+    assert stop_daemon(tmp_path / "daemon.sock") is False
+
+
+@patch("dbt_platform_helper.utils.click.forward_to_daemon", return_value=3)
+def test_daemon_client_group_exits_with_the_daemon_exit_code(forward_to_daemon):
+    group = DaemonClientGroup(name="platform-helper")
+
+    with pytest.raises(SystemExit) as exit:
+        group.main(args=["notify", "--help"])
+
+    assert exit.value.code == 3
+    forward_to_daemon.assert_called_once_with(["notify", "--help"])
+
+
+@patch("dbt_platform_helper.utils.click.forward_to_daemon", return_value=None)
+def test_daemon_client_group_runs_in_process_without_a_daemon(forward_to_daemon):
+    group = DaemonClientGroup(name="platform-helper")
+    group.add_command(greet)
+
+    with pytest.raises(SystemExit) as exit:
+        group.main(args=["greet", "world"])
+
+    assert exit.value.code == 0
+    forward_to_daemon.assert_called_once_with(["greet", "world"])
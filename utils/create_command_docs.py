@@ -64,6 +64,10 @@ def get_cmd_metadata(
 
     command_name = f"{command_name + ' ' if command_name else ''}{str(cmd.name)}"
 
+    # Resolve lazily registered subcommands in the order they were declared
+    for lazy_subcommand in getattr(cmd, "lazy_subcommands", {}):
+        cmd.get_command(context, lazy_subcommand)
+
     subcommands = cmd.to_info_dict(context).get("commands", {})
     subcommands_names = getattr(cmd, "commands", {})
 